@@ -1,10 +1,103 @@
 import xml.etree.ElementTree as ElementTree
 import re
+import sys
+import bisect
+import functools
+try:
+    import lxml.etree as lxmlTree
+except ImportError:
+    lxmlTree = None
 
 from autosar.util.errorHandler import handleValueError
 
 pVersion = re.compile(r"(\d+)\.(\d+)\.(\d+)")
 
+_xmlBackend = 'etree' if lxmlTree is None else 'lxml'
+_lxmlHugeTree = False
+
+def getXMLBackend():
+    """
+    Returns name of the XML backend used when reading ARXML files ('lxml' or 'etree')
+    """
+    return _xmlBackend
+
+def setXMLBackend(name, hugeTree=False):
+    """
+    Selects the XML backend used when reading ARXML files.
+    'lxml' requires the lxml package to be installed (pip install autosar[lxml]), 'etree' uses xml.etree.ElementTree from the standard library.
+    The lxml backend is selected by default when it is available. Both backends raise xml.etree.ElementTree.ParseError on malformed XML.
+    hugeTree (lxml only) disables the depth and size limits of libxml2, only enable it for very large files from a trusted source.
+    """
+    global _xmlBackend, _lxmlHugeTree
+    if name == 'lxml':
+        if lxmlTree is None:
+            raise RuntimeError('lxml is not installed')
+    elif name != 'etree':
+        raise ValueError('Unknown XML backend: %s'%str(name))
+    elif hugeTree:
+        raise ValueError('hugeTree requires the lxml backend')
+    _xmlBackend = name
+    _lxmlHugeTree = bool(hugeTree)
+
+class XMLPath:
+    """
+    A find/findall path expression that is compiled once.
+    Elements created by the lxml backend are searched using a precompiled XPath object,
+    other elements fall back to the find/findall methods of the element itself.
+    Only use paths where ElementPath and XPath syntax agree (e.g. './ELEMENTS/*' or 'SHORT-NAME').
+    """
+    def __init__(self, path):
+        self.path = path
+        self._xpath = None if lxmlTree is None else lxmlTree.XPath(path)
+
+    def findall(self, xmlElem):
+        if (self._xpath is not None) and isinstance(xmlElem, lxmlTree._Element):
+            return self._xpath(xmlElem)
+        return xmlElem.findall(self.path)
+
+    def find(self, xmlElem):
+        if (self._xpath is not None) and isinstance(xmlElem, lxmlTree._Element):
+            result = self._xpath(xmlElem)
+            return result[0] if len(result) > 0 else None
+        return xmlElem.find(self.path)
+
+def _createLxmlParser():
+    return lxmlTree.XMLParser(remove_comments=True, remove_pis=True, huge_tree=_lxmlHugeTree)
+
+def _parseError(error):
+    """
+    Converts an lxml.etree.XMLSyntaxError into the xml.etree.ElementTree.ParseError raised by the etree backend
+    """
+    result = ElementTree.ParseError(str(error))
+    result.code = error.code
+    result.position = error.position
+    return result
+
+def parseXMLSource(source):
+    """
+    Parses XML from a filename or binary file object using the selected XML backend and returns the root element
+    """
+    if _xmlBackend == 'lxml':
+        try:
+            return lxmlTree.parse(source, _createLxmlParser()).getroot()
+        except lxmlTree.XMLSyntaxError as e:
+            raise _parseError(e) from e
+    return ElementTree.parse(source).getroot()
+
+def _iterParseLxml(source, events):
+    try:
+        yield from lxmlTree.iterparse(source, events=events, remove_comments=True, remove_pis=True, huge_tree=_lxmlHugeTree)
+    except lxmlTree.XMLSyntaxError as e:
+        raise _parseError(e) from e
+
+def iterParseXMLSource(source, events):
+    """
+    Same as xml.etree.ElementTree.iterparse but uses the selected XML backend
+    """
+    if _xmlBackend == 'lxml':
+        return _iterParseLxml(source, events)
+    return ElementTree.iterparse(source, events=events)
+
 class AdminData:
     def __init__(self):
         self.specialDataGroups = []
@@ -53,10 +146,37 @@ class SpecialDataGroup(object):
     def __ne__(self, other): return not (self == other)
 
 class SpecialData:
+    __slots__ = ('TEXT', 'GID')
+
     def __init__(self, TEXT, GID):
         self.TEXT = TEXT
         self.GID = GID
 
+@functools.lru_cache(maxsize=None)
+def _slotNames(cls):
+    names = []
+    for base in reversed(cls.__mro__):
+        slots = base.__dict__.get('__slots__', ())
+        for name in ((slots,) if isinstance(slots, str) else slots):
+            if name not in ('__dict__', '__weakref__') and name not in names:
+                names.append(name)
+    return tuple(names)
+
+def instanceAttributes(obj):
+    """
+    Returns a dictionary with the attributes set on obj, including attributes stored in __slots__.
+    Use this instead of vars(obj) or obj.__dict__ which do not contain slot attributes.
+    """
+    result = {}
+    for name in _slotNames(type(obj)):
+        try:
+            result[name] = getattr(obj, name)
+        except AttributeError:
+            pass
+    if hasattr(obj, '__dict__'):
+        result.update(obj.__dict__)
+    return result
+
 def removeNamespace(doc, namespace):
     """Removes XML namespace in place."""
     ns = u'{%s}' % namespace
@@ -66,13 +186,79 @@ def removeNamespace(doc, namespace):
             elem.tag = elem.tag[nsl:]
 
 def parseXMLFile(filename,namespace=None):
-    arxml_tree = ElementTree.ElementTree()
-    arxml_tree.parse(filename)
-    arxml_root = arxml_tree.getroot()
+    arxml_root = parseXMLSource(filename)
     if namespace is not None:
         removeNamespace(arxml_root,namespace)
     return arxml_root
 
+class DefaultNamespaceReader:
+    """
+    Binary file wrapper that removes the default namespace declaration (xmlns="...") from the root start tag.
+    An XML parser reading through this object creates elements with unqualified tag names, which makes a
+    separate removeNamespace pass over the tree unnecessary.
+    The removed namespace is stored in the namespace attribute (None if the root tag had no default namespace).
+    """
+    _pDefaultNamespace = re.compile(rb'\sxmlns\s*=\s*(["\'])(.*?)\1')
+
+    def __init__(self, fp):
+        self.fp = fp
+        self.namespace = None
+        self._inHead = True
+
+    def read(self, size=-1):
+        data = self.fp.read(size)
+        if self._inHead:
+            data = self._processHead(data, size)
+        return data
+
+    def _processHead(self, data, size):
+        span = self._findRootStartTag(data)
+        while span is None:
+            chunk = self.fp.read(size)
+            if len(chunk) == 0:
+                self._inHead = False
+                return data
+            data += chunk
+            span = self._findRootStartTag(data)
+        self._inHead = False
+        match = self._pDefaultNamespace.search(data, span[0], span[1])
+        if match is None:
+            return data
+        self.namespace = match.group(2).decode('utf-8')
+        return data[:match.start()] + data[match.end():]
+
+    @staticmethod
+    def _findRootStartTag(data):
+        """
+        Returns (start, end) position of the first start tag in data or None if data does not yet contain all of it
+        """
+        pos = data.find(b'<')
+        while pos >= 0:
+            nextChar = data[pos+1:pos+2]
+            if len(nextChar) == 0:
+                return None
+            if nextChar not in (b'?', b'!'):
+                end = data.find(b'>', pos)
+                return None if end < 0 else (pos, end)
+            pos = data.find(b'<', pos+1)
+        return None
+
+def parseXMLFileStripNamespace(filename):
+    """
+    Parses an XML file and returns the tuple (xmlroot, namespace).
+    The default namespace is stripped from all tag names while the document is parsed.
+    Falls back to removeNamespace when the namespace could not be removed from the input stream.
+    """
+    with open(filename, 'rb') as fp:
+        reader = DefaultNamespaceReader(fp)
+        arxml_root = parseXMLSource(reader)
+    namespace = reader.namespace
+    if namespace is None:
+        namespace = getXMLNamespace(arxml_root)
+        if namespace is not None:
+            removeNamespace(arxml_root, namespace)
+    return (arxml_root, namespace)
+
 def getXMLNamespace(element):
     m = re.match(r'\{(.*)\}', element.tag)
     return m.group(1) if m else None
@@ -94,20 +280,27 @@ def parseAdminDataNode(xmlRoot):
     xmlSDGS = xmlRoot.find('./SDGS')
     if xmlSDGS is not None:
         for xmlElem in xmlSDGS.findall('./SDG'):
-            GID=xmlElem.attrib['GID']
+            GID=sys.intern(xmlElem.attrib['GID'])
             SD=None
             SD_GID=None
             xmlSD = xmlElem.find('SD')
             if xmlSD is not None:
-                SD=xmlSD.text
+                SD=parseTextNode(xmlSD)
                 try:
-                    SD_GID=xmlSD.attrib['GID']
+                    SD_GID=sys.intern(xmlSD.attrib['GID'])
                 except KeyError: pass
             adminData.specialDataGroups.append(SpecialDataGroup(GID,SD,SD_GID))
     return adminData
 
 def parseTextNode(xmlElem):
-    return None if xmlElem is None else xmlElem.text
+    """
+    Returns the text of xmlElem or None. The text is interned (see sys.intern), repeated values such as
+    references and categories then share a single string object instead of one per XML node.
+    """
+    if xmlElem is None:
+        return None
+    text = xmlElem.text
+    return None if text is None else sys.intern(text)
 def parseIntNode(xmlElem):
     return None if xmlElem is None else int(xmlElem.text)
 def parseFloatNode(xmlElem):
@@ -131,6 +324,137 @@ def indexByName(lst,name):
         if item.name == name: return i
     raise ValueError('%s not in list'%name)
 
+class NameIndex:
+    """
+    Name-keyed index over one or more lists of named elements, given as attribute names of owner.
+    get returns the first element with a given name, searching the lists in the order of attributes.
+
+    Elements appended to the lists should also be passed to add. The index is built on first lookup and rebuilt
+    when the total length of the lists or the last element of a list no longer matches the indexed elements, which detects
+    elements appended or removed directly through the lists. The position of each indexed element is checked before
+    it is returned, an element that was replaced in its list makes get fall back to rebuilding the index (a linear scan).
+    Call invalidate after replacing list items directly, the name of a replacing element is only found once the index is rebuilt.
+    Renamed elements are updated by Element.name when the index is listed in the _nameIndexes attribute of their parent,
+    otherwise call rename (or invalidate) after renaming an indexed element.
+    """
+    def __init__(self, owner, attributes):
+        self.owner = owner
+        self.attributes = tuple(attributes)
+        self.invalidate()
+
+    def invalidate(self):
+        self.map = {} #name -> (element, index in attributes, position in list)
+        self.names = [] #sorted names of all indexed elements, see startingWith
+        self.size = -1 #number of indexed elements, -1 when the index must be rebuilt
+        self.tails = () #last element of each list
+
+    def add(self, elem):
+        """
+        Indexes elem, which has just been appended to one of the lists
+        """
+        if self.size < 0:
+            return
+        lists = self._lists()
+        tails = self._tails(lists)
+        changed = [i for i in range(len(lists)) if tails[i] is not self.tails[i]]
+        if (len(changed) != 1) or (tails[changed[0]] is not elem) or (self.size + 1 != sum(len(x) for x in lists)):
+            self.invalidate() #elem is not the only element appended since the last update
+            return
+        i = changed[0]
+        self.size += 1
+        self.tails = tails
+        if elem.name is not None:
+            self.map.setdefault(elem.name, (elem, i, len(lists[i])-1))
+            bisect.insort(self.names, elem.name)
+
+    def rename(self, elem, oldName):
+        """
+        Updates the index after elem has been renamed from oldName
+        """
+        if (self.size < 0) or (oldName not in self.map):
+            return #index is not built or elem is not indexed
+        i = bisect.bisect_left(self.names, oldName)
+        isUnique = (i+1 == len(self.names)) or (self.names[i+1] != oldName)
+        entry = self.map[oldName]
+        if (entry[0] is not elem) or (not isUnique) or (elem.name in self.map):
+            self.invalidate() #duplicated names, the list order decides which element is found
+            return
+        del self.map[oldName]
+        del self.names[i]
+        if elem.name is not None:
+            self.map[elem.name] = entry
+            bisect.insort(self.names, elem.name)
+
+    def get(self, name):
+        """
+        Returns the first element named name or None
+        """
+        if not self._isValid():
+            self._rebuild()
+        entry = self.map.get(name)
+        if entry is None:
+            return None
+        (elem, i, position) = entry
+        elemList = getattr(self.owner, self.attributes[i])
+        if (position < len(elemList)) and (elemList[position] is elem) and (elem.name == name):
+            return elem
+        self._rebuild() #elem was replaced or moved in its list
+        entry = self.map.get(name)
+        return None if entry is None else entry[0]
+
+    def startingWith(self, prefix):
+        """
+        Returns a sorted list of the element names starting with prefix
+        """
+        if not self._isValid():
+            self._rebuild()
+        i = bisect.bisect_left(self.names, prefix)
+        result = []
+        while (i < len(self.names)) and self.names[i].startswith(prefix):
+            result.append(self.names[i])
+            i += 1
+        return result
+
+    def _lists(self):
+        return [getattr(self.owner, x) for x in self.attributes]
+
+    @staticmethod
+    def _tails(lists):
+        return tuple((x[-1] if len(x) > 0 else None) for x in lists)
+
+    def _isValid(self):
+        if self.size < 0:
+            return False
+        size = 0
+        for (elemList, tail) in zip(self._lists(), self.tails):
+            size += len(elemList)
+            if tail is not (elemList[-1] if len(elemList) > 0 else None):
+                return False
+        return size == self.size
+
+    def _rebuild(self):
+        self.invalidate()
+        size = 0
+        lists = self._lists()
+        for (i, elemList) in enumerate(lists):
+            for (position, elem) in enumerate(elemList):
+                if elem.name is not None:
+                    if elem.name not in self.map:
+                        self.map[elem.name] = (elem, i, position)
+                    self.names.append(elem.name)
+            size += len(elemList)
+        self.names.sort()
+        self.size = size
+        self.tails = self._tails(lists)
+
+    def __getstate__(self):
+        return {'owner': self.owner, 'attributes': self.attributes}
+
+    def __setstate__(self, state):
+        self.owner = state['owner']
+        self.attributes = state['attributes']
+        self.invalidate()
+
 def createAdminData(data):
     adminData = AdminData()
     SDG_GID = data.get('SDG_GID',None)
@@ -210,6 +534,120 @@ def prepareFilter(fstr):
     if fstr[-1] == '/': fstr+='*'
     return fstr.split('/')
 
+class _FilterNode:
+    """
+    Node of the trie built by compileFilters, final is True when a filter ends at the node
+    """
+    __slots__ = ('children', 'final')
+
+    def __init__(self):
+        self.children = {}
+        self.final = False
+
+class RefFilter:
+    """
+    Filters prepared by prepareFilter compiled into a trie of reference names ('*' matching any name), see compileFilters.
+    A RefFilter is the state of matching a reference, it holds the trie nodes reached by the names of the reference.
+    A reference matches (same result as applyFilter) when its names match the start of a filter or a filter matches the
+    start of the reference. The state of a child reference is computed from the state of its parent by child,
+    matches tests a name without creating a new state.
+    """
+    __slots__ = ('nodes',)
+
+    def __init__(self, nodes):
+        self.nodes = nodes #None matches all references
+
+    def matches(self, name):
+        """
+        Returns True when the child reference named name matches
+        """
+        if self.nodes is None:
+            return True
+        for node in self.nodes:
+            if (name in node.children) or ('*' in node.children):
+                return True
+        return False
+
+    def child(self, name):
+        """
+        Returns the RefFilter of the child reference named name or None when it does not match
+        """
+        if self.nodes is None:
+            return self
+        nodes = []
+        for node in self.nodes:
+            for key in (name, '*'):
+                child = node.children.get(key)
+                if child is not None:
+                    if child.final:
+                        return _matchAll
+                    nodes.append(child)
+        return RefFilter(nodes) if len(nodes) > 0 else None
+
+    def descend(self, ref):
+        """
+        Returns the RefFilter of the absolute reference ref or None when it does not match
+        """
+        state = self
+        for name in ref.strip('/').split('/'):
+            state = state.child(name)
+            if state is None:
+                break
+        return state
+
+_matchAll = RefFilter(None)
+
+def compileFilters(filters):
+    """
+    Compiles a list of filters prepared by prepareFilter into a RefFilter (the state of the root),
+    when filters is None the RefFilter matches all references
+    """
+    if filters is None:
+        return _matchAll
+    root = _FilterNode()
+    for names in filters:
+        node = root
+        for name in names:
+            node = node.children.setdefault(name, _FilterNode())
+        node.final = True
+    return _matchAll if root.final else RefFilter([root])
+
+class RefPattern:
+    """
+    Compiled reference pattern used by Workspace.iterfind and Package.iterfind (and findall), see compileRefPattern.
+    Each name of the pattern is one of:
+    - a plain name, looked up in the name index (map) of the package
+    - '*', matching all names
+    - a name containing '*', a regular expression where '*' stands for '.*' matched against the start of names
+    - '**', matching zero or more levels of packages. As last name it matches all packages and elements below.
+    """
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.names = []
+        for name in pattern.split('/'):
+            if (len(name) == 0) or (name == '**' and len(self.names) > 0 and self.names[-1] == '**'):
+                continue
+            self.names.append(name)
+        #match function for each name containing '*', None for other names
+        self.matchers = [self._compileName(name) if (('*' in name) and (name not in ('*', '**'))) else None for name in self.names]
+        #when '**' is used more than once the same item can be matched through different paths
+        self.hasDuplicates = self.names.count('**') > 1
+
+    @staticmethod
+    def _compileName(name):
+        prefix = name[:-1]
+        if name.endswith('*') and (re.escape(prefix) == prefix):
+            return lambda x: x.startswith(prefix)
+        regex = re.compile(name.replace('*', '.*'))
+        return lambda x: regex.match(x) is not None
+
+@functools.lru_cache(maxsize=256)
+def compileRefPattern(pattern):
+    """
+    Returns the RefPattern of pattern (compiled patterns are cached)
+    """
+    return RefPattern(pattern)
+
 def parseVersionString(versionString):
     """
     takes a string of the format <major>.<minor>.<patch> (e.g. "3.2.2") and returns a tuple with three integers (major, minor, patch)
@@ -220,28 +658,39 @@ def parseVersionString(versionString):
     else:
         return (int(result.group(1)),int(result.group(2)),int(result.group(3)))
 
-def findUniqueNameInList(elementList, baseName):
+def findUniqueNameInList(elementList, baseName, nameIndex=None):
     """
     Attempts to find a unique name in the list of objects based on baseName.
     This function can modify names in gived list.
     Returns a new name which is guaranteed to be unique
+    nameIndex is an optional NameIndex over elementList (only), it is used to avoid scanning the list.
     """
 
     foundElem = None
     highestIndex = 0
     hasIndex = False
     p0 = re.compile(baseName+r'_(\d+)')
-    for elem in elementList:
-        result = p0.match(elem.name)
+    if (nameIndex is not None) and (re.escape(baseName) == baseName):
+        names = nameIndex.startingWith(baseName+'_')
+        foundElem = nameIndex.get(baseName)
+    else:
+        names = []
+        for elem in elementList:
+            if elem.name == baseName:
+                foundElem = elem
+            else:
+                names.append(elem.name)
+    for name in names:
+        result = p0.match(name)
         if result is not None:
             hasIndex = True
             index = int(result.group(1))
             if index > highestIndex:
                 highestIndex = index
-        elif elem.name == baseName:
-            foundElem = elem
     if foundElem is not None:
         foundElem.name = '_'.join([foundElem.name, '0'])
+        if nameIndex is not None:
+            nameIndex.rename(foundElem, baseName)
     if hasIndex or foundElem is not None:
         return '_'.join([baseName, str(highestIndex+1)])
     else:
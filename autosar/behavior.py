@@ -376,19 +376,14 @@ class RunnableEntity(Element):
         else:
             return self.parent.rootWS()
 
-    @property
-    def ref(self):
-        if self.parent is not None:
-            return self.parent.ref+'/%s'%self.name
-        else:
-            return None
-
 class DataElementInstanceRef(object):
     """
     <DATA-ELEMENT-IREF>
     Note: This object seems to be identical to an <DATA-IREF>
     Note 2: Observe that there are multiple <DATA-ELEMENT-IREF> definitions in the AUTOSAR XSD (used for different purposes)
     """
+    __slots__ = ('portRef', 'dataElemRef')
+
     def __init__(self,portRef,dataElemRef):
         self.portRef = portRef
         self.dataElemRef = dataElemRef
@@ -1187,6 +1182,9 @@ class InternalBehaviorCommon(Element):
     """
     Base class for InternalBehavior (AUTOSAR 3) and SwcInternalBehavior (AUTOSAR 4)
     """
+    #lists searched by find, in order of priority
+    _findLists = ('runnables', 'perInstanceMemories', 'exclusiveAreas', 'events', 'implicitVariables', 'explicitVariables')
+
     def __init__(self, name, componentRef, multipleInstance=False, parent=None, adminData=None):
         super().__init__(name, parent, adminData)
         if not isinstance(componentRef,str): #this is a helper, in case the user called the function with obj instead of obj.ref
@@ -1209,6 +1207,9 @@ class InternalBehaviorCommon(Element):
         # Each data type set is an object containing data type references and an optional literal prefix
         self.includedDataTypeSets = []
         self.swc = None
+        self._elementIndex = autosar.base.NameIndex(self, self._findLists)
+        self._eventIndex = autosar.base.NameIndex(self, ['events'])
+        self._nameIndexes = (self._elementIndex, self._eventIndex) #updated when a child element is renamed
 
 
     def createPortAPIOptionDefaults(self):
@@ -1233,15 +1234,10 @@ class InternalBehaviorCommon(Element):
         if ref is None: return None
         if ref[0]=='/': ref=ref[1:] #removes initial '/' if it exists
         ref=ref.partition('/')
-        name=ref[0]
-        foundElem = None
-        for elem in self.runnables + self.perInstanceMemories + self.exclusiveAreas + self.events + self.implicitVariables + self.explicitVariables:
-            if elem.name == name:
-                foundElem = elem
-                break
+        foundElem = self._elementIndex.get(ref[0])
         if foundElem is not None:
             if len(ref[2])>0:
-                return foundElem.find(ref[2])
+                return foundElem.find(ref[2]) if hasattr(foundElem, 'find') else None
             else:
                 return foundElem
         return None
@@ -1263,6 +1259,7 @@ class InternalBehaviorCommon(Element):
         runnable = RunnableEntity(name, concurrent, symbol, self, adminData)
         runnable.minStartInterval = minStartInterval
         self.runnables.append(runnable)
+        self._elementIndex.add(runnable)
         self._initSWC()
         ws = self.rootWS()
         if portAccess is not None:
@@ -1462,7 +1459,7 @@ class InternalBehaviorCommon(Element):
         (modeDeclarationRef,modeDeclarationGroupRef,portRef) = self._calcModeInstanceComponentsForRequirePort(portName,modeValue)
         event.modeInstRef = ModeInstanceRef(modeDeclarationRef, modeDeclarationGroupRef, portRef)
         assert(isinstance(event.modeInstRef, autosar.behavior.ModeInstanceRef))
-        self.events.append(event)
+        self._appendEvent(event)
         return event
 
     def createTimerEvent(self, runnableName, period, modeDependency=None, name=None ):
@@ -1483,7 +1480,7 @@ class InternalBehaviorCommon(Element):
 
         if modeDependency is not None:
             self._processModeDependency(event, modeDependency, ws.version)
-        self.events.append(event)
+        self._appendEvent(event)
         return event
 
     def createTimingEvent(self, runnableName, period, modeDependency=None, name=None):
@@ -1533,7 +1530,7 @@ class InternalBehaviorCommon(Element):
         if modeDependency is not None:
             self._processModeDependency(event, modeDependency, ws.version)
 
-        self.events.append(event)
+        self._appendEvent(event)
         return event
 
     def createDataReceivedEvent(self, runnableName, dataElementRef, modeDependency=None, name=None ):
@@ -1607,11 +1604,20 @@ class InternalBehaviorCommon(Element):
         if modeDependency is not None:
             self._processModeDependency(event, modeDependency, ws.version)
 
-        self.events.append(event)
+        self._appendEvent(event)
         return event
 
     def _findEventName(self, baseName):
-        return autosar.base.findUniqueNameInList(self.events, baseName)
+        event = self._eventIndex.get(baseName)
+        name = autosar.base.findUniqueNameInList(self.events, baseName, self._eventIndex)
+        if event is not None:
+            self._elementIndex.rename(event, baseName) #event was renamed to baseName_0
+        return name
+
+    def _appendEvent(self, event):
+        self.events.append(event)
+        self._elementIndex.add(event)
+        self._eventIndex.add(event)
 
 
 
@@ -1642,11 +1648,14 @@ class InternalBehaviorCommon(Element):
         ws = self.rootWS()
         exclusiveArea = ExclusiveArea(str(name), self)
         self.exclusiveAreas.append(exclusiveArea)
+        self._elementIndex.add(exclusiveArea)
         return exclusiveArea
 
 
 class InternalBehavior(InternalBehaviorCommon):
     """ InternalBehavior class (AUTOSAR 3)"""
+    _findLists = InternalBehaviorCommon._findLists + ('sharedCalParams',)
+
     def __init__(self,name, componentRef, multipleInstance=False,parent=None):
         super().__init__(name, componentRef,multipleInstance, parent)
 
@@ -1660,22 +1669,10 @@ class InternalBehavior(InternalBehaviorCommon):
         if isinstance(elem,RunnableEntity):
             self.runnables.append(elem)
             elem.parent=self
+            self._elementIndex.add(elem)
         else:
             handleNotImplementedError(str(type(elem)))
 
-    def find(self, ref):
-        if ref is None: return None
-        result = super().find(ref)
-        if result is None:
-            if ref[0]=='/': ref=ref[1:] #removes initial '/' if it exists
-            ref=ref.partition('/')
-            name=ref[0]
-            for elem in self.sharedCalParams:
-                if elem.name == name: return elem
-        else:
-            return result
-        return None
-
 
 
     def __getitem__(self,key):
@@ -1695,6 +1692,7 @@ class InternalBehavior(InternalBehaviorCommon):
             raise ValueError('invalid reference: '+typeRef)
         perInstanceMemory = PerInstanceMemory(name, dataType.ref, self)
         self.perInstanceMemories.append(perInstanceMemory)
+        self._elementIndex.add(perInstanceMemory)
         return perInstanceMemory
 
     def createSharedCalParam(self, name, typeRef, SwAddrMethodRef, adminData=None):
@@ -1706,6 +1704,7 @@ class InternalBehavior(InternalBehaviorCommon):
         elem = CalPrmElemPrototype(name, dataType.ref, self, adminData)
         elem.swDataDefsProps.append(SwAddrMethodRef)
         self.sharedCalParams.append(elem)
+        self._elementIndex.add(elem)
         return elem
 
     def createNvmBlock(self, name, blockParams):
@@ -1776,6 +1775,9 @@ class SwcInternalBehavior(InternalBehaviorCommon):
     """
     AUTOSAR 4 Internal Behavior
     """
+    _findLists = InternalBehaviorCommon._findLists + ('serviceDependencies', 'sharedParameterDataPrototype', 'perInstanceParameterDataPrototype',
+                                                      'constantMemories', 'variationPointProxies')
+
     def __init__(self,name, componentRef, multipleInstance=False, parent=None):
         super().__init__(name, componentRef, multipleInstance, parent)
         self.serviceDependencies = [] #list of SwcServiceDependency objects
@@ -1790,31 +1792,6 @@ class SwcInternalBehavior(InternalBehaviorCommon):
 
     def tag(self, version): return "SWC-INTERNAL-BEHAVIOR"
 
-    def find(self, ref):
-        if ref is None: return None
-        result = super().find(ref)
-        if result is None:
-            if ref[0]=='/': ref=ref[1:] #removes initial '/' if it exists
-            ref=ref.partition('/')
-            name=ref[0]
-            foundElem = None
-            for elem in itertools.chain(
-                self.serviceDependencies,
-                self.sharedParameterDataPrototype,
-                self.perInstanceParameterDataPrototype,
-                self.constantMemories,
-                self.variationPointProxies):
-                if elem.name == name:
-                    foundElem = elem
-                    break
-            if foundElem is not None:
-                if len(ref[2])>0:
-                    return foundElem.find(ref[2])
-                else:
-                    return foundElem
-        else:
-            return result
-
     def createPerInstanceMemory(self, name, implementationTypeRef, swAddressMethodRef = None, swCalibrationAccess = None):
         """
         AUTOSAR4: Creates a DataElement object and appends to to the internal perInstanceMemories list
@@ -1830,6 +1807,7 @@ class SwcInternalBehavior(InternalBehaviorCommon):
             raise ValueError('invalid reference: '+implementationTypeRef)
         dataElement = AutosarDataPrototype(AutosarDataPrototype.Role.Variable, name, dataType.ref, swAddressMethodRef = swAddressMethodRef, swCalibrationAccess=swCalibrationAccess, parent=self)
         self.perInstanceMemories.append(dataElement)
+        self._elementIndex.add(dataElement)
         return dataElement
 
     def createSharedDataParameter(self, name, implementationTypeRef, swAddressMethodRef = None, swCalibrationAccess = None, initValue = None):
@@ -1843,6 +1821,7 @@ class SwcInternalBehavior(InternalBehaviorCommon):
             raise ValueError('invalid reference: '+implementationTypeRef)
         parameter = autosar.element.AutosarDataPrototype(autosar.element.AutosarDataPrototype.Role.Parameter, name, dataType.ref, swAddressMethodRef = swAddressMethodRef, swCalibrationAccess=swCalibrationAccess, initValue=initValue, parent=self)
         self.sharedParameterDataPrototype.append(parameter)
+        self._elementIndex.add(parameter)
         return parameter
 
     def createPerInstanceDataParameter(self, name, implementationTypeRef, swAddressMethodRef = None, swCalibrationAccess = None, initValue = None):
@@ -1856,6 +1835,7 @@ class SwcInternalBehavior(InternalBehaviorCommon):
             raise ValueError('invalid reference: '+implementationTypeRef)
         parameter = autosar.element.AutosarDataPrototype(autosar.element.AutosarDataPrototype.Role.Parameter, name, dataType.ref, swAddressMethodRef = swAddressMethodRef, swCalibrationAccess=swCalibrationAccess, initValue=initValue, parent=self)
         self.perInstanceParameterDataPrototype.append(parameter)
+        self._elementIndex.add(parameter)
         return parameter
 
     def createConstantMemory(self, name, implementationTypeRef, swAddressMethodRef = None, swCalibrationAccess = None, initValue = None):
@@ -1869,6 +1849,7 @@ class SwcInternalBehavior(InternalBehaviorCommon):
             raise ValueError('invalid reference: '+implementationTypeRef)
         parameter = autosar.element.AutosarDataPrototype(autosar.element.AutosarDataPrototype.Role.Parameter, name, dataType.ref, swAddressMethodRef = swAddressMethodRef, swCalibrationAccess=swCalibrationAccess, initValue=initValue, parent=self)
         self.constantMemories.append(parameter)
+        self._elementIndex.add(parameter)
         return parameter
 
     def createNvmBlock(self, name, portName, perInstanceMemoryName, nvmBlockConfig = None, defaultValueName = None, perInstanceMemoryRole='ramBlock', defaultValueRole = 'defaultValue', blockAdminData = None):
@@ -1909,6 +1890,7 @@ class SwcInternalBehavior(InternalBehaviorCommon):
                 raise ValueError('%s: No data parameter found with name "%s"'%(self.swc.name, defaultValueName))
 
         self.serviceDependencies.append(serviceDependency)
+        self._elementIndex.add(serviceDependency)
         return serviceDependency
 
     def createInitEvent(self, runnableName, modeDependency=None, name=None ):
@@ -1929,7 +1911,7 @@ class SwcInternalBehavior(InternalBehaviorCommon):
 
         if modeDependency is not None:
             self._processModeDependency(event, modeDependency, ws.version)
-        self.events.append(event)
+        self._appendEvent(event)
         return event
 
     def createModeSwitchAckEvent(self, runnableName, modeSwitchSource, modeDependency=None, name=None ):
@@ -1953,7 +1935,7 @@ class SwcInternalBehavior(InternalBehaviorCommon):
             raise ValueError('Element with name {} is not a runnable'.format(runnableName))
 
         baseName = 'MSAT_'+triggerRunnable.name
-        eventName = autosar.base.findUniqueNameInList(self.events, baseName)
+        eventName = self._findEventName(baseName)
         ref = modeSwitchSource.partition('/')
         sourceRunnableName = ref[0]
         sourceModeSwitchPoint = None
@@ -1987,7 +1969,7 @@ class SwcInternalBehavior(InternalBehaviorCommon):
         event = ModeSwitchAckEvent(eventName, triggerRunnable.ref, sourceModeSwitchPoint.ref)
         if modeDependency is not None:
             self._processModeDependency(event, modeDependency, ws.version)
-        self.events.append(event)
+        self._appendEvent(event)
         return event
 
     def createVariationPointProxy(self, name, category, binding_time, condition_access=None, adminData=None):
@@ -1999,6 +1981,7 @@ class SwcInternalBehavior(InternalBehaviorCommon):
             raise ValueError('condition_access must be provided for category "CONDITION"')
         variationPointProxy = VariationPointProxy(name, category, binding_time, condition_access, self, adminData)
         self.variationPointProxies.append(variationPointProxy)
+        self._elementIndex.add(variationPointProxy)
         return variationPointProxy
 
     def appendDataTypeMappingRef(self, dataTypeMappingRef):
@@ -2384,6 +2367,7 @@ class NvBlockRamBlock(AutosarDataPrototype):
     """
     <RAM-BLOCK>
     """
+    __slots__ = ()
     def __init__(self, name, typeRef, isQueued=False, swAddressMethodRef=None, swCalibrationAccess=None, swImplPolicy = None, category = None, parent=None, adminData=None):
         super().__init__(name, typeRef, isQueued, swAddressMethodRef, swCalibrationAccess, swImplPolicy, category, parent, adminData)
 
@@ -2402,6 +2386,7 @@ class NvBlockRomBlock(AutosarDataPrototype):
     """
     Represents <ROM-BLOCK>
     """
+    __slots__ = ()
 
     def __init__(self, name, typeRef, swAddressMethodRef=None, swCalibrationAccess=None, initValue = None, initValueRef = None, parent=None, adminData=None):
         super().__init__(name=name, parent=parent, typeRef=typeRef, swAddressMethodRef=swAddressMethodRef, swCalibrationAccess=swCalibrationAccess, initValue=initValue, initValueRef=initValueRef, adminData=adminData)
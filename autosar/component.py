@@ -17,19 +17,12 @@ class ComponentType(Element):
         self.requirePorts=[]
         self.providePorts=[]
         self.provideRequirePorts=[]
+        self._portIndex = autosar.base.NameIndex(self, ['requirePorts', 'providePorts', 'provideRequirePorts'])
+        self._nameIndexes = (self._portIndex,) #updated when a child element is renamed
 
     def find(self,ref):
         ref=ref.partition('/')
-        for port in self.requirePorts:
-            if port.name == ref[0]:
-                return port
-        for port in self.providePorts:
-            if port.name == ref[0]:
-                return port
-        for port in self.provideRequirePorts:
-            if port.name == ref[0]:
-                return port
-        return None
+        return self._portIndex.get(ref[0])
 
     def append(self, elem):
         if isinstance(elem,autosar.port.RequirePort):
@@ -43,6 +36,7 @@ class ComponentType(Element):
             elem.parent=self
         else:
             raise ValueError("unexpected type:" + str(type(elem)))
+        self._portIndex.add(elem)
 
     def __getitem__(self,key):
         return self.find(key)
@@ -103,6 +97,7 @@ class ComponentType(Element):
             port = autosar.port.ProvidePort(name, portInterface.ref, comspecList, parent=self)
         assert(isinstance(port, autosar.port.Port))
         self.providePorts.append(port)
+        self._portIndex.add(port)
         return port
 
     def createRequirePort(self, name, portInterfaceRef, **kwargs):
@@ -151,6 +146,7 @@ class ComponentType(Element):
             port = autosar.port.RequirePort(name, portInterface.ref, comspecList, parent=self)
         assert(isinstance(port, autosar.port.Port))
         self.requirePorts.append(port)
+        self._portIndex.add(port)
         return port
 
     def createProvideRequirePort(self, name, portInterfaceRef, **kwargs):
@@ -184,6 +180,7 @@ class ComponentType(Element):
         port = autosar.port.ProvideRequirePort(name, portInterface.ref, providedComspecList, requiredComspecList, parent=self)
 
         self.provideRequirePorts.append(port)
+        self._portIndex.add(port)
         return port
 
     def apply(self, template, **kwargs):
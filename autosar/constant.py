@@ -23,6 +23,8 @@ class Value(Element):
 
 class ValueAR4(LabelElement):
     """Same as Value but uses label as main identifier instead of name"""
+    __slots__ = ()
+
     def __init__(self, label, parent=None, adminData = None, category = None):
         super().__init__(label, parent, adminData, category)
 
@@ -139,6 +141,8 @@ class ArrayValue(Value):
 
 #AUTOSAR 4 constant values
 class TextValue(ValueAR4):
+    __slots__ = ('_value',)
+
     def tag(self, version=None): return "TEXT-VALUE-SPECIFICATION"
 
     def __init__(self, label, value=None, category = None, parent = None, adminData = None):
@@ -164,6 +168,7 @@ class TextValue(ValueAR4):
         return data
 
 class NumericalValue(ValueAR4):
+    __slots__ = ('_value',)
 
     def tag(self, version=None): return "NUMERICAL-VALUE-SPECIFICATION"
 
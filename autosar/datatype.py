@@ -1,6 +1,6 @@
 from enum import Enum
 from typing import Optional
-from autosar.element import Element
+from autosar.element import Element, _descSlots
 import autosar.base
 import copy
 import collections
@@ -23,6 +23,8 @@ class RecordTypeElement(Element):
     Implemenetation of <RECORD-ELEMENT> (found inside <RECORD-TYPE>).
 
     """
+    __slots__ = ('typeRef',)
+
     def tag(self, version=None): return 'RECORD-ELEMENT'
 
     def __init__(self, name, typeRef, parent = None, adminData = None):
@@ -44,6 +46,9 @@ class CompuScaleElement:
     """
     Implementation of <COMPU-SCALE>
     """
+    __slots__ = ('lowerLimit', 'upperLimit', 'lowerLimitType', 'upperLimitType', 'symbol', 'label', 'adminData', 'textValue',
+                 'offset', 'numerator', 'denominator', 'mask', 'compuInverseValue')
+
     def tag(self, version=None): return 'COMPU-SCALE'
 
     def __init__(self, lowerLimit, upperLimit, lowerLimitType = 'CLOSED', upperLimitType = 'CLOSED', label=None, symbol=None, textValue = None, numerator = None, denominator = None, offset = None, mask = None, adminData=None, compuInverseValue=None):
@@ -438,6 +443,7 @@ class DataConstraint(Element):
                 return rule
 
 class ImplementationDataTypeBase(Element):
+    __slots__ = ('variantProps',)
 
     def __init__(self, name, parent, adminData, category, variantProps=None):
         super().__init__(name, parent, adminData, category)
@@ -517,6 +523,8 @@ class SwBaseType(Element):
         self.typeEncoding = typeEncoding
 
 class ImplementationDataTypeElement(ImplementationDataTypeBase):
+    __slots__ = ('arraySize', 'sizeHandling', 'subElements', 'arraySizeSemantics') + _descSlots
+
     def tag(self, version=None): return 'IMPLEMENTATION-DATA-TYPE-ELEMENT'
 
     def __init__(self, name, category = None, arraySize = None, arraySizeSemantics = None, sizeHandling: Optional[ArraySizeHandlingEnum] = None, variantProps = None, parent = None, adminData = None):
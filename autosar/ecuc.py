@@ -61,6 +61,8 @@ class Container(Element):
         return None
 
 class Value():
+    __slots__ = ('definition_reference', 'definition_dest', 'value', 'value_dest')
+
     def __init__(self, definition_reference, definition_dest, value, value_dest):
         self.definition_reference = definition_reference
         self.definition_dest = definition_dest
@@ -68,7 +70,7 @@ class Value():
         self.value_dest = value_dest
 
 class ParamValue(Value):
-    pass
+    __slots__ = ()
 
 class ReferenceValue(Value):
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
@@ -4,7 +4,20 @@ from types import MappingProxyType
 import autosar.base
 from autosar.util.errorHandler import handleNotImplementedError, handleValueError
 
+#incremented each time the name or parent of an element or package attached to a parent changes, invalidates all cached references
+_refGeneration = 0
+
+def _invalidateRefs():
+    global _refGeneration
+    _refGeneration += 1
+
+#optional attributes, only set by the parsers when <DESC> or <LONG-NAME> is present (see BaseParser.pop).
+#Element subclasses defining __slots__ whose parser applies these add them to their slots
+_descSlots = ('desc', 'descAttr', 'longName', 'longNameAttr')
+
 class Element:
+    __slots__ = ('_name', '_parent', '_refCache', 'adminData', 'category', 'uuid', '__weakref__')
+
     def __init__(self, name, parent = None, adminData = None, category = None, uuid = None):
         if isinstance(adminData, dict):
             adminDataObj=autosar.base.createAdminData(adminData)
@@ -12,19 +25,64 @@ class Element:
             adminDataObj = adminData
         if (adminDataObj is not None) and not isinstance(adminDataObj, autosar.base.AdminData):
             raise ValueError("adminData must be of type dict or autosar.base.AdminData")
+        self._parent = None
+        self._refCache = None #(_refGeneration, ref)
         self.name=name
         self.adminData=adminDataObj
         self.parent=parent
         self.category=category
         self.uuid=uuid
 
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        if (self._parent is not None) and (name != self._name):
+            _invalidateRefs()
+            oldName = self._name
+            self._name = name
+            for nameIndex in getattr(self._parent, '_nameIndexes', ()):
+                nameIndex.rename(self, oldName)
+        else:
+            self._name = name
+
+    @property
+    def parent(self):
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent):
+        if (self._parent is not None) and (parent is not self._parent):
+            _invalidateRefs()
+        self._parent = parent
+
     @property
     def ref(self):
-        if self.parent is not None:
-            return self.parent.ref+'/%s'%self.name
+        """
+        Absolute reference of the element, cached until the name or parent of any element changes
+        """
+        cache = self._refCache
+        if (cache is not None) and (cache[0] == _refGeneration):
+            return cache[1]
+        if self._parent is not None:
+            ref = self._parent.ref+'/%s'%self._name
+            self._refCache = (_refGeneration, ref)
+            return ref
         else:
             return None
 
+    def __getstate__(self):
+        state = autosar.base.instanceAttributes(self)
+        state.pop('_refCache', None)
+        return state
+
+    def __setstate__(self, state):
+        self._refCache = None
+        for (name, value) in state.items():
+            object.__setattr__(self, name, value)
+
     def rootWS(self):
         if self.parent is None:
             return None
@@ -36,6 +94,8 @@ class Element:
 
 class LabelElement:
     """Same as Element but uses label as main identifier instead of name"""
+    __slots__ = ('_label', '_parent', '_refCache', 'adminData', 'category', '__weakref__')
+
     def __init__(self, label, parent = None, adminData = None, category = None):
         if isinstance(adminData, dict):
             adminDataObj=autosar.base.createAdminData(adminData)
@@ -43,18 +103,55 @@ class LabelElement:
             adminDataObj = adminData
         if (adminDataObj is not None) and not isinstance(adminDataObj, autosar.base.AdminData):
             raise ValueError("adminData must be of type dict or autosar.base.AdminData")
+        self._parent = None
+        self._refCache = None #(_refGeneration, ref)
         self.label=label
         self.adminData=adminDataObj
         self.parent=parent
         self.category=category
 
+    @property
+    def label(self):
+        return self._label
+
+    @label.setter
+    def label(self, label):
+        if (self._parent is not None) and (label != self._label):
+            _invalidateRefs()
+        self._label = label
+
+    @property
+    def parent(self):
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent):
+        if (self._parent is not None) and (parent is not self._parent):
+            _invalidateRefs()
+        self._parent = parent
+
     @property
     def ref(self):
-        if self.parent is not None:
-            return self.parent.ref+'/%s'%self.label
+        cache = self._refCache
+        if (cache is not None) and (cache[0] == _refGeneration):
+            return cache[1]
+        if self._parent is not None:
+            ref = self._parent.ref+'/%s'%self._label
+            self._refCache = (_refGeneration, ref)
+            return ref
         else:
             return None
 
+    def __getstate__(self):
+        state = autosar.base.instanceAttributes(self)
+        state.pop('_refCache', None)
+        return state
+
+    def __setstate__(self, state):
+        self._refCache = None
+        for (name, value) in state.items():
+            object.__setattr__(self, name, value)
+
     def rootWS(self):
         if self.parent is None:
             return None
@@ -63,6 +160,9 @@ class LabelElement:
 
 
 class AutosarDataPrototype(Element):
+    __slots__ = ('role', 'typeRef', '_swImplPolicy', 'isQueued', 'initValue', 'initValueRef', 'swAddressMethodRef',
+                 'swCalibrationAccess', 'dataConstraintRef', 'variationPoint') + _descSlots
+
     class Role(Enum):
         Variable='VARIABLE-DATA-PROTOTYPE'
         Parameter='PARAMETER-DATA-PROTOTYPE'
@@ -11,6 +11,7 @@ import autosar.base
 import re
 from fractions import Fraction
 import collections
+import itertools
 import decimal
 import sys
 
@@ -20,6 +21,10 @@ _supress_warnings = True
 
 class Package(object):
     packageName = None
+    _name = None
+    _parent = None
+    _role = None
+    _refCache = None #(autosar.element._refGeneration, ref)
     def __init__(self, name, parent=None, role=None):
         self.name = name
         self.elements = []
@@ -36,13 +41,71 @@ class Package(object):
         else:
             raise ValueError('expected string')
 
+    @property
+    def elements(self):
+        if self._hasStubs:
+            self._loadStubs()
+        return self._elements
+
+    @elements.setter
+    def elements(self, elements):
+        self._elements = elements
+        self._hasStubs = False
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        if (self._parent is not None) and (name != self._name):
+            autosar.element._invalidateRefs()
+        self._name = name
+
+    @property
+    def parent(self):
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent):
+        if (self._parent is not None) and (parent is not self._parent):
+            autosar.element._invalidateRefs()
+        self._parent = parent
+
+    @property
+    def role(self):
+        return self._role
+
+    @role.setter
+    def role(self, role):
+        ws = self.rootWS() if role != self._role else None
+        if ws is not None:
+            ws._unindexRole(self)
+        self._role = role
+        if ws is not None:
+            ws._indexRole(self)
+
     @property
     def ref(self):
-        if self.parent is not None:
-            return self.parent.ref+'/%s'%self.name
+        """
+        Absolute reference of the package, cached like autosar.element.Element.ref
+        """
+        cache = self._refCache
+        generation = autosar.element._refGeneration
+        if (cache is not None) and (cache[0] == generation):
+            return cache[1]
+        if self._parent is not None:
+            ref = self._parent.ref+'/%s'%self._name
+            self._refCache = (generation, ref)
+            return ref
         else:
             return None
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_refCache', None)
+        return state
+
     def findPackage(self,ref):
         if ref.startswith('/'): return self.parent.findPackage(ref)
         ref = ref.partition('/')
@@ -73,36 +136,21 @@ class Package(object):
         
         raise ValueError(f"Found multiple elements sharing the same ref: {ref}")
 
-    def findall(self,ref):
+    def findall(self, ref, elementType=None):
         """
-        experimental find-method that has some rudimentary support for globs.
+        Returns a list of the elements and packages matching the reference pattern ref, see iterfind
         """
         if ref is None: return None
-        if ref[0]=='/': ref=ref[1:] #removes initial '/' if it exists
-        ref = ref.partition('/')
-        if ref[0]=='*' and len(ref[2])==0:
-            result=list(self.elements)
-            result.extend(self.subPackages)
-        else:
-            result=[]
-            for item in (self.elements+self.subPackages):
-                if item.name == ref[0] or ref[0]=='*':
-                    if len(ref[2])>0:
-                        if hasattr(item, "findall"):
-                            result.extend(item.findall(ref[2]))
-                    else:
-                        result.append(item)
-            if (len(result)==0) and ('*' in ref[0]):
-                p = re.compile(ref[0].replace('*','.*'))
-                for item in (self.elements+self.subPackages):
-                    m = p.match(item.name)
-                    if m is not None:
-                        if len(ref[2])>0:
-                            if hasattr(item, "findall"):
-                                result.extend(item.findall(ref[2]))
-                        else:
-                            result.append(item)
-        return result
+        return list(self.iterfind(ref, elementType))
+
+    def iterfind(self, ref, elementType=None):
+        """
+        Yields the elements and packages below this package matching the reference pattern ref (see autosar.base.RefPattern).
+        Example: package.iterfind('**/*_I', autosar.portinterface.SenderReceiverInterface)
+        ref is either a string or a compiled pattern (see autosar.base.compileRefPattern).
+        When elementType (a class or a tuple of classes) is given, only instances of elementType are yielded.
+        """
+        return _iterfind(self, ref, elementType)
 
     def _find_non_unique_refs(self, ref: str, result: List):
         """
@@ -124,7 +172,11 @@ class Package(object):
 
         if name in self.map['elements']:
             elem = self.map['elements'][name]
-            if len(ref[2]) > 0:
+            if isinstance(elem, ElementStub):
+                elem = self._loadStub(elem)
+            if elem is None:
+                pass
+            elif len(ref[2]) > 0:
                 if hasattr(elem, "find"):
                     found_element = elem.find(ref[2])
                     if found_element is not None:
@@ -147,13 +199,18 @@ class Package(object):
         if ref is None: return
         if ref[0]=='/': ref=ref[1:] #removes initial '/' if it exists
         ref = ref.partition('/')
-        for i,element in enumerate(self.elements):
+        for i,element in enumerate(self._elements):
             if element.name == ref[0]:
                 if len(ref[2])>0:
+                    if isinstance(element, ElementStub):
+                        element = self._loadStub(element)
                     return element.delete(ref[2])
                 else:
-                    del self.elements[i]
+                    del self._elements[i]
                     del self.map['elements'][ref[0]]
+                    ws = self.rootWS()
+                    if ws is not None:
+                        ws._unindexElement(self.ref+'/'+ref[0])
                     break
 
     def createSenderReceiverInterface(self, name, dataElements=None, modeGroups=None, isService=False, serviceKind = None, adminData=None):
@@ -337,6 +394,8 @@ class Package(object):
     def append(self,elem):
         """appends elem to the self.elements list"""
         isNewElement = True
+        if self._hasStubs and isinstance(self.map['elements'].get(elem.name), ElementStub):
+            self._loadStub(self.map['elements'][elem.name])
         if elem.name in self.map['elements']:
             isNewElement = False
             existingElem = self.map['elements'][elem.name]
@@ -347,16 +406,71 @@ class Package(object):
                     raise ValueError('Error: element %s %s already exist in package %s using different definition'%(existingElem.name, str(type(existingElem)), self.name))
         if isNewElement:
             if isinstance(elem,autosar.element.Element):
-                self.elements.append(elem)
+                self._elements.append(elem)
                 elem.parent=self
                 self.map['elements'][elem.name]=elem
+                ws = self.rootWS()
+                if ws is not None:
+                    ws._indexElement(self.ref+'/'+elem.name, elem)
             elif isinstance(elem,Package):
-                self.subPackages.append(elem)
-                elem.parent=self
-                self.map['packages'][elem.name]=elem
+                self.appendPackage(elem)
             else:
                 raise ValueError('unexpected value type %s'%str(type(elem)))
     
+    def appendStub(self, stub):
+        """
+        appends an unparsed element (see ElementStub) to the self.elements list.
+        The element is parsed when it is first accessed, either through find or self.elements.
+        """
+        self._elements.append(stub)
+        self.map['elements'][stub.name]=stub
+        stub.parent = self
+        self._hasStubs = True
+        ws = self.rootWS()
+        if ws is not None:
+            ws._indexElement(self.ref+'/'+stub.name, stub)
+
+    def _loadStub(self, stub):
+        """
+        parses the element behind stub (only once) and replaces stub in self.map.
+        While the element is parsed it is not found (None is returned), as when elements are loaded eagerly.
+        """
+        if (stub.xmlElement is not None) and not stub.loading:
+            stub.loading = True
+            try:
+                stub.element = stub.packageParser.parseElement(self, stub.xmlElement)
+            finally:
+                stub.loading = False
+            stub.xmlElement = None
+            if self.map['elements'].get(stub.name) is stub:
+                ws = self.rootWS()
+                ref = None if ws is None else self.ref+'/'+stub.name
+                if stub.element is None:
+                    del self.map['elements'][stub.name]
+                    if ws is not None:
+                        ws._unindexElement(ref)
+                else:
+                    self.map['elements'][stub.name]=stub.element
+                    if ws is not None:
+                        ws._indexElement(ref, stub.element)
+        return stub.element
+
+    def _loadStubs(self):
+        """parses all remaining stubs and replaces them in the self.elements list"""
+        elements = []
+        hasStubs = False
+        for elem in self._elements:
+            if isinstance(elem, ElementStub):
+                if elem.loading:
+                    hasStubs = True #kept until it has been parsed
+                else:
+                    elem = self._loadStub(elem)
+                    if elem is None:
+                        continue
+            elements.append(elem)
+        self._elements = elements
+        self._hasStubs = hasStubs
+
     def appendPackage(self, elem):
         """appends elem to the self.packages list"""
         if not isinstance(elem,Package):
@@ -365,6 +479,9 @@ class Package(object):
         self.subPackages.append(elem)
         elem.parent=self
         self.map['packages'][elem.name]=elem
+        ws = self.rootWS()
+        if ws is not None:
+            ws._indexPackage(elem, self.ref+'/'+elem.name)
 
     def update(self,other):
         """copies/clones each element from other into self.elements"""
@@ -1560,3 +1677,107 @@ class Package(object):
 
     def _createDataConstraintName(self, ws, name):
         return name + ws.profile.dataConstraintSuffix
+
+
+def _iterfind(container, ref, elementType):
+    """
+    Implements Package.iterfind and Workspace.iterfind, container is a Package or a Workspace
+    """
+    pattern = autosar.base.compileRefPattern(ref) if isinstance(ref, str) else ref
+    if len(pattern.names) == 0:
+        return iter(())
+    result = _iterMatches(container, pattern, 0)
+    if elementType is not None:
+        result = filter(lambda item: isinstance(item, elementType), result)
+    if pattern.hasDuplicates:
+        result = _iterUnique(result)
+    return iter(result)
+
+def _iterUnique(items):
+    """
+    Yields items skipping those already yielded
+    """
+    seen = set()
+    for item in items:
+        if id(item) not in seen:
+            seen.add(id(item))
+            yield item
+
+def _iterMatches(container, pattern, i):
+    """
+    Returns an iterator over the items below container matching pattern.names[i:]
+    """
+    name = pattern.names[i]
+    isLast = (i+1 == len(pattern.names))
+    if name == '**':
+        if isLast:
+            return _iterDescendants(container)
+        packages = container.subPackages if isinstance(container, Package) else container.packages
+        return itertools.chain(_iterMatches(container, pattern, i+1),
+                               itertools.chain.from_iterable(_iterMatches(package, pattern, i) for package in packages))
+    if name == '*':
+        items = _iterItems(container, None)
+    elif pattern.matchers[i] is not None:
+        items = _iterItems(container, pattern.matchers[i])
+    else:
+        items = _iterItemsNamed(container, name)
+    if isLast:
+        return items
+    return itertools.chain.from_iterable(_iterMatches(item, pattern, i+1) for item in items if isinstance(item, Package))
+
+def _iterItems(container, matcher):
+    """
+    Returns an iterator over the elements and sub-packages of container (the packages of a workspace) whose names match matcher.
+    All items are returned when matcher is None. Stubs are only loaded when their name matches.
+    """
+    if isinstance(container, Package):
+        if matcher is None:
+            return itertools.chain(container.elements, container.subPackages)
+        elements = container._elements
+        if container._hasStubs:
+            elements = filter(None, (container._loadStub(elem) if isinstance(elem, ElementStub) else elem
+                                     for elem in elements if matcher(elem.name)))
+        else:
+            elements = (elem for elem in elements if matcher(elem.name))
+        return itertools.chain(elements, (package for package in container.subPackages if matcher(package.name)))
+    if matcher is None:
+        return iter(container.packages)
+    return (package for package in container.packages if matcher(package.name))
+
+def _iterItemsNamed(container, name):
+    """
+    Returns a list holding the element and the sub-package (or package of a workspace) of container named name
+    """
+    result = []
+    if isinstance(container, Package):
+        elem = container.map['elements'].get(name)
+        if isinstance(elem, ElementStub):
+            elem = container._loadStub(elem)
+        if elem is not None:
+            result.append(elem)
+    package = container.map['packages'].get(name)
+    if package is not None:
+        result.append(package)
+    return result
+
+def _iterDescendants(container):
+    """
+    Yields all elements and packages below container, each package is followed by its content
+    """
+    for item in _iterItems(container, None):
+        yield item
+        if isinstance(item, Package):
+            yield from _iterDescendants(item)
+
+class ElementStub:
+    """
+    Placeholder for a package element that has not been parsed yet (see PackageParser.loadXML with lazy=True).
+    It keeps the raw XML node until the element is first accessed, it is then parsed using packageParser.
+    """
+    def __init__(self, name, xmlElement, packageParser):
+        self.name = name
+        self.xmlElement = xmlElement
+        self.packageParser = packageParser
+        self.element = None
+        self.parent = None #package holding the stub, set by Package.appendStub
+        self.loading = False #True while the element is parsed, see Package._loadStub
@@ -6,6 +6,63 @@ from autosar.util.errorHandler import handleNotImplementedError, handleValueErro
 class BehaviorParser(EntityParser):
     def __init__(self,version=3.0):
         super().__init__(version)
+        if (self.version >=3.0) and (self.version < 4.0):
+            self.internalBehaviorSwitcher = {
+                'SHORT-NAME': self._skipNode,
+                'COMPONENT-REF': self._skipNode,
+                'SUPPORTS-MULTIPLE-INSTANTIATION': self._skipNode,
+                'EVENTS': self._parseEvents,
+                'PORT-API-OPTIONS': self._parsePortAPIOptionsV3,
+                'RUNNABLES': self._parseRunnables,
+                'PER-INSTANCE-MEMORYS': self._parsePerInstanceMemoriesV3,
+                'SERVICE-NEEDSS': self._parseServiceNeeds,
+                'SHARED-CALPRMS': self._parseSharedCalPrms,
+                'EXCLUSIVE-AREAS': self._parseExclusiveAreas,
+            }
+            self.eventSwitcher = {
+                'MODE-SWITCH-EVENT': self.parseModeSwitchEvent,
+                'TIMING-EVENT': self.parseTimingEvent,
+                'DATA-RECEIVED-EVENT': self.parseDataReceivedEvent,
+                'OPERATION-INVOKED-EVENT': self.parseOperationInvokedEvent,
+            }
+        elif self.version >= 4.0:
+            self.internalBehaviorSwitcher = {
+                'SHORT-NAME': self._skipNode,
+                'SUPPORTS-MULTIPLE-INSTANTIATION': self._skipNode,
+                'DATA-TYPE-MAPPING-REFS': self._parseDataTypeMappingRefs,
+                'CONSTANT-VALUE-MAPPING-REFS': self._parseConstantValueMappingRefs,
+                'EVENTS': self._parseEvents,
+                'PORT-API-OPTIONS': self._parsePortAPIOptionsV4,
+                'RUNNABLES': self._parseRunnables,
+                'AR-TYPED-PER-INSTANCE-MEMORYS': self._parsePerInstanceMemoriesV4,
+                'SERVICE-DEPENDENCYS': self._parseServiceDependencies,
+                'SHARED-PARAMETERS': self._parseSharedParameters,
+                'EXCLUSIVE-AREAS': self._parseExclusiveAreas,
+                'EXCLUSIVE-AREA-POLICYS': self._parseExclusiveAreaPolicies,
+                'PER-INSTANCE-PARAMETERS': self._parsePerInstanceParameters,
+                'EXPLICIT-INTER-RUNNABLE-VARIABLES': self._parseExplicitVariables,
+                'IMPLICIT-INTER-RUNNABLE-VARIABLES': self._parseImplicitVariables,
+                'HANDLE-TERMINATION-AND-RESTART': self._skipNode, #implement later
+                'STATIC-MEMORYS': self._skipNode, #implement later
+                'INCLUDED-DATA-TYPE-SETS': self._parseIncludedDataTypeSets,
+                'CONSTANT-MEMORYS': self._parseConstantMemories,
+                'VARIATION-POINT-PROXYS': self._parseVariationPointProxies,
+                'INSTANTIATION-DATA-DEF-PROPSS': self._parseInstantiationDataDefPropss,
+            }
+            self.eventSwitcher = {
+                'INIT-EVENT': self.parseInitEvent,
+                'SWC-MODE-SWITCH-EVENT': self.parseModeSwitchEvent,
+                'TIMING-EVENT': self.parseTimingEvent,
+                'DATA-RECEIVED-EVENT': self.parseDataReceivedEvent,
+                'EXTERNAL-TRIGGER-OCCURRED-EVENT': self.parseExternalTriggerOccurredEvent,
+                'ASYNCHRONOUS-SERVER-CALL-RETURNS-EVENT': self.parseAsyncServerCallReturnsEvent,
+                'OPERATION-INVOKED-EVENT': self.parseOperationInvokedEvent,
+                'MODE-SWITCHED-ACK-EVENT': self.parseModeSwitchedAckEvent,
+                'DATA-RECEIVE-ERROR-EVENT': None, #TODO: Implement later
+            }
+        else:
+            self.internalBehaviorSwitcher = {}
+            self.eventSwitcher = {}
 
     def getSupportedTags(self):
         if (self.version >=3.0) and (self.version < 4.0):
@@ -15,7 +72,6 @@ class BehaviorParser(EntityParser):
         else:
             return []
 
-    @parseElementUUID
     def parseElement(self, xmlElement, parent = None):
         if (self.version >=3.0) and (self.version < 4.0) and xmlElement.tag == 'INTERNAL-BEHAVIOR':
             return self.parseInternalBehavior(xmlElement, parent)
@@ -42,61 +98,9 @@ class BehaviorParser(EntityParser):
             if swc is not None:
                 swc.behavior=internalBehavior
             for xmlNode in xmlRoot.findall('./*'):
-                if (xmlNode.tag == 'SHORT-NAME') or (xmlNode.tag == 'COMPONENT-REF') or (xmlNode.tag == 'SUPPORTS-MULTIPLE-INSTANTIATION'):
-                    continue
-                if xmlNode.tag == 'EVENTS':
-                    for xmlEvent in xmlNode.findall('./*'):
-                        event = None
-                        if xmlEvent.tag == 'MODE-SWITCH-EVENT':
-                            event = self.parseModeSwitchEvent(xmlEvent,internalBehavior)
-                        elif xmlEvent.tag == 'TIMING-EVENT':
-                            event = self.parseTimingEvent(xmlEvent,internalBehavior)
-                        elif xmlEvent.tag == 'DATA-RECEIVED-EVENT':
-                            event = self.parseDataReceivedEvent(xmlEvent,internalBehavior)
-                        elif xmlEvent.tag == 'OPERATION-INVOKED-EVENT':
-                            event = self.parseOperationInvokedEvent(xmlEvent,internalBehavior)
-                        else:
-                            handleNotImplementedError(xmlEvent.tag)
-                        if event is not None:
-                            internalBehavior.events.append(event)
-                        else:
-                            handleValueError(f'failing to parse event: {xmlEvent.tag}')
-                elif xmlNode.tag == 'PORT-API-OPTIONS':
-                    for xmlOption in xmlNode.findall('./PORT-API-OPTION'):
-                        portAPIOption = autosar.behavior.PortAPIOption(self.parseTextNode(xmlOption.find('PORT-REF')),self.parseBooleanNode(xmlOption.find('ENABLE-TAKE-ADDRESS')),self.parseBooleanNode(xmlOption.find('INDIRECT-API')))
-                        # TODO: Backport PortArgValues support from Autosar 4
-                        if portAPIOption is not None: internalBehavior.portAPIOptions.append(portAPIOption)
-                elif xmlNode.tag == 'RUNNABLES':
-                    for xmRunnable in xmlNode.findall('./RUNNABLE-ENTITY'):
-                        runnableEntity = self.parseRunnableEntity(xmRunnable, internalBehavior)
-                        if runnableEntity is not None:
-                            internalBehavior.runnables.append(runnableEntity)
-                elif xmlNode.tag == 'PER-INSTANCE-MEMORYS':
-                    for xmlElem in xmlNode.findall('./PER-INSTANCE-MEMORY'):
-                        perInstanceMemory = autosar.behavior.PerInstanceMemory(self.parseTextNode(xmlElem.find('SHORT-NAME')),self.parseTextNode(xmlElem.find('TYPE-DEFINITION')), internalBehavior)
-                        if perInstanceMemory is not None: internalBehavior.perInstanceMemories.append(perInstanceMemory)
-                elif xmlNode.tag == 'SERVICE-NEEDSS':
-                    for xmlElem in xmlNode.findall('./*'):
-                        if xmlElem.tag=='SWC-NV-BLOCK-NEEDS':
-                            swcNvBlockNeeds=self.parseSwcNvBlockNeeds(xmlElem)
-                            if swcNvBlockNeeds is not None: internalBehavior.swcNvBlockNeeds.append(swcNvBlockNeeds)
-                        else:
-                            handleNotImplementedError(xmlElem.tag)
-                elif xmlNode.tag == 'SHARED-CALPRMS':
-                    for xmlElem in xmlNode.findall('./*'):
-                        if xmlElem.tag=='CALPRM-ELEMENT-PROTOTYPE':
-                            calPrmElemPrototype=self.parseCalPrmElemPrototype(xmlElem, internalBehavior)
-                            assert(calPrmElemPrototype is not None)
-                            internalBehavior.sharedCalParams.append(calPrmElemPrototype)
-                        else:
-                            handleNotImplementedError(xmlElem.tag)
-                elif xmlNode.tag == 'EXCLUSIVE-AREAS':
-                    for xmlElem in xmlNode.findall('./*'):
-                        if xmlElem.tag=='EXCLUSIVE-AREA':
-                            exclusiveArea=autosar.behavior.ExclusiveArea(self.parseTextNode(xmlElem.find('SHORT-NAME')), internalBehavior)
-                            internalBehavior.exclusiveAreas.append(exclusiveArea)
-                        else:
-                            handleNotImplementedError(xmlElem.tag)
+                handler = self.internalBehaviorSwitcher.get(xmlNode.tag)
+                if handler is not None:
+                    handler(xmlNode, internalBehavior)
                 else:
                     handleNotImplementedError(xmlNode.tag)
             return internalBehavior
@@ -114,161 +118,12 @@ class BehaviorParser(EntityParser):
         ws = parent.rootWS()
         assert(ws is not None)
         if (name is not None):
-            handledXML = ['SHORT-NAME', 'SUPPORTS-MULTIPLE-INSTANTIATION']
             internalBehavior = autosar.behavior.SwcInternalBehavior(name, parent.ref, multipleInstance, parent)
             self.push()
             for xmlElem in xmlRoot.findall('./*'):
-                if xmlElem.tag in handledXML:
-                    pass
-                elif xmlElem.tag == 'DATA-TYPE-MAPPING-REFS':
-                    for xmlChild in xmlElem.findall('./*'):
-                        if xmlChild.tag == 'DATA-TYPE-MAPPING-REF':
-                            tmp = self.parseTextNode(xmlChild)
-                            if tmp is not None:
-                                internalBehavior.appendDataTypeMappingRef(tmp)
-                elif xmlElem.tag == 'CONSTANT-VALUE-MAPPING-REFS':
-                    for xmlChild in xmlElem.findall('./*'):
-                        if xmlChild.tag == 'CONSTANT-VALUE-MAPPING-REF':
-                            tmp = self.parseTextNode(xmlChild)
-                            if tmp is not None:
-                                internalBehavior.appendConstantValueMappingRef(tmp)
-                elif xmlElem.tag == 'EVENTS':
-                    for xmlEvent in xmlElem.findall('./*'):
-                        event = None
-                        if xmlEvent.tag == 'INIT-EVENT':
-                            event = self.parseInitEvent(xmlEvent, internalBehavior)
-                        elif xmlEvent.tag == 'SWC-MODE-SWITCH-EVENT':
-                            event = self.parseModeSwitchEvent(xmlEvent, internalBehavior)
-                        elif xmlEvent.tag == 'TIMING-EVENT':
-                            event = self.parseTimingEvent(xmlEvent, internalBehavior)
-                        elif xmlEvent.tag == 'DATA-RECEIVED-EVENT':
-                            event = self.parseDataReceivedEvent(xmlEvent, internalBehavior)
-                        elif xmlEvent.tag == 'EXTERNAL-TRIGGER-OCCURRED-EVENT':
-                            event = self.parseExternalTriggerOccurredEvent(xmlEvent,internalBehavior)
-                        elif xmlEvent.tag == 'ASYNCHRONOUS-SERVER-CALL-RETURNS-EVENT':
-                            event = self.parseAsyncServerCallReturnsEvent(xmlEvent,internalBehavior)
-                        elif xmlEvent.tag == 'OPERATION-INVOKED-EVENT':
-                            event = self.parseOperationInvokedEvent(xmlEvent, internalBehavior)
-                        elif xmlEvent.tag == 'MODE-SWITCHED-ACK-EVENT':
-                            event = self.parseModeSwitchedAckEvent(xmlEvent, internalBehavior)
-                        elif xmlEvent.tag == 'DATA-RECEIVE-ERROR-EVENT':
-                            #TODO: Implement later
-                            pass
-                        else:
-                            handleNotImplementedError(xmlEvent.tag)
-                        if event is not None:
-                            internalBehavior.events.append(event)
-                elif xmlElem.tag == 'PORT-API-OPTIONS':
-                    for xmlOption in xmlElem.findall('./PORT-API-OPTION'):
-                        enableTakeAddress = self.parseBooleanNode(xmlOption.find('ENABLE-TAKE-ADDRESS'))
-                        indirectApi = self.parseBooleanNode(xmlOption.find('INDIRECT-API'))
-                        portRef = self.parseTextNode(xmlOption.find('PORT-REF'))
-                        
-                        portArgValues = []
-                        for xmlPortDefinedArgumentValue in xmlOption.findall('./PORT-ARG-VALUES/PORT-DEFINED-ARGUMENT-VALUE'):
-                            portArgValues.append(self.constantParser.parsePortDefinedArgumentValue(xmlPortDefinedArgumentValue))
-
-                        portAPIOption = autosar.behavior.PortAPIOption(portRef, enableTakeAddress, indirectApi, portArgValues)
-                        
-                        if portAPIOption is not None: internalBehavior.portAPIOptions.append(portAPIOption)
-                elif xmlElem.tag == 'RUNNABLES':
-                    for xmRunnable in xmlElem.findall('./RUNNABLE-ENTITY'):
-                        runnableEntity = self.parseRunnableEntity(xmRunnable, internalBehavior)
-                        if runnableEntity is not None:
-                            internalBehavior.runnables.append(runnableEntity)
-                elif xmlElem.tag == 'AR-TYPED-PER-INSTANCE-MEMORYS':
-                    for xmlChild in xmlElem.findall('./*'):
-                        if xmlChild.tag == 'VARIABLE-DATA-PROTOTYPE':
-                            dataElement = self.parseAutosarDataPrototype(xmlChild, internalBehavior)
-                            internalBehavior.perInstanceMemories.append(dataElement)
-                        else:
-                            handleNotImplementedError(xmlChild.tag)
-                elif xmlElem.tag == 'SERVICE-DEPENDENCYS':
-                    for xmlChildElem in xmlElem.findall('./*'):
-                        if xmlChildElem.tag == 'SWC-SERVICE-DEPENDENCY':
-                            swcServiceDependency = self.parseSwcServiceDependency(xmlChildElem, internalBehavior)
-                            internalBehavior.serviceDependencies.append(swcServiceDependency)
-                        else:
-                            handleNotImplementedError(xmlChildElem.tag)
-                elif xmlElem.tag == 'SHARED-PARAMETERS':
-                    for xmlChildElem in xmlElem.findall('./*'):
-                        if xmlChildElem.tag == 'PARAMETER-DATA-PROTOTYPE':
-                            tmp = self.parseParameterDataPrototype(xmlChildElem, internalBehavior)
-                            if tmp is not None:
-                                internalBehavior.sharedParameterDataPrototype.append(tmp)
-                        else:
-                            handleNotImplementedError(xmlChildElem.tag)
-                elif xmlElem.tag == 'EXCLUSIVE-AREAS':
-                    for xmlChild in xmlElem.findall('./*'):
-                        if xmlChild.tag=='EXCLUSIVE-AREA':
-                            exclusiveArea=autosar.behavior.ExclusiveArea(self.parseTextNode(xmlChild.find('SHORT-NAME')), internalBehavior)
-                            internalBehavior.exclusiveAreas.append(exclusiveArea)
-                        else:
-                            handleNotImplementedError(xmlChild.tag)
-                elif xmlElem.tag == 'EXCLUSIVE-AREA-POLICYS':
-                    for xmlChildElem in xmlElem.findall('./*'):
-                        if xmlChildElem.tag == 'SWC-EXCLUSIVE-AREA-POLICY':
-                            tmp = self.parseSwcExclusiveAreaPolicy(xmlChildElem, internalBehavior)
-                            if tmp is not None:
-                                internalBehavior.exclusiveAreaPolicys.append(tmp)
-                        else:
-                            handleNotImplementedError(xmlChildElem.tag)
-                elif xmlElem.tag == 'PER-INSTANCE-PARAMETERS':
-                    for xmlChildElem in xmlElem.findall('./*'):
-                        if xmlChildElem.tag == 'PARAMETER-DATA-PROTOTYPE':
-                            tmp = self.parseParameterDataPrototype(
-                                xmlChildElem, internalBehavior)
-                            if tmp is not None:
-                                internalBehavior.perInstanceParameterDataPrototype.append(
-                                    tmp)
-                        else:
-                            handleNotImplementedError(xmlChildElem.tag)
-                elif xmlElem.tag == 'EXPLICIT-INTER-RUNNABLE-VARIABLES':
-                    for xmlChild in xmlElem.findall('./*'):
-                        if xmlChild.tag == 'VARIABLE-DATA-PROTOTYPE':
-                            dataElement = self.parseAutosarDataPrototype(xmlChild, internalBehavior)
-                            internalBehavior.explicitVariables.append(dataElement)
-                        else:
-                            handleNotImplementedError(xmlChild.tag)
-                elif xmlElem.tag == 'IMPLICIT-INTER-RUNNABLE-VARIABLES':
-                    for xmlChild in xmlElem.findall('./*'):
-                        if xmlChild.tag == 'VARIABLE-DATA-PROTOTYPE':
-                            dataElement = self.parseAutosarDataPrototype(xmlChild, internalBehavior)
-                            internalBehavior.implicitVariables.append(dataElement)
-                        else:
-                            handleNotImplementedError(xmlChild.tag)
-                elif xmlElem.tag == 'HANDLE-TERMINATION-AND-RESTART':
-                    pass #implement later
-                elif xmlElem.tag == 'STATIC-MEMORYS':
-                    pass #implement later
-                elif xmlElem.tag == 'INCLUDED-DATA-TYPE-SETS':
-                    for xmlChild in xmlElem.findall('./*'):
-                        if xmlChild.tag == 'INCLUDED-DATA-TYPE-SET':
-                            includedDataTypeSet = self.parseIncludedDataTypeSet(xmlChild)
-                            internalBehavior.includedDataTypeSets.append(includedDataTypeSet)
-                elif xmlElem.tag == 'CONSTANT-MEMORYS':
-                    for xmlChild in xmlElem.findall('./*'):
-                        if xmlChild.tag == 'PARAMETER-DATA-PROTOTYPE':
-                            tmp = self.parseParameterDataPrototype(xmlChild, internalBehavior)
-                            if tmp is not None:
-                                internalBehavior.constantMemories.append(tmp)
-                        else:
-                            handleNotImplementedError(xmlChild.tag)
-                elif xmlElem.tag == 'VARIATION-POINT-PROXYS':
-                    for xmlChild in xmlElem.findall('./*'):
-                        if xmlChild.tag == 'VARIATION-POINT-PROXY':
-                            variationPointProxy = self.parseVariationPointProxy(xmlChild, internalBehavior)
-                            internalBehavior.variationPointProxies.append(variationPointProxy)
-                        else:
-                            handleNotImplementedError(xmlChild.tag)
-                elif xmlElem.tag == 'INSTANTIATION-DATA-DEF-PROPSS':
-                    for xmlChild in xmlElem.findall('./*'):
-                        if xmlChild.tag == 'INSTANTIATION-DATA-DEF-PROPS':
-                            tmp = self.parseInstantiationDataDefProps(xmlChild, internalBehavior)
-                            if tmp is not None:
-                                internalBehavior.instantiationDataDefPropss.append(tmp)
-                        else:
-                            handleNotImplementedError(xmlChild.tag)
+                handler = self.internalBehaviorSwitcher.get(xmlElem.tag)
+                if handler is not None:
+                    handler(xmlElem, internalBehavior)
                 else:
                     self.defaultHandler(xmlElem)
             
@@ -277,6 +132,186 @@ class BehaviorParser(EntityParser):
 
             return internalBehavior
 
+    def _skipNode(self, xmlElem, internalBehavior):
+        pass
+
+    def _parseEvents(self, xmlElem, internalBehavior):
+        for xmlEvent in xmlElem.findall('./*'):
+            event = None
+            if xmlEvent.tag in self.eventSwitcher:
+                parseFunc = self.eventSwitcher[xmlEvent.tag]
+                if parseFunc is not None:
+                    event = parseFunc(xmlEvent, internalBehavior)
+            else:
+                handleNotImplementedError(xmlEvent.tag)
+            if event is not None:
+                internalBehavior.events.append(event)
+            elif self.version < 4.0:
+                handleValueError(f'failing to parse event: {xmlEvent.tag}')
+
+    def _parsePortAPIOptionsV3(self, xmlElem, internalBehavior):
+        for xmlOption in xmlElem.findall('./PORT-API-OPTION'):
+            portAPIOption = autosar.behavior.PortAPIOption(self.parseTextNode(xmlOption.find('PORT-REF')),self.parseBooleanNode(xmlOption.find('ENABLE-TAKE-ADDRESS')),self.parseBooleanNode(xmlOption.find('INDIRECT-API')))
+            # TODO: Backport PortArgValues support from Autosar 4
+            if portAPIOption is not None: internalBehavior.portAPIOptions.append(portAPIOption)
+
+    def _parsePortAPIOptionsV4(self, xmlElem, internalBehavior):
+        for xmlOption in xmlElem.findall('./PORT-API-OPTION'):
+            enableTakeAddress = self.parseBooleanNode(xmlOption.find('ENABLE-TAKE-ADDRESS'))
+            indirectApi = self.parseBooleanNode(xmlOption.find('INDIRECT-API'))
+            portRef = self.parseTextNode(xmlOption.find('PORT-REF'))
+            
+            portArgValues = []
+            for xmlPortDefinedArgumentValue in xmlOption.findall('./PORT-ARG-VALUES/PORT-DEFINED-ARGUMENT-VALUE'):
+                portArgValues.append(self.constantParser.parsePortDefinedArgumentValue(xmlPortDefinedArgumentValue))
+
+            portAPIOption = autosar.behavior.PortAPIOption(portRef, enableTakeAddress, indirectApi, portArgValues)
+            
+            if portAPIOption is not None: internalBehavior.portAPIOptions.append(portAPIOption)
+
+    def _parseRunnables(self, xmlElem, internalBehavior):
+        for xmRunnable in xmlElem.findall('./RUNNABLE-ENTITY'):
+            runnableEntity = self.parseRunnableEntity(xmRunnable, internalBehavior)
+            if runnableEntity is not None:
+                internalBehavior.runnables.append(runnableEntity)
+
+    def _parsePerInstanceMemoriesV3(self, xmlNode, internalBehavior):
+        for xmlElem in xmlNode.findall('./PER-INSTANCE-MEMORY'):
+            perInstanceMemory = autosar.behavior.PerInstanceMemory(self.parseTextNode(xmlElem.find('SHORT-NAME')),self.parseTextNode(xmlElem.find('TYPE-DEFINITION')), internalBehavior)
+            if perInstanceMemory is not None: internalBehavior.perInstanceMemories.append(perInstanceMemory)
+
+    def _parsePerInstanceMemoriesV4(self, xmlElem, internalBehavior):
+        for xmlChild in xmlElem.findall('./*'):
+            if xmlChild.tag == 'VARIABLE-DATA-PROTOTYPE':
+                dataElement = self.parseAutosarDataPrototype(xmlChild, internalBehavior)
+                internalBehavior.perInstanceMemories.append(dataElement)
+            else:
+                handleNotImplementedError(xmlChild.tag)
+
+    def _parseServiceNeeds(self, xmlNode, internalBehavior):
+        for xmlElem in xmlNode.findall('./*'):
+            if xmlElem.tag=='SWC-NV-BLOCK-NEEDS':
+                swcNvBlockNeeds=self.parseSwcNvBlockNeeds(xmlElem)
+                if swcNvBlockNeeds is not None: internalBehavior.swcNvBlockNeeds.append(swcNvBlockNeeds)
+            else:
+                handleNotImplementedError(xmlElem.tag)
+
+    def _parseSharedCalPrms(self, xmlNode, internalBehavior):
+        for xmlElem in xmlNode.findall('./*'):
+            if xmlElem.tag=='CALPRM-ELEMENT-PROTOTYPE':
+                calPrmElemPrototype=self.parseCalPrmElemPrototype(xmlElem, internalBehavior)
+                assert(calPrmElemPrototype is not None)
+                internalBehavior.sharedCalParams.append(calPrmElemPrototype)
+            else:
+                handleNotImplementedError(xmlElem.tag)
+
+    def _parseExclusiveAreas(self, xmlElem, internalBehavior):
+        for xmlChild in xmlElem.findall('./*'):
+            if xmlChild.tag=='EXCLUSIVE-AREA':
+                exclusiveArea=autosar.behavior.ExclusiveArea(self.parseTextNode(xmlChild.find('SHORT-NAME')), internalBehavior)
+                internalBehavior.exclusiveAreas.append(exclusiveArea)
+            else:
+                handleNotImplementedError(xmlChild.tag)
+
+    def _parseDataTypeMappingRefs(self, xmlElem, internalBehavior):
+        for xmlChild in xmlElem.findall('./*'):
+            if xmlChild.tag == 'DATA-TYPE-MAPPING-REF':
+                tmp = self.parseTextNode(xmlChild)
+                if tmp is not None:
+                    internalBehavior.appendDataTypeMappingRef(tmp)
+
+    def _parseConstantValueMappingRefs(self, xmlElem, internalBehavior):
+        for xmlChild in xmlElem.findall('./*'):
+            if xmlChild.tag == 'CONSTANT-VALUE-MAPPING-REF':
+                tmp = self.parseTextNode(xmlChild)
+                if tmp is not None:
+                    internalBehavior.appendConstantValueMappingRef(tmp)
+
+    def _parseServiceDependencies(self, xmlElem, internalBehavior):
+        for xmlChildElem in xmlElem.findall('./*'):
+            if xmlChildElem.tag == 'SWC-SERVICE-DEPENDENCY':
+                swcServiceDependency = self.parseSwcServiceDependency(xmlChildElem, internalBehavior)
+                internalBehavior.serviceDependencies.append(swcServiceDependency)
+            else:
+                handleNotImplementedError(xmlChildElem.tag)
+
+    def _parseSharedParameters(self, xmlElem, internalBehavior):
+        for xmlChildElem in xmlElem.findall('./*'):
+            if xmlChildElem.tag == 'PARAMETER-DATA-PROTOTYPE':
+                tmp = self.parseParameterDataPrototype(xmlChildElem, internalBehavior)
+                if tmp is not None:
+                    internalBehavior.sharedParameterDataPrototype.append(tmp)
+            else:
+                handleNotImplementedError(xmlChildElem.tag)
+
+    def _parseExclusiveAreaPolicies(self, xmlElem, internalBehavior):
+        for xmlChildElem in xmlElem.findall('./*'):
+            if xmlChildElem.tag == 'SWC-EXCLUSIVE-AREA-POLICY':
+                tmp = self.parseSwcExclusiveAreaPolicy(xmlChildElem, internalBehavior)
+                if tmp is not None:
+                    internalBehavior.exclusiveAreaPolicys.append(tmp)
+            else:
+                handleNotImplementedError(xmlChildElem.tag)
+
+    def _parsePerInstanceParameters(self, xmlElem, internalBehavior):
+        for xmlChildElem in xmlElem.findall('./*'):
+            if xmlChildElem.tag == 'PARAMETER-DATA-PROTOTYPE':
+                tmp = self.parseParameterDataPrototype(
+                    xmlChildElem, internalBehavior)
+                if tmp is not None:
+                    internalBehavior.perInstanceParameterDataPrototype.append(
+                        tmp)
+            else:
+                handleNotImplementedError(xmlChildElem.tag)
+
+    def _parseExplicitVariables(self, xmlElem, internalBehavior):
+        for xmlChild in xmlElem.findall('./*'):
+            if xmlChild.tag == 'VARIABLE-DATA-PROTOTYPE':
+                dataElement = self.parseAutosarDataPrototype(xmlChild, internalBehavior)
+                internalBehavior.explicitVariables.append(dataElement)
+            else:
+                handleNotImplementedError(xmlChild.tag)
+
+    def _parseImplicitVariables(self, xmlElem, internalBehavior):
+        for xmlChild in xmlElem.findall('./*'):
+            if xmlChild.tag == 'VARIABLE-DATA-PROTOTYPE':
+                dataElement = self.parseAutosarDataPrototype(xmlChild, internalBehavior)
+                internalBehavior.implicitVariables.append(dataElement)
+            else:
+                handleNotImplementedError(xmlChild.tag)
+
+    def _parseIncludedDataTypeSets(self, xmlElem, internalBehavior):
+        for xmlChild in xmlElem.findall('./*'):
+            if xmlChild.tag == 'INCLUDED-DATA-TYPE-SET':
+                includedDataTypeSet = self.parseIncludedDataTypeSet(xmlChild)
+                internalBehavior.includedDataTypeSets.append(includedDataTypeSet)
+
+    def _parseConstantMemories(self, xmlElem, internalBehavior):
+        for xmlChild in xmlElem.findall('./*'):
+            if xmlChild.tag == 'PARAMETER-DATA-PROTOTYPE':
+                tmp = self.parseParameterDataPrototype(xmlChild, internalBehavior)
+                if tmp is not None:
+                    internalBehavior.constantMemories.append(tmp)
+            else:
+                handleNotImplementedError(xmlChild.tag)
+
+    def _parseVariationPointProxies(self, xmlElem, internalBehavior):
+        for xmlChild in xmlElem.findall('./*'):
+            if xmlChild.tag == 'VARIATION-POINT-PROXY':
+                variationPointProxy = self.parseVariationPointProxy(xmlChild, internalBehavior)
+                internalBehavior.variationPointProxies.append(variationPointProxy)
+            else:
+                handleNotImplementedError(xmlChild.tag)
+
+    def _parseInstantiationDataDefPropss(self, xmlElem, internalBehavior):
+        for xmlChild in xmlElem.findall('./*'):
+            if xmlChild.tag == 'INSTANTIATION-DATA-DEF-PROPS':
+                tmp = self.parseInstantiationDataDefProps(xmlChild, internalBehavior)
+                if tmp is not None:
+                    internalBehavior.instantiationDataDefPropss.append(tmp)
+            else:
+                handleNotImplementedError(xmlChild.tag)
+
     @parseElementUUID
     def parseRunnableEntity(self, xmlRoot, parent):
         name = None
@@ -1130,7 +1165,6 @@ class BehaviorParser(EntityParser):
         
         return autosar.behavior.AsyncServerCallReturnPoint(name, asyncServerCallPointRef)
 
-    @parseElementUUID
     def parseAccessedVariable(self, xmlRoot, xmlParentElement):
         assert(xmlRoot.tag == 'ACCESSED-VARIABLE')
 
@@ -18,7 +18,6 @@ class ConstantParser(ElementParser):
     def getSupportedTags(self):
         return self.switcher.keys()
 
-    @parseElementUUID
     def parseElement(self, xmlElement, parent = None):
         parseFunc = self.switcher.get(xmlElement.tag)
         if parseFunc is not None:
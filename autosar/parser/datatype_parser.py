@@ -28,7 +28,6 @@ class DataTypeParser(EntityParser):
     def getSupportedTags(self):
         return self.switcher.keys()
 
-    @parseElementUUID
     def parseElement(self, xmlElement, parent = None):
         parseFunc = self.switcher.get(xmlElement.tag)
         if parseFunc is not None:
@@ -424,7 +423,6 @@ class DataTypeSemanticsParser(EntityParser):
     def getSupportedTags(self):
         return ['COMPU-METHOD']
 
-    @parseElementUUID
     def parseElement(self, xmlElement, parent = None):
         if xmlElement.tag == 'COMPU-METHOD':
             return self._parseCompuMethodXML(xmlElement, parent)
@@ -549,7 +547,6 @@ class DataTypeUnitsParser(EntityParser):
     def getSupportedTags(self):
         return ['UNIT']
 
-    @parseElementUUID
     def parseElement(self, xmlElement, parent = None):
         if xmlElement.tag == 'UNIT':
             return self._parseUnit(xmlElement, parent)
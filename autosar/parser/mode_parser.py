@@ -19,7 +19,6 @@ class ModeDeclarationParser(EntityParser):
     def getSupportedTags(self):
         return self.switcher.keys()
 
-    @parseElementUUID
     def parseElement(self, xmlElement, parent = None):
         parseFunc = self.switcher.get(xmlElement.tag)
         if parseFunc is not None:
@@ -2,9 +2,17 @@ import autosar.package
 import autosar.element
 import autosar.parser.parser_base
 import sys
-from autosar.base import parseTextNode
+from autosar.base import parseTextNode, XMLPath, applyFilter
 from autosar.util.errorHandler import handleValueError
 
+_elementsPath = XMLPath('./ELEMENTS/*')
+_shortNamePath = XMLPath('./SHORT-NAME')
+_subPackagesPathAR3 = XMLPath('./SUB-PACKAGES/AR-PACKAGE')
+_subPackagesPathAR4 = XMLPath('./AR-PACKAGES/AR-PACKAGE')
+
+#elements whose parser has side effects on other elements, these are never loaded lazily
+_eagerTags = frozenset(['INTERNAL-BEHAVIOR'])
+
 class PackageParser:
     def __init__(self,version):
         assert(isinstance(version, float))
@@ -23,44 +31,109 @@ class PackageParser:
                 self.switcher[tagname]=elementParser
             self.registeredParsers[name] = elementParser
 
-    def loadXML(self, package, xmlRoot):
+    def loadXML(self, package, xmlRoot, lazy=False, filters=None):
         """
-        Loads an XML package by repeatedly invoking its registered element parsers
+        Loads an XML package by repeatedly invoking its registered element parsers.
+        When lazy is True each element is added as an ElementStub and is only parsed on first access.
+        filters is an optional list of prepared reference filters (see autosar.base.prepareFilter),
+        elements and sub-packages not matching any filter are skipped without being parsed.
         """
         assert(self.switcher is not None)
-        if xmlRoot.find('ELEMENTS'):
-            elementNames = set([x.name for x in package.elements])
-            for xmlElement in xmlRoot.findall('./ELEMENTS/*'):
-                parserObject = self.switcher.get(xmlElement.tag)
-                if parserObject is not None:
-                    element = parserObject.parseElement(xmlElement,package)
-                    if element is None:
-                        print("[PackageParser] No return value: %s"%xmlElement.tag)
+        packageRef = package.ref if filters is not None else None
+        xmlElements = _elementsPath.findall(xmlRoot)
+        if len(xmlElements) > 0:
+            elementNames = set(package.map['elements'])
+            loadElement = self.loadElementStub if lazy else self.loadElement
+            for xmlElement in xmlElements:
+                if filters is not None:
+                    name = self.parseElementName(xmlElement)
+                    if (name is not None) and not applyFilter(packageRef+'/'+name, filters):
                         continue
-                    element.parent=package
-                    if isinstance(element,autosar.element.Element):
-                        if element.name not in elementNames:
-                            #ignore duplicated items
-                            package.append(element)
-                            elementNames.add(element.name)
-                    else:
-                        #handleValueError("parse error: %s"%type(element))
-                        handleValueError("parse error: %s"%xmlElement.tag)
-                else:
-                    package.unhandledParser.add(xmlElement.tag)
+                loadElement(package, xmlElement, elementNames)
 
         if self.version >= 3.0 and self.version < 4.0:
-            if xmlRoot.find('SUB-PACKAGES'):
-                for xmlPackage in xmlRoot.findall('./SUB-PACKAGES/AR-PACKAGE'):
-                    name = xmlPackage.find("./SHORT-NAME").text
-                    subPackage = autosar.package.Package(name)
-                    package.appendPackage(subPackage)
-                    self.loadXML(subPackage,xmlPackage)
+            for xmlPackage in _subPackagesPathAR3.findall(xmlRoot):
+                name = _shortNamePath.find(xmlPackage).text
+                if (filters is not None) and not applyFilter(packageRef+'/'+name, filters):
+                    continue
+                subPackage = autosar.package.Package(name)
+                package.appendPackage(subPackage)
+                self.loadXML(subPackage,xmlPackage,lazy,filters)
         elif self.version >= 4.0:
-            for subPackageXML in xmlRoot.findall('./AR-PACKAGES/AR-PACKAGE'):
-                name = parseTextNode(subPackageXML.find("./SHORT-NAME"))
+            for subPackageXML in _subPackagesPathAR4.findall(xmlRoot):
+                name = parseTextNode(_shortNamePath.find(subPackageXML))
+                if (filters is not None) and not applyFilter(packageRef+'/'+name, filters):
+                    continue
                 subPackage = package.findPackage(name)
                 if subPackage is None:
                     subPackage = autosar.package.Package(name)
                     package.appendPackage(subPackage)
-                self.loadXML(subPackage, subPackageXML)
+                self.loadXML(subPackage, subPackageXML, lazy, filters)
+
+    def findElements(self, xmlPackage, packageRef, result):
+        """
+        Appends a (package reference, element name, xmlElement) tuple to result for each element found in xmlPackage and its
+        sub-packages (in document order) without parsing the elements. packageRef is the reference of xmlPackage.
+        """
+        for xmlElement in _elementsPath.findall(xmlPackage):
+            result.append((packageRef, self.parseElementName(xmlElement), xmlElement))
+        subPackagesPath = _subPackagesPathAR3 if self.version < 4.0 else _subPackagesPathAR4
+        for xmlSubPackage in subPackagesPath.findall(xmlPackage):
+            name = parseTextNode(_shortNamePath.find(xmlSubPackage))
+            self.findElements(xmlSubPackage, packageRef+'/'+name, result)
+
+    @staticmethod
+    def parseElementName(xmlElement):
+        """
+        Returns the SHORT-NAME of xmlElement or None
+        """
+        xmlName = _shortNamePath.find(xmlElement)
+        return None if xmlName is None else parseTextNode(xmlName)
+
+    def loadElement(self, package, xmlElement, elementNames):
+        """
+        Parses a single child of <ELEMENTS> using the registered element parsers and appends the result to package.
+        elementNames is the set of element names already present in package, duplicated items are ignored.
+        """
+        if xmlElement.tag in self.switcher:
+            element = self.parseElement(package, xmlElement)
+            if (element is not None) and (element.name not in elementNames):
+                #ignore duplicated items
+                package.append(element)
+                elementNames.add(element.name)
+        else:
+            package.unhandledParser.add(xmlElement.tag)
+
+    def loadElementStub(self, package, xmlElement, elementNames):
+        """
+        Same as loadElement but appends an ElementStub to package instead of parsing xmlElement.
+        The name of the element is read from its SHORT-NAME, the remaining XML is parsed on first access.
+        """
+        if xmlElement.tag not in self.switcher:
+            package.unhandledParser.add(xmlElement.tag)
+            return
+        name = self.parseElementName(xmlElement)
+        if (name is None) or (xmlElement.tag in _eagerTags):
+            self.loadElement(package, xmlElement, elementNames)
+            return
+        if name not in elementNames:
+            #ignore duplicated items
+            package.appendStub(autosar.package.ElementStub(name, xmlElement, self))
+            elementNames.add(name)
+
+    def parseElement(self, package, xmlElement):
+        """
+        Parses a single child of <ELEMENTS> using its registered element parser.
+        Returns the parsed element or None if the parser did not return an element.
+        """
+        parserObject = self.switcher[xmlElement.tag]
+        element = parserObject.parseElement(xmlElement,package)
+        if element is None:
+            print("[PackageParser] No return value: %s"%xmlElement.tag)
+            return None
+        element.parent=package
+        if not isinstance(element,autosar.element.Element):
+            #handleValueError("parse error: %s"%type(element))
+            handleValueError("parse error: %s"%xmlElement.tag)
+            return None
+        return element
@@ -4,13 +4,17 @@ from typing import Optional, Union
 from autosar.base import (AdminData, SpecialDataGroup, SpecialData,
                           SwDataDefPropsConditional, SwCalprmAxis,
                           SwAxisIndividual, SwAxisGrouped,
-                          SwPointerTargetProps, SwTextProps, SymbolProps)
+                          SwPointerTargetProps, SwTextProps, SymbolProps, XMLPath)
 import autosar.element
-import xml
+import sys
 from functools import wraps
 
 from autosar.util.errorHandler import handleNotImplementedError, handleValueError
 
+_sdgPath = XMLPath('./SDGS/SDG')
+_l2Path = XMLPath('L-2')
+_l4Path = XMLPath('L-4')
+
 def _parseBoolean(value):
     """
     Parse an autosar boolean value following the xsd spec:
@@ -30,39 +34,20 @@ def parseElementUUID(parser_func):
     """
     Decorator that adds parsing of the UUID field for autosar.element.Element
 
-    The decorator should be added to methods that parse an xml.etree.ElementTree.Element
-    argument and returns a autosar.element.Element. In case the xml element contains
+    The decorator should be added to methods that take the XML element (xml.etree.ElementTree.Element or lxml.etree._Element)
+    as first argument and return an autosar.element.Element. In case the xml element contains
     the UUID attribute, this will be inserted into the Autosar Element.
+    Decorate the method that creates the element, not a parseElement method that only dispatches
+    to it, so that the UUID is read once per element.
     """
     @wraps(parser_func)
-    def parseUUID(*args, **kwargs):
-
-        # call original parser function
-        result = parser_func(*args, **kwargs)
-
-        # if the result is not an Autosar Element, simply return
-        if not isinstance(result, autosar.element.Element):
-            return result
-    
-        # search for an argument of type xml.etree.ElementTree.Element    
-        xmlElementArgs = []
-        for arg in args:
-            if isinstance(arg, xml.etree.ElementTree.Element):
-                xmlElementArgs.append(arg)
-        for _, arg in kwargs.items():
-            if isinstance(arg, xml.etree.ElementTree.Element):
-                xmlElementArgs.append(arg)
-        
-        # if we cannot determine in a unique way which argument to use, just return
-        if len(xmlElementArgs) != 1:
-            return result
-    
-        # retrieve the UUID from the xml element and attach it to the Autosar Element
-        xmlElementArg = xmlElementArgs[0]
-        if 'UUID' in xmlElementArg.attrib:
-            result.uuid = xmlElementArg.attrib['UUID'].lower()
+    def parseUUID(self, xmlElement, *args, **kwargs):
+        result = parser_func(self, xmlElement, *args, **kwargs)
+        if isinstance(result, autosar.element.Element):
+            uuid = xmlElement.get('UUID')
+            if uuid is not None:
+                result.uuid = uuid.lower()
         return result
-
     return parseUUID
 
 class CommonTagsResult:
@@ -107,28 +92,32 @@ class BaseParser:
         """
         A default handler that parses common tags found under most XML elements
         """
-        if xmlElem.tag == 'SHORT-NAME':
-            self.common[-1].name = self.parseTextNode(xmlElem)
-        elif xmlElem.tag == 'ADMIN-DATA':
-            self.common[-1].adminData = self.parseAdminDataNode(xmlElem)
-        elif xmlElem.tag == 'CATEGORY':
-            self.common[-1].category = self.parseTextNode(xmlElem)
-        elif xmlElem.tag == 'DESC':
-            self.common[-1].desc, self.common[-1].desc_attr = self.parseDescDirect(xmlElem)
-        elif xmlElem.tag == 'LONG-NAME':
-            self.common[-1].longName, self.common[-1].longName_attr = self.parseLongNameDirect(xmlElem)
-        elif xmlElem.tag == 'DISPLAY-FORMAT':
-            self.common[-1].displayFormat = None
-        elif xmlElem.tag == 'ANNOTATION':
-            pass #implement later
-        elif xmlElem.tag == 'ANNOTATIONS':
-            pass #implement later
-        elif xmlElem.tag == 'INTRODUCTION':
-            pass #implement later
-        elif xmlElem.tag == 'SHORT-NAME-PATTERN':
-            pass #implement later
+        handlerName = _defaultHandlers.get(xmlElem.tag)
+        if handlerName is not None:
+            getattr(self, handlerName)(xmlElem)
         else:
             handleNotImplementedError(xmlElem.tag)
+
+    def _handleShortName(self, xmlElem):
+        self.common[-1].name = self.parseTextNode(xmlElem)
+
+    def _handleAdminData(self, xmlElem):
+        self.common[-1].adminData = self.parseAdminDataNode(xmlElem)
+
+    def _handleCategory(self, xmlElem):
+        self.common[-1].category = self.parseTextNode(xmlElem)
+
+    def _handleDesc(self, xmlElem):
+        self.common[-1].desc, self.common[-1].desc_attr = self.parseDescDirect(xmlElem)
+
+    def _handleLongName(self, xmlElem):
+        self.common[-1].longName, self.common[-1].longName_attr = self.parseLongNameDirect(xmlElem)
+
+    def _handleDisplayFormat(self, xmlElem):
+        self.common[-1].displayFormat = None
+
+    def _handleLater(self, xmlElem):
+        pass #implement later
     
     def applyDesc(self, obj):
         if self.common[-1].desc is not None:            
@@ -162,16 +151,16 @@ class BaseParser:
             L2Xml = xmlDesc.find('L-4')
             if L2Xml is not None:
                 L2Text=self.parseTextNode(L2Xml)
-                L2Attr=L2Xml.attrib['L']
+                L2Attr=sys.intern(L2Xml.attrib['L'])
                 elem.desc=L2Text
                 elem.descAttr=L2Attr
 
     def parseLongNameDirect(self, xmlLongName):
         assert(xmlLongName.tag == 'LONG-NAME')
-        L2Xml = xmlLongName.find('L-4')
+        L2Xml = _l4Path.find(xmlLongName)
         if L2Xml is not None:
             L2Text=self.parseTextNode(L2Xml)
-            L2Attr=L2Xml.attrib['L']
+            L2Attr=sys.intern(L2Xml.attrib['L'])
             return (L2Text, L2Attr)
         return (None, None)
 
@@ -181,21 +170,28 @@ class BaseParser:
             L2Xml = xmlDesc.find('L-2')
             if L2Xml is not None:
                 L2Text=self.parseTextNode(L2Xml)
-                L2Attr=L2Xml.attrib['L']
+                L2Attr=sys.intern(L2Xml.attrib['L'])
                 elem.desc=L2Text
                 elem.descAttr=L2Attr
 
     def parseDescDirect(self, xmlDesc):
         assert(xmlDesc.tag == 'DESC')
-        L2Xml = xmlDesc.find('L-2')
+        L2Xml = _l2Path.find(xmlDesc)
         if L2Xml is not None:
             L2Text=self.parseTextNode(L2Xml)
-            L2Attr=L2Xml.attrib['L']
+            L2Attr=sys.intern(L2Xml.attrib['L'])
             return (L2Text, L2Attr)
         return (None, None)
 
     def parseTextNode(self, xmlElem):
-        return None if xmlElem is None else xmlElem.text
+        """
+        Returns the text of xmlElem or None. The text is interned (see sys.intern), repeated values such as
+        references, categories and enumeration values then share a single string object.
+        """
+        if xmlElem is None:
+            return None
+        text = xmlElem.text
+        return None if text is None else sys.intern(text)
 
     def parseIntNode(self, xmlElem):
         return None if xmlElem is None else int(xmlElem.text)
@@ -298,14 +294,14 @@ class BaseParser:
 
 
     def parseSpecialDataGroup(self, xmlElem):
-        SDG_GID=xmlElem.attrib['GID']
+        SDG_GID=sys.intern(xmlElem.attrib['GID'])
         specialDataGroup = SpecialDataGroup(SDG_GID, children=[], ref_children=[])
         for xmlChild in xmlElem.findall('./*'):
             if xmlChild.tag == 'SD':
                 SD_GID = None
-                TEXT=xmlChild.text
+                TEXT=self.parseTextNode(xmlChild)
                 try:
-                    SD_GID=xmlChild.attrib['GID']
+                    SD_GID=sys.intern(xmlChild.attrib['GID'])
                 except KeyError: pass
                 specialDataGroup.SD.append(SpecialData(TEXT, SD_GID))
             elif xmlChild.tag == 'SDG':
@@ -323,12 +319,10 @@ class BaseParser:
         if xmlRoot is None: return None
         assert(xmlRoot.tag=='ADMIN-DATA')
         adminData=AdminData()
-        xmlSDGS = xmlRoot.find('./SDGS')
-        if xmlSDGS is not None:
-            for xmlElem in xmlSDGS.findall('./SDG'):
-                specialDataGroup = self.parseSpecialDataGroup(xmlElem)
-                if specialDataGroup is not None:
-                    adminData.specialDataGroups.append(specialDataGroup)
+        for xmlElem in _sdgPath.findall(xmlRoot):
+            specialDataGroup = self.parseSpecialDataGroup(xmlElem)
+            if specialDataGroup is not None:
+                adminData.specialDataGroups.append(specialDataGroup)
         return adminData
 
     def parseSwDataDefProps(self, xmlRoot):
@@ -579,6 +573,21 @@ class BaseParser:
                 handleNotImplementedError(xmlElem.tag)
         return SymbolProps(name, symbol)
             
+
+#handler method names of BaseParser.defaultHandler, looked up on the parser object so that subclasses can override them
+_defaultHandlers = {
+    'SHORT-NAME': '_handleShortName',
+    'ADMIN-DATA': '_handleAdminData',
+    'CATEGORY': '_handleCategory',
+    'DESC': '_handleDesc',
+    'LONG-NAME': '_handleLongName',
+    'DISPLAY-FORMAT': '_handleDisplayFormat',
+    'ANNOTATION': '_handleLater',
+    'ANNOTATIONS': '_handleLater',
+    'INTRODUCTION': '_handleLater',
+    'SHORT-NAME-PATTERN': '_handleLater',
+}
+
 class ElementParser(BaseParser, metaclass=abc.ABCMeta):
     """Parser for ARXML elements"""
 
@@ -28,7 +28,6 @@ class PortInterfacePackageParser(EntityParser):
     def getSupportedTags(self):
         return self.switcher.keys()
 
-    @parseElementUUID
     def parseElement(self, xmlElement, parent = None):
         parseFunc = self.switcher.get(xmlElement.tag)
         if parseFunc is not None:
@@ -206,7 +205,7 @@ class PortInterfacePackageParser(EntityParser):
                     parameter = autosar.element.AutosarDataPrototype(autosar.element.AutosarDataPrototype.Role.Parameter, xmlElemName.text, typeRef, parent=portInterface)
                     if hasAdminData(xmlElem):
                         parameter.adminData=parseAdminDataNode(xmlElem.find('ADMIN-DATA'))
-                    if xmlElem.find('SW-DATA-DEF-PROPS'):
+                    if xmlElem.find('SW-DATA-DEF-PROPS') is not None:
                         for xmlItem in xmlElem.findall('SW-DATA-DEF-PROPS/SW-ADDR-METHOD-REF'):
                             parameter.swAddressMethodRef = self.parseTextNode(xmlItem)
                     portInterface.append(parameter)
@@ -456,7 +455,6 @@ class SoftwareAddressMethodParser(EntityParser):
     def getSupportedTags(self):
         return ['SW-ADDR-METHOD']
 
-    @parseElementUUID
     def parseElement(self, xmlElement, parent = None):
         if xmlElement.tag == 'SW-ADDR-METHOD':
             return self.parseSWAddrMethod(xmlElement, parent)
@@ -10,7 +10,6 @@ class SystemParser(EntityParser):
     def getSupportedTags(self):
         return ['SYSTEM']
 
-    @parseElementUUID
     def parseElement(self, xmlElement, parent = None):
         if xmlElement.tag == 'SYSTEM':
             return self.parseSystem(xmlElement, parent)
@@ -1,13 +1,14 @@
 import autosar.util.dcf
+import autosar.util.cache
 
-def importDcf(filename, external = True):
+def importDcf(filename, external = True, workers = 1, cache = None):
     """
     Convenience method for importing a DCF file into a newly created workspace
     """
     parser = autosar.util.dcf.DcfParser()
     dcf = parser.parse(filename)
     ws = autosar.workspace()
-    dcf.loadReferences(ws, external)
+    dcf.loadReferences(ws, external, workers, cache)
     return ws
 
 def createDcf(ws):
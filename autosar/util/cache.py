@@ -0,0 +1,142 @@
+import hashlib
+import os
+import pickle
+import tempfile
+
+_libraryFingerprint = None
+
+def libraryFingerprint():
+    """
+    Returns a hash over the names, sizes and modification times of the source files of the autosar package.
+    Any change to the library (including an upgrade) therefore results in new cache keys.
+    """
+    global _libraryFingerprint
+    if _libraryFingerprint is None:
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        h = hashlib.sha256()
+        h.update(('%d'%pickle.HIGHEST_PROTOCOL).encode())
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for name in sorted(filenames):
+                if name.endswith('.py'):
+                    path = os.path.join(dirpath, name)
+                    st = os.stat(path)
+                    h.update(('%s:%d:%d\n'%(os.path.relpath(path, root), st.st_size, st.st_mtime_ns)).encode())
+        _libraryFingerprint = h.hexdigest()
+    return _libraryFingerprint
+
+class WorkspaceCache:
+    """
+    On-disk cache of parsed ARXML files, used by Workspace.loadXML and Workspace.loadXMLFiles (cache argument).
+
+    Each entry holds the pickled packages of one ARXML file. Entries are keyed on the content hash of the file,
+    the library fingerprint and the set of element parsers registered in the workspace.
+    When the total size of the cache exceeds maxSize (in bytes), least recently used entries are removed.
+    Entries are unpickled when loaded, only use a cache directory that is not writable by untrusted users.
+    """
+    suffix = '.pickle'
+
+    def __init__(self, directory, maxSize = 256*1024*1024):
+        self.directory = directory
+        self.maxSize = maxSize
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, filename, parserSignature = ''):
+        """
+        Returns the cache key of filename. parserSignature describes the element parsers used to parse the file.
+        """
+        h = hashlib.sha256()
+        with open(filename, 'rb') as fp:
+            for chunk in iter(lambda: fp.read(1024*1024), b''):
+                h.update(chunk)
+        h.update(libraryFingerprint().encode())
+        h.update(parserSignature.encode())
+        return '%s-%s'%(self._pathPrefix(filename), h.hexdigest())
+
+    def get(self, key):
+        """
+        Returns the data stored under key or None if it is not in the cache
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as fp:
+                data = fp.read()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path) #marks entry as recently used
+        except OSError:
+            pass
+        return data
+
+    def put(self, key, data):
+        """
+        Stores data under key, then evicts least recently used entries until the cache fits in maxSize
+        """
+        fd, tmpPath = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                fp.write(data)
+            os.replace(tmpPath, self._path(key))
+        except BaseException:
+            os.remove(tmpPath)
+            raise
+        self.evict()
+
+    def remove(self, key):
+        """
+        Removes a single entry
+        """
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def invalidate(self, filename = None):
+        """
+        Removes all entries created from filename. When filename is None the complete cache is cleared.
+        """
+        prefix = '' if filename is None else self._pathPrefix(filename)+'-'
+        for name, _, _ in self._entries():
+            if name.startswith(prefix):
+                self.remove(name[:-len(self.suffix)])
+
+    def size(self):
+        """
+        Returns the total size in bytes of all cache entries
+        """
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """
+        Removes least recently used entries until the total size is below maxSize
+        """
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for name, size, _ in sorted(entries, key=lambda x: x[2]):
+            if total <= self.maxSize:
+                break
+            self.remove(name[:-len(self.suffix)])
+            total -= size
+
+    def _entries(self):
+        """
+        Returns a list of (name, size, mtime) tuples
+        """
+        result = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(self.suffix):
+                    try:
+                        st = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    result.append((entry.name, st.st_size, st.st_mtime_ns))
+        return result
+
+    def _path(self, key):
+        return os.path.join(self.directory, key+self.suffix)
+
+    @staticmethod
+    def _pathPrefix(filename):
+        return hashlib.sha256(os.path.abspath(filename).encode()).hexdigest()[:16]
@@ -178,7 +178,7 @@ class Dcf(XMLWriterSimple):
         if os.path.sep == '/': #are we running in cygwin/Linux?
             elem['path'] = elem['path'].replace(r'\\','/')
 
-    def loadReferences(self, ws = None, external = True):
+    def loadReferences(self, ws = None, external = True, workers = 1, cache = None):
         """
         Loads ARXML from referenced files into an AUTOSAR workspace.
         Returns the workspace object.
@@ -186,13 +186,14 @@ class Dcf(XMLWriterSimple):
 
         * ws: Workspace object where ARXML will be loaded
         * external: If True it will recursively load externally referenced DCF files (DCF inside DCF)
+        * workers: Number of worker processes used for parsing ARXML files (None means number of CPUs)
+        * cache: Optional autosar.util.cache.WorkspaceCache used for restoring previously parsed ARXML files
 
         """
         parser = DcfParser()
         if ws is None:
             ws = autosar.workspace()
-        for xml_path in [x['path'] for x in self.file_ref ]:
-            ws.loadXML(xml_path)
+        ws.loadXMLFiles([x['path'] for x in self.file_ref ], workers=workers, cache=cache)
         if external:
             for external_dcf in self.external_file_ref:
                 child_path = external_dcf['path']
@@ -200,7 +201,7 @@ class Dcf(XMLWriterSimple):
                     root, ext = os.path.splitext(child_path)
                     if ext == '.dcf':
                         child_dcf = parser.parse(child_path)
-                        child_dcf.loadReferences(ws)
+                        child_dcf.loadReferences(ws, workers=workers, cache=cache)
                 else:
                     print("No such file: "+child_path, file=sys.stderr)
         return ws
@@ -243,6 +244,7 @@ class Dcf(XMLWriterSimple):
         raise NotImplementedError("single XML")
 
     def save_xml_from_file_map(self, dest_dir, xml_file_map, force):
+        file_map = {}
         for key in xml_file_map.keys():
             file_name = key
             if not file_name.lower().endswith('.arxml'):
@@ -250,7 +252,8 @@ class Dcf(XMLWriterSimple):
             dest_file = os.path.join(dest_dir, file_name)
             if force or not os.path.isfile(dest_file):
                 elem = xml_file_map[key]
-                self.ws.saveXML(dest_file, filters=elem['filters'])
+                file_map[dest_file] = elem['filters']
+        self.ws.saveXMLSplit(file_map)
 
     def create_default_file_map(self):
         dataTypesPackage = self.ws.findRolePackage('DataType')
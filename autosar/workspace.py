@@ -1,12 +1,21 @@
+import autosar.element
 import autosar.package
 import autosar.parser.package_parser
 import autosar.writer
-from autosar.base import (parseXMLFile, getXMLNamespace, removeNamespace, parseAutosarVersionAndSchema, prepareFilter, parseVersionString)
+from autosar.base import (parseXMLFileStripNamespace, DefaultNamespaceReader, iterParseXMLSource, getXMLNamespace, removeNamespace, parseAutosarVersionAndSchema, prepareFilter, applyFilter, compileFilters, parseVersionString)
 import json
 import os
 import ntpath
 import collections
+import contextlib
+import copy
+import concurrent.futures
+import itertools
+import gc
+import io
+import pickle
 import re
+import weakref
 import xml.etree.ElementTree as ElementTree
 #default parsers
 from autosar.parser.datatype_parser import (DataTypeParser, DataTypeSemanticsParser, DataTypeUnitsParser)
@@ -28,6 +37,10 @@ from autosar.writer.behavior_writer import XMLBehaviorWriter, CodeBehaviorWriter
 from autosar.writer.signal_writer import SignalWriter
 from autosar.writer.mode_writer import XMLModeWriter
 
+_defaultElementParsers = (DataTypeParser, DataTypeSemanticsParser, DataTypeUnitsParser, PortInterfacePackageParser,
+                          SoftwareAddressMethodParser, ModeDeclarationParser, ConstantParser, ComponentTypeParser,
+                          BehaviorParser, SystemParser, SignalParser, SwcImplementationParser, EcuConfigurationParser)
+
 _validWSRoles = ['DataType', 'Constant', 'PortInterface', 'ComponentType', 'ModeDclrGroup', 'CompuMethod', 'Unit',
                  'BaseType', 'DataConstraint']
 
@@ -81,6 +94,16 @@ class Workspace:
         self.roles = PackageRoles()
         self.roleStack = collections.deque() #stack of PackageRoles
         self.map = {'packages': {}}
+        self.refMap = {'elements': {}, 'packages': {}} #absolute reference -> package element (or ElementStub) / package, see find
+        self.referrerMap = {} #target reference -> list of (element reference, referrer) tuples, see referrers
+        self._referenceTargets = None #element reference -> set of target references, None until referrers is first called
+        self._pendingReferences = {} #element reference -> package element (or ElementStub) not yet scanned by referrers
+        self.typeMap = {} #element class -> {element reference: package element}, see elementsOfType
+        self.roleMap = {} #package role -> list of packages having that role, see findRolePackage
+        self._stubs = {} #element reference -> ElementStub not parsed yet, see elementsOfType
+        self.linkMap = {} #absolute reference -> weak reference to the object found by find, see resolve
+        self._linkOwners = {} #package element (or package) reference -> set of references in linkMap found through it
+        self.fileMap = {} #absolute path of loaded ARXML file -> {'packages': set of refs, 'elements': set of refs}
         self.profile = WorkspaceProfile()
         self.unhandledParser = set() # [PackageParser] unhandled:
         self.unhandledWriter =set() #[PackageWriter] Unhandled
@@ -156,19 +179,35 @@ class Workspace:
         roles = self.roleStack.pop()
         self.roles.update(roles)
 
-    def _openXML(self, xmlroot: ElementTree.ElementTree):
-        namespace = getXMLNamespace(xmlroot)
+    def _openXML(self, xmlroot: ElementTree.ElementTree, namespace=None):
+        """
+        Opens an XML root element. When namespace is None the tags of xmlroot are expected to be qualified
+        with the AUTOSAR namespace, which is then removed in place.
+        """
+        if namespace is None:
+            namespace = getXMLNamespace(xmlroot)
+            assert (namespace is not None)
+            removeNamespace(xmlroot,namespace)
+        self._initFromXMLRoot(xmlroot)
+        self.xmlroot = xmlroot
+
+    def _initFromXMLRoot(self, xmlroot):
+        """
+        Sets up version, schema and package parser from the attributes of the root AUTOSAR tag
+        """
+        self._initVersion(parseAutosarVersionAndSchema(xmlroot))
 
-        assert (namespace is not None)
-        (major, minor, patch, release, schema) = parseAutosarVersionAndSchema(xmlroot)
-        removeNamespace(xmlroot,namespace)
+    def _initVersion(self, versionInfo):
+        """
+        Sets up version, schema and package parser from a (major, minor, patch, release, schema) tuple
+        """
+        (major, minor, patch, release, schema) = versionInfo
         self.version=float('%s.%s'%(major,minor))
         self.major = major
         self.minor = minor
         self.patch = patch
         self.release = release
         self.schema = schema
-        self.xmlroot = xmlroot
         if self.version < 3.0:
             raise NotImplementedError("Version below 3.0 is not supported")
         if self.packageParser is None:
@@ -176,69 +215,466 @@ class Workspace:
         self._registerDefaultElementParsers(self.packageParser)
     
     def openXML(self, filename):
-        xmlroot = parseXMLFile(filename)
-        self._openXML(xmlroot)
+        (xmlroot, namespace) = parseXMLFileStripNamespace(filename)
+        assert (namespace is not None)
+        self._openXML(xmlroot, namespace)
     
     def openParsedXML(self, xml: ElementTree.ElementTree):
         self._openXML(xml.getroot())
 
-    def _loadXML(self, roles=None):
+    def _loadXML(self, roles=None, loadPackages=True, lazy=False, filters=None, elementTypes=None):
         global _validWSRoles
-        self.loadPackage('*')
+        if loadPackages:
+            self.loadPackage('*', lazy=lazy, filters=filters, elementTypes=elementTypes)
         if roles is not None:
             if not isinstance(roles, collections.abc.Mapping):
                 raise ValueError('roles parameter must be a dictionary or Mapping')
             for ref,role in roles.items():
                 self.setRole(ref,role)
     
-    def loadXML(self, filename, roles=None):
+    def loadXML(self, filename, roles=None, streaming=False, lazy=False, cache=None, filters=None, elementTypes=None):
+        """
+        Loads all packages from an ARXML file into the workspace.
+
+        When streaming is True the file is read incrementally using iterparse. Each element below
+        AR-PACKAGE/ELEMENTS is parsed as soon as its end tag has been read and is then discarded, keeping
+        peak memory bounded by the largest single element instead of the whole document.
+        In streaming mode no xmlroot is kept, meaning listPackages and loadPackage cannot be used afterwards.
+
+        When lazy is True only the package structure and element names are read. Each element keeps its
+        XML node and is parsed on first access through find (or when the elements of its package are iterated).
+        Lazy mode cannot be combined with streaming.
+
+        cache is an optional autosar.util.cache.WorkspaceCache. When the cache holds an entry for the current
+        content of filename the packages are restored from it without any XML parsing, otherwise the file is
+        parsed (using streaming when requested) and the result is stored in the cache.
+        In both cases no xmlroot is kept. Lazy mode cannot be combined with a cache.
+
+        filters and elementTypes select what is loaded, see loadPackage. They cannot be combined with streaming or a cache.
+        """
         global _validWSRoles
-        self.openXML(filename)
-        self._loadXML(roles)
+        if streaming and lazy:
+            raise ValueError('lazy loading cannot be combined with streaming')
+        if (filters is not None or elementTypes is not None) and (streaming or cache is not None):
+            raise ValueError('filters and elementTypes cannot be combined with streaming or a cache')
+        snapshot = self._packageSnapshot()
+        if cache is not None:
+            if lazy:
+                raise ValueError('lazy loading cannot be combined with a cache')
+            self._loadXMLCached(filename, cache, streaming)
+            self._loadXML(roles, loadPackages=False)
+        elif streaming:
+            self._loadXMLStreaming(filename)
+            self._loadXML(roles, loadPackages=False)
+        else:
+            self.openXML(filename)
+            self._loadXML(roles, lazy=lazy, filters=filters, elementTypes=elementTypes)
+        self._recordFile(filename, snapshot)
+
+    def loadXMLFiles(self, filenames, roles=None, workers=None, cache=None):
+        """
+        Loads multiple ARXML files into the workspace.
+
+        The files are parsed in a pool of worker processes (workers defaults to the number of CPUs).
+        Packages returned by the workers are merged into this workspace in the same order as filenames,
+        giving the same packages as calling loadXML once for each file.
+        With workers=1 the files are loaded in the current process.
+        No xmlroot is kept, whatever the number of workers or files, meaning listPackages and loadPackage
+        cannot be used afterwards.
+        cache is an optional autosar.util.cache.WorkspaceCache, only files missing in the cache are parsed.
+        """
+        filenames = list(filenames)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 1 or len(filenames) <= 1:
+            for filename in filenames:
+                self.loadXML(filename, cache=cache)
+        else:
+            results = [None]*len(filenames)
+            if cache is not None:
+                keys = [cache.key(filename, self._parserSignature(filename)) for filename in filenames]
+                results = [cache.get(key) for key in keys]
+            missing = [i for i, data in enumerate(results) if data is None]
+            if len(missing) > 0:
+                with concurrent.futures.ProcessPoolExecutor(max_workers=min(workers, len(missing))) as executor:
+                    missingFiles = [filenames[i] for i in missing]
+                    for i, data in zip(missing, executor.map(_loadXMLWorker, missingFiles, itertools.repeat(self.packageParser))):
+                        results[i] = data
+                        if cache is not None:
+                            cache.put(keys[i], data)
+            for filename, data in zip(filenames, results):
+                snapshot = self._packageSnapshot()
+                self._mergeLoadResult(_unpickleWorkerResult(data))
+                self._recordFile(filename, snapshot)
+        self.xmlroot = None
+        self._loadXML(roles, loadPackages=False)
+
+    def _loadSelectedElements(self, xmlPackages, elementTypes, filters, lazy):
+        """
+        Loads elements with a tag in elementTypes (and matching filters) and all elements they reference from the
+        (name, xmlPackage) tuples in xmlPackages. Elements are loaded in document order.
+        Returns the list of created top-level packages.
+        """
+        xmlElements = [] #(package ref, element name, xmlElement) in document order
+        for name, xmlPackage in xmlPackages:
+            self.packageParser.findElements(xmlPackage, '/'+name, xmlElements)
+        index = {}
+        for i, (packageRef, name, xmlElement) in enumerate(xmlElements):
+            if name is not None:
+                index.setdefault(packageRef+'/'+name, i)
+        selected = set()
+        pending = []
+        for i, (packageRef, name, xmlElement) in enumerate(xmlElements):
+            if (name is not None) and (xmlElement.tag in elementTypes) and ((filters is None) or applyFilter(packageRef+'/'+name, filters)):
+                selected.add(i)
+                pending.append(xmlElement)
+        while len(pending) > 0:
+            xmlElement = pending.pop()
+            for xmlNode in xmlElement.iter():
+                if xmlNode.get('DEST') is None or xmlNode.text is None:
+                    continue
+                #the referenced element is identified by the shortest prefix of the reference found in index
+                parts = xmlNode.text.strip().split('/')
+                for j in range(2, len(parts)+1):
+                    i = index.get('/'.join(parts[:j]))
+                    if i is not None:
+                        if i not in selected:
+                            selected.add(i)
+                            pending.append(xmlElements[i][2])
+                        break
+        result = []
+        elementNames = {} #package -> set of element names
+        loadElement = self.packageParser.loadElementStub if lazy else self.packageParser.loadElement
+        for i in sorted(selected):
+            (packageRef, name, xmlElement) = xmlElements[i]
+            package = self._findPackage(packageRef)
+            if package is None:
+                numPackages = len(self.packages)
+                package = self._createPackagePath(packageRef)
+                result.extend(self.packages[numPackages:])
+            names = elementNames.get(package)
+            if names is None:
+                names = elementNames[package] = set(package.map['elements'])
+            loadElement(package, xmlElement, names)
+        for package in self.packages:
+            self.unhandledParser = self.unhandledParser.union(package.unhandledParser)
+        return result
+
+    def reloadXML(self, filename, roles=None):
+        """
+        Reloads an ARXML file that was previously loaded with loadXML or loadXMLFiles and applies only what has changed:
+        elements with unchanged content are kept (same object), changed elements are replaced, new elements are inserted
+        and elements no longer found in the file are deleted. Packages created by the file are deleted when they become empty.
+        The elements of the file keep the order they have in the file, as when the file is loaded again.
+        Only elements originating from filename are modified, see fileMap.
+        Returns a dictionary with lists of references to the 'added', 'changed' and 'removed' elements.
+        """
+        origin = self.fileMap.get(os.path.abspath(filename))
+        if origin is None:
+            raise KeyError('file not loaded: '+filename)
+        (versionInfo, packages, unhandledParser) = _loadXMLDetached(filename, self.packageParser)
+        self._initVersion(versionInfo)
+        newPackages = [] #package refs in document order
+        newElements = collections.OrderedDict() #element ref -> (package ref, element)
+        for package in packages:
+            _collectPackageContent(package, '/'+package.name, newPackages, newElements)
+        result = {'added': [], 'changed': [], 'removed': []}
+        for packageRef in newPackages:
+            self._createPackagePath(packageRef, origin)
+        previous = {} #package ref -> name of the element preceding the current one in the file
+        for ref, (packageRef, elem) in newElements.items():
+            package = self._findPackage(packageRef)
+            oldElem = package.find(elem.name)
+            previousName = previous.get(packageRef)
+            previous[packageRef] = elem.name
+            if not isinstance(oldElem, autosar.element.Element):
+                if elem.name in package.map['elements']:
+                    continue #name is taken by an element that could not be parsed
+                i = _reloadPosition(package, packageRef, previousName, origin)
+                package.append(elem)
+                if i < len(package.elements)-1:
+                    package.elements.insert(i, package.elements.pop())
+                origin['elements'].add(ref)
+                result['added'].append(ref)
+            elif ref in origin['elements']:
+                if _elementFingerprint(oldElem) != _elementFingerprint(elem):
+                    i = package.index('elements', elem.name)
+                    package.elements[i] = elem
+                    package.map['elements'][elem.name] = elem
+                    self._indexElement(ref, elem)
+                    elem.parent = package
+                    oldElem.parent = None
+                    result['changed'].append(ref)
+            #else: element is owned by another file, duplicated items are ignored
+        for ref in sorted(origin['elements'] - set(newElements)):
+            (packageRef, _, name) = ref.rpartition('/')
+            package = self._findPackage(packageRef)
+            if (package is not None) and (name in package.map['elements']):
+                package.delete(name)
+                result['removed'].append(ref)
+            origin['elements'].discard(ref)
+        for packageRef in set(packageRef for (packageRef, _) in newElements.values()):
+            _sortFileElements(self._findPackage(packageRef), packageRef, [elem.name for (x, elem) in newElements.values() if x == packageRef], origin)
+        for packageRef in sorted(origin['packages'] - set(newPackages), key=len, reverse=True):
+            package = self._findPackage(packageRef)
+            if (package is not None) and (len(package.map['elements']) == 0) and (len(package.subPackages) == 0):
+                parent = package.parent
+                siblings = parent.packages if parent is self else parent.subPackages
+                siblings.remove(package)
+                del parent.map['packages'][package.name]
+                self._unindexPackage(package, packageRef)
+                package.parent = None
+            origin['packages'].discard(packageRef)
+        self.unhandledParser = self.unhandledParser.union(unhandledParser)
+        self._loadXML(roles, loadPackages=False)
+        return result
+
+    def _findPackage(self, ref):
+        """
+        Returns the package with the absolute reference ref or None. Unlike find, elements are never returned.
+        """
+        names = ref[1:].split('/')
+        package = self.map['packages'].get(names[0])
+        for name in names[1:]:
+            if package is None:
+                break
+            package = package.map['packages'].get(name)
+        return package
+
+    def _createPackagePath(self, ref, origin=None):
+        """
+        Creates the package ref (and its parents) unless it already exists and returns it.
+        References of created packages are added to origin (see fileMap).
+        """
+        parent = self
+        packageRef = ''
+        for name in ref[1:].split('/'):
+            packageRef += '/'+name
+            package = parent.map['packages'].get(name)
+            if package is None:
+                package = autosar.package.Package(name)
+                if parent is self:
+                    self.append(package)
+                else:
+                    parent.appendPackage(package)
+                if origin is not None:
+                    origin['packages'].add(packageRef)
+            parent = package
+        return parent
+
+    def _packageSnapshot(self):
+        """
+        Returns the number of packages and, for each package, its number of elements and sub-packages.
+        Used by _recordFile to find what a load has added to the workspace.
+        """
+        counts = {}
+        stack = list(self.packages)
+        while len(stack) > 0:
+            package = stack.pop()
+            counts[id(package)] = (len(package._elements), len(package.subPackages))
+            stack.extend(package.subPackages)
+        return (len(self.packages), counts)
+
+    def _recordFile(self, filename, snapshot):
+        """
+        Records the packages and elements added since snapshot as originating from filename (see fileMap)
+        """
+        (numPackages, counts) = snapshot
+        origin = self.fileMap.setdefault(os.path.abspath(filename), {'packages': set(), 'elements': set()})
+        for i, package in enumerate(self.packages):
+            _recordPackageContent(package, '/'+package.name, counts, i >= numPackages, origin)
+
+    def _loadXMLCached(self, filename, cache, streaming):
+        key = cache.key(filename, self._parserSignature(filename))
+        data = cache.get(key)
+        result = None
+        if data is not None:
+            try:
+                result = _unpickleWorkerResult(data)
+            except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+                cache.remove(key) #corrupt or outdated entry
+        if result is None:
+            result = _loadXMLDetached(filename, self.packageParser, streaming)
+            cache.put(key, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        self._mergeLoadResult(result)
+        self.xmlroot = None
+
+    def _mergeLoadResult(self, result):
+        """
+        Merges a (versionInfo, packages, unhandledParser) tuple returned by _loadXMLDetached into the workspace
+        """
+        (versionInfo, packages, unhandledParser) = result
+        self._initVersion(versionInfo)
+        for package in packages:
+            existingPackage = self.map['packages'].get(package.name)
+            if existingPackage is None:
+                self.append(package)
+            else:
+                self._mergePackage(existingPackage, package)
+        self.unhandledParser = self.unhandledParser.union(unhandledParser)
+
+    def _parserSignature(self, filename):
+        """
+        Describes the element parsers used by loadXML to parse filename, used as part of the cache key by WorkspaceCache.
+        The signature is the same whether or not the package parser has been created yet: a new package parser
+        gets the version of the first file and the default element parsers are always registered (see _initVersion).
+        """
+        if self.packageParser is None:
+            version = _readXMLVersion(filename)
+            parserTypes = {}
+        else:
+            version = self.packageParser.version
+            parserTypes = {name: type(x) for (name, x) in self.packageParser.registeredParsers.items()}
+        for parserType in _defaultElementParsers:
+            parserTypes.setdefault(parserType.__name__, parserType)
+        names = sorted('%s.%s'%(x.__module__, x.__qualname__) for x in parserTypes.values())
+        return '%s:%s'%(version, ','.join(names))
+
+    def _mergePackage(self, package, other):
+        """
+        Moves elements and sub-packages from other into package.
+        Follows the rules of PackageParser.loadXML when a package is loaded again from another file:
+        elements with already existing names are ignored and (AUTOSAR 4) existing sub-packages are reused.
+        """
+        for elem in other.elements:
+            if elem.name not in package.map['elements']:
+                package.append(elem)
+        for subPackage in other.subPackages:
+            existingPackage = package.map['packages'].get(subPackage.name) if self.version >= 4.0 else None
+            if existingPackage is None:
+                package.appendPackage(subPackage)
+            else:
+                self._mergePackage(existingPackage, subPackage)
+        package.unhandledParser.update(other.unhandledParser)
+
+    def _loadXMLStreaming(self, filename):
+        with open(filename, 'rb') as fp:
+            reader = DefaultNamespaceReader(fp)
+            self._loadXMLStream(iterParseXMLSource(reader, ('start', 'end')), reader)
+
+    def _loadXMLStream(self, context, reader):
+        _, xmlroot = next(context)
+        ns = None #set when the namespace could not be removed by the reader
+        if reader.namespace is None:
+            namespace = getXMLNamespace(xmlroot)
+            assert (namespace is not None)
+            ns = '{%s}'%namespace
+            nsl = len(ns)
+            xmlroot.tag = xmlroot.tag[nsl:]
+        self._initFromXMLRoot(xmlroot)
+        self.xmlroot = None
+        xmlStack = [xmlroot] #currently open XML elements
+        packageStack = [] #one (package, elementNames) entry for each open AR-PACKAGE
+        for event, xmlElem in context:
+            if event == 'start':
+                if (ns is not None) and xmlElem.tag.startswith(ns):
+                    xmlElem.tag = xmlElem.tag[nsl:]
+                if xmlElem.tag == 'AR-PACKAGE':
+                    packageStack.append(None)
+                xmlStack.append(xmlElem)
+                continue
+            xmlStack.pop()
+            if len(xmlStack) == 0:
+                break #end of root element
+            xmlParent = xmlStack[-1]
+            if xmlElem.tag == 'SHORT-NAME' and xmlParent.tag == 'AR-PACKAGE':
+                packageStack[-1] = self._openStreamedPackage(xmlElem.text, packageStack)
+            elif xmlParent.tag == 'ELEMENTS' and xmlStack[-2].tag == 'AR-PACKAGE':
+                (package, elementNames) = packageStack[-1]
+                self.packageParser.loadElement(package, xmlElem, elementNames)
+                xmlParent.remove(xmlElem)
+            elif xmlElem.tag == 'AR-PACKAGE':
+                (package, _) = packageStack.pop()
+                if len(packageStack) == 0:
+                    self.unhandledParser = self.unhandledParser.union(package.unhandledParser)
+                xmlParent.remove(xmlElem)
+        if (self.unhandledParser):
+            print("[PackageParser] unhandled: %s" % (", ".join(self.unhandledParser)))
+
+    def _openStreamedPackage(self, name, packageStack):
+        """
+        Returns (package, elementNames) for a package whose SHORT-NAME was just read by the streaming loader.
+        Packages are created or reused following the same rules as loadPackage and PackageParser.loadXML.
+        """
+        if len(packageStack) == 1:
+            package = self.find(name)
+            if package is None:
+                package = autosar.package.Package(name)
+                self.append(package)
+        else:
+            parentPackage = packageStack[-2][0]
+            package = parentPackage.findPackage(name) if self.version >= 4.0 else None
+            if package is None:
+                package = autosar.package.Package(name)
+                parentPackage.appendPackage(package)
+        return (package, set(package.map['elements']))
 
     def loadParsedXML(self, xml: ElementTree.ElementTree, roles=None):
         global _validWSRoles
         self.openParsedXML(xml)
         self._loadXML(roles)
 
-    def loadPackage(self, packagename, role=None):
+    def loadPackage(self, packagename, role=None, lazy=False, filters=None, elementTypes=None):
+        """
+        Loads the top-level package packagename ('*' for all packages) from the XML file opened with openXML.
+
+        filters is an optional reference filter (or list of filters) using the same format as saveXML.
+        Packages and elements not matching any filter are skipped without being parsed.
+
+        elementTypes is an optional collection of XML tags (e.g. 'APPLICATION-SW-COMPONENT-TYPE'). Only elements of these
+        types (matching filters) are loaded, together with all elements of the same file they reference, directly or
+        indirectly. References are found from the DEST attribute of XML reference nodes, also outside filters.
+        Only the packages needed to hold the loaded elements are created.
+        """
         found=False
         result=[]
         if self.xmlroot is None:
             raise ValueError("xmlroot is None, did you call loadXML() or openXML()?")
+        if isinstance(filters,str): filters=[filters]
+        if filters is not None:
+            filters = [prepareFilter(x) for x in filters]
+        selection = None if elementTypes is None else []
         if self.version >= 3.0 and self.version < 4.0:
-            if self.xmlroot.find('TOP-LEVEL-PACKAGES'):
+            if self.xmlroot.find('TOP-LEVEL-PACKAGES') is not None:
                 for xmlPackage in self.xmlroot.findall('./TOP-LEVEL-PACKAGES/AR-PACKAGE'):
-                    if self._loadPackageInternal(result, xmlPackage, packagename, role):
+                    if self._loadPackageInternal(result, xmlPackage, packagename, role, lazy, filters, selection):
                         found = True
 
         elif self.version>=4.0:
-            if self.xmlroot.find('AR-PACKAGES'):
+            if self.xmlroot.find('AR-PACKAGES') is not None:
                 for xmlPackage in self.xmlroot.findall('.AR-PACKAGES/AR-PACKAGE'):
-                    if self._loadPackageInternal(result, xmlPackage, packagename, role):
+                    if self._loadPackageInternal(result, xmlPackage, packagename, role, lazy, filters, selection):
                         found = True
 
         else:
             raise NotImplementedError('Version %s of ARXML not supported'%self.version)
         if found==False and packagename != '*':
             raise KeyError('package not found: '+packagename)
+        if selection is not None:
+            result.extend(self._loadSelectedElements(selection, set(elementTypes), filters, lazy))
+            if (packagename != '*') and (role is not None) and (self.find(packagename) is not None):
+                self.setRole('/'+packagename, role)
 
         if (self.unhandledParser):
             print("[PackageParser] unhandled: %s" % (", ".join(self.unhandledParser)))
         return result
 
-    def _loadPackageInternal(self, result, xmlPackage, packagename, role):
+    def _loadPackageInternal(self, result, xmlPackage, packagename, role, lazy, filters=None, selection=None):
         name = xmlPackage.find("./SHORT-NAME").text
         found = False
         if packagename=='*' or packagename==name:
             found=True
+            if selection is not None:
+                selection.append((name, xmlPackage)) #loaded by _loadSelectedElements
+                return found
+            if (filters is not None) and not applyFilter('/'+name, filters):
+                return found
             package = self.find(name)
             if package is None:
-                package = autosar.package.Package(name, parent=self)
-                self.packages.append(package)
+                package = autosar.package.Package(name)
+                self.append(package)
                 result.append(package)
-                self.map['packages'][name] = package
-            self.packageParser.loadXML(package,xmlPackage)
+            self.packageParser.loadXML(package,xmlPackage,lazy,filters)
             self.unhandledParser = self.unhandledParser.union(package.unhandledParser)
             if (packagename==name) and (role is not None):
                 self.setRole(package.ref, role)
@@ -253,39 +689,344 @@ class Workspace:
             if self.roles[role] is not None:
                 ref=self.roles[role]+'/'+ref #appends the role packet name in front of ref
 
-        if ref[0]=='/': ref=ref[1:] #removes initial '/' if it exists
-        ref = ref.partition('/')
-        if ref[0] in self.map['packages']:
-            pkg = self.map['packages'][ref[0]]
-            if len(ref[2])>0:
-                return pkg.find(ref[2])
-            return pkg
+        if ref[0]!='/': ref='/'+ref
+        elem = self.refMap['elements'].get(ref)
+        if elem is None:
+            elem = self.refMap['packages'].get(ref)
+            if elem is None:
+                return self._findNested(ref)
+        elif isinstance(elem, autosar.package.ElementStub):
+            elem = elem.parent._loadStub(elem)
+        return elem
+
+    def _findNested(self, ref):
+        """
+        Finds ref, which is not in refMap, from the closest parent element found in refMap (using its find method)
+        """
+        (prefix, _, rest) = ref.rpartition('/')
+        while len(prefix) > 0:
+            elem = self.refMap['elements'].get(prefix)
+            if elem is not None:
+                if isinstance(elem, autosar.package.ElementStub):
+                    elem = elem.parent._loadStub(elem)
+                if (elem is None) or (len(rest) == 0):
+                    return elem
+                return elem.find(rest) if hasattr(elem, 'find') else None
+            package = self.refMap['packages'].get(prefix)
+            if package is not None:
+                return package if len(rest) == 0 else None
+            (prefix, _, name) = prefix.rpartition('/')
+            rest = name+'/'+rest
         return None
 
-    def findall(self,ref):
+    def _indexPackage(self, package, ref):
         """
-        experimental find-method that has some rudimentary support for globs.
+        Adds package and its content to refMap, ref is the absolute reference of package
         """
-        if ref is None: return None
-        if ref[0]=='/': ref=ref[1:] #removes initial '/' if it exists
-        ref = ref.partition('/')
-        if ref[0]=='*' and len(ref[2])==0:
-            result=list(self.packages)
+        self.refMap['packages'][ref] = package
+        self._indexRole(package)
+        for name, elem in package.map['elements'].items():
+            self._indexElement(ref+'/'+name, elem)
+        for name, subPackage in package.map['packages'].items():
+            self._indexPackage(subPackage, ref+'/'+name)
+
+    def _unindexPackage(self, package, ref):
+        """
+        Removes package and its content from refMap
+        """
+        if self.refMap['packages'].get(ref) is package:
+            del self.refMap['packages'][ref]
+        self._unindexRole(package)
+        self._unlink(ref)
+        for name in package.map['elements']:
+            self._unindexElement(ref+'/'+name)
+        for name, subPackage in package.map['packages'].items():
+            self._unindexPackage(subPackage, ref+'/'+name)
+
+    def _indexElement(self, ref, elem):
+        """
+        Adds (or replaces) the package element elem to refMap, ref is the absolute reference of elem
+        """
+        self._unindexType(ref)
+        self._unlink(ref)
+        self.refMap['elements'][ref] = elem
+        if isinstance(elem, autosar.package.ElementStub):
+            self._stubs[ref] = elem
         else:
-            result=[]
-            for pkg in self.packages:
-                if pkg.name == ref[0] or ref[0]=='*':
-                    if len(ref[2])>0:
-                        result.extend(pkg.findall(ref[2]))
-                    else:
-                        result.append(pkg)
+            self.typeMap.setdefault(type(elem), {})[ref] = elem
+        if self._referenceTargets is not None:
+            self._unindexReferences(ref)
+            self._pendingReferences[ref] = elem
+
+    def _unindexElement(self, ref):
+        """
+        Removes the package element referenced by ref from refMap and referrerMap
+        """
+        self._unindexType(ref)
+        self._unlink(ref)
+        self.refMap['elements'].pop(ref, None)
+        if self._referenceTargets is not None:
+            self._unindexReferences(ref)
+            self._pendingReferences.pop(ref, None)
+
+    def _unindexType(self, ref):
+        """
+        Removes the package element referenced by ref from typeMap
+        """
+        elem = self.refMap['elements'].get(ref)
+        if isinstance(elem, autosar.package.ElementStub):
+            self._stubs.pop(ref, None)
+        elif elem is not None:
+            elements = self.typeMap.get(type(elem))
+            if (elements is not None) and (elements.pop(ref, None) is not None) and (len(elements) == 0):
+                del self.typeMap[type(elem)]
+
+    def _indexRole(self, package):
+        if package.role is not None:
+            packages = self.roleMap.setdefault(package.role, [])
+            if package not in packages:
+                packages.append(package)
+
+    def _unindexRole(self, package):
+        packages = self.roleMap.get(package.role)
+        if (packages is not None) and (package in packages):
+            packages.remove(package)
+            if len(packages) == 0:
+                del self.roleMap[package.role]
+
+    def elementsOfType(self, elementType, role=None):
+        """
+        Returns a list of the package elements which are instances of elementType (a class or a tuple of classes).
+        Elements of the same class are listed in the order they were added to the workspace
+        (lazily loaded elements in the order they were parsed).
+        When role is given, only elements of packages having that role (see Package.role) are returned.
+        Lazily loaded elements not parsed yet are parsed first, in the order they were added.
+        """
+        self._loadStubs()
+        result = []
+        for (cls, elements) in self.typeMap.items():
+            if issubclass(cls, elementType):
+                if role is None:
+                    result.extend(elements.values())
+                else:
+                    result.extend(elem for elem in elements.values() if elem.parent.role == role)
         return result
 
+    def referrers(self, ref):
+        """
+        Returns a list of the elements holding a reference to ref (an absolute reference).
+        The referrer is the innermost element (see autosar.element.Element) holding the reference, e.g. the port referencing
+        a port interface or the data element referencing a data type. A referrer is listed once for each reference it holds.
+        References are read from the attributes named *Ref (string) or *Refs (list of strings) of the elements.
+
+        The reverse index is built on first call (lazily loaded elements are parsed) and is updated when package elements are
+        appended to or deleted from the workspace. References changed on elements after they have been indexed by a call to
+        this method are not seen until the element is appended again.
+        """
+        if ref is None: return []
+        if ref[0] != '/': ref = '/'+ref
+        self._updateReferences()
+        return [referrer for (_, referrer) in self.referrerMap.get(ref, [])]
+
+    def _updateReferences(self):
+        """
+        Scans the package elements appended since the last call for references, see referrers
+        """
+        if self._referenceTargets is None:
+            self._referenceTargets = {}
+            self._pendingReferences = dict(self.refMap['elements'])
+        while len(self._pendingReferences) > 0:
+            (ref, elem) = self._pendingReferences.popitem()
+            if isinstance(elem, autosar.package.ElementStub):
+                if elem.parent is not None:
+                    elem.parent._loadStub(elem) #the parsed element is added to _pendingReferences by _indexElement
+                continue
+            references = []
+            _collectReferences(elem, elem, references, set())
+            targets = set()
+            for (target, referrer) in references:
+                self.referrerMap.setdefault(target, []).append((ref, referrer))
+                targets.add(target)
+            self._referenceTargets[ref] = targets
+
+    def _unindexReferences(self, ref):
+        """
+        Removes the references found in the package element referenced by ref from referrerMap
+        """
+        for target in self._referenceTargets.pop(ref, ()):
+            referrers = [item for item in self.referrerMap[target] if item[0] != ref]
+            if len(referrers) > 0:
+                self.referrerMap[target] = referrers
+            else:
+                del self.referrerMap[target]
+
+    def resolveReferences(self):
+        """
+        Resolves all references found in the package elements (see referrers) and keeps a link to each object found,
+        subsequent calls to resolve return the linked objects without searching them.
+        Returns a list of (reference, referrer) tuples, sorted by reference, for each reference that could not be resolved.
+        """
+        self._updateReferences()
+        dangling = []
+        for ref in sorted(self.referrerMap):
+            if self.resolve(ref) is None:
+                dangling.extend((ref, referrer) for (_, referrer) in self.referrerMap[ref])
+        return dangling
+
+    def resolve(self, ref):
+        """
+        Same as find(ref) for an absolute reference, the result is linked to ref (see linkMap) so the next call does not
+        search it again.
+        A link is dropped when the package element (or package) containing the object is deleted or replaced,
+        or when the object (or one of its parents) is renamed or moved.
+        Objects removed directly from the lists of their parent element keep their link until resolveReferences is called
+        after linkMap has been cleared.
+        """
+        link = self.linkMap.get(ref)
+        if link is not None:
+            obj = link()
+            if (obj is not None) and (getattr(obj, 'ref', None) == ref):
+                return obj
+            del self.linkMap[ref]
+        obj = self.find(ref)
+        if obj is not None:
+            try:
+                self.linkMap[ref] = weakref.ref(obj)
+            except TypeError:
+                return obj #object does not support weak references
+            self._linkOwners.setdefault(self._linkOwner(ref), set()).add(ref)
+        return obj
+
+    def closure(self, refs):
+        """
+        Returns the sorted references of the package elements needed by refs (a reference or a list of references):
+        the elements containing the referenced objects and, transitively, the elements containing the objects they
+        reference (see referrers). A package reference stands for all elements below the package.
+        References that cannot be resolved are ignored. Lazily loaded elements are only parsed when they are part of the closure.
+        """
+        if isinstance(refs, str): refs = [refs]
+        worklist = []
+        for ref in refs:
+            if ref[0] != '/': ref = '/'+ref
+            package = self.refMap['packages'].get(ref)
+            if package is not None:
+                elements = collections.OrderedDict()
+                _collectPackageContent(package, ref, [], elements)
+                worklist.extend(elements)
+            else:
+                worklist.append(ref)
+        result = set()
+        while len(worklist) > 0:
+            ref = self._elementOwner(worklist.pop())
+            if (ref is not None) and (ref not in result):
+                result.add(ref)
+                worklist.extend(self._elementReferences(ref))
+        return sorted(result)
+
+    def extract(self, refs):
+        """
+        Returns a new workspace holding copies of the package elements in the closure of refs (see closure).
+        Packages are created in the order of this workspace and keep their role, the workspace roles of the created
+        packages are kept as well. Objects linked to elements outside the closure (e.g. ComponentType.implementation) are set to None.
+        """
+        elementRefs = set(self.closure(refs))
+        packageRefs = set()
+        for ref in elementRefs:
+            ref = ref.rpartition('/')[0]
+            while (len(ref) > 0) and (ref not in packageRefs):
+                packageRefs.add(ref)
+                ref = ref.rpartition('/')[0]
+        result = Workspace(self.version, self.patch, self.schema, self.release, self.attributes, self.useDefaultWriters)
+        result.packageParser = self.packageParser
+        result.packageWriter = self.packageWriter
+        result.profile = copy.copy(self.profile)
+        elements = []
+        _extractPackages(self.packages, '', result, packageRefs, elementRefs, elements)
+        fp = io.BytesIO()
+        _ElementCopyPickler(fp, set(id(elem) for (_, elem) in elements)).dump([elem for (_, elem) in elements])
+        fp.seek(0)
+        for (package, elem) in zip([package for (package, _) in elements], _ElementCopyUnpickler(fp, result).load()):
+            package.append(elem)
+        for (role, ref) in self.roles.items():
+            if ref in packageRefs:
+                result.roles[role] = ref
+        return result
+
+    def _loadStubs(self):
+        """
+        Parses all lazily loaded elements not parsed yet, in the order they were added
+        """
+        while len(self._stubs) > 0:
+            stub = self._stubs.pop(next(iter(self._stubs)))
+            if stub.parent is not None:
+                stub.parent._loadStub(stub) #the parsed element is added to typeMap by _indexElement
+
+    def _elementOwner(self, ref):
+        """
+        Returns the reference of the package element containing the object referenced by ref or None
+        """
+        while len(ref) > 0:
+            if ref in self.refMap['elements']:
+                return ref
+            ref = ref.rpartition('/')[0]
+        return None
+
+    def _elementReferences(self, ref):
+        """
+        Returns the references found in the package element referenced by ref, see referrers
+        """
+        if (self._referenceTargets is not None) and (ref in self._referenceTargets):
+            return self._referenceTargets[ref]
+        elem = self.find(ref)
+        if elem is None:
+            return set()
+        references = []
+        _collectReferences(elem, elem, references, set())
+        return set(target for (target, _) in references)
+
+    def _linkOwner(self, ref):
+        """
+        Returns the reference of the package element (or package) containing the object referenced by ref
+        """
+        prefix = ref
+        while len(prefix) > 0:
+            if (prefix in self.refMap['elements']) or (prefix in self.refMap['packages']):
+                return prefix
+            prefix = prefix.rpartition('/')[0]
+        return ref
+
+    def _unlink(self, ref):
+        """
+        Drops the links to the objects contained in the package element (or package) referenced by ref
+        """
+        for linkRef in self._linkOwners.pop(ref, ()):
+            self.linkMap.pop(linkRef, None)
+
+    def findall(self, ref, elementType=None):
+        """
+        Returns a list of the elements and packages matching the reference pattern ref, see iterfind
+        """
+        if ref is None: return None
+        return list(self.iterfind(ref, elementType))
+
+    def iterfind(self, ref, elementType=None):
+        """
+        Yields the elements and packages matching the reference pattern ref (see autosar.base.RefPattern).
+        Example: ws.iterfind('/PortInterfaces/**', autosar.portinterface.SenderReceiverInterface)
+        ref is either a string or a compiled pattern (see autosar.base.compileRefPattern).
+        When elementType (a class or a tuple of classes) is given, only instances of elementType are yielded.
+        """
+        return autosar.package._iterfind(self, ref, elementType)
+
     def findRolePackage(self, roleName):
         """
         Returns package with role set to roleName or None
         """
         if roleName is None: return None
+        packages = [pkg for pkg in self.roleMap.get(roleName, []) if (pkg.parent is self) or ((pkg.parent is not None) and (pkg.parent.parent is self))]
+        if len(packages) < 2:
+            return packages[0] if len(packages) == 1 else None
+        #several packages have roleName, the first one found in package order is returned
         for pkg in self.packages:
             if pkg.role == roleName:
                 return pkg
@@ -297,9 +1038,8 @@ class Workspace:
 
     def createPackage(self,name,role=None):
         if name not in self.map['packages']:
-            package = autosar.package.Package(name,self)
-            self.packages.append(package)
-            self.map['packages'][name] = package
+            package = autosar.package.Package(name)
+            self.append(package)
             if role is not None:
                 self.setRole(package.ref, role)
             return package
@@ -325,39 +1065,100 @@ class Workspace:
     def rootWS(self):
         return self
 
-    def saveXML(self, filename, filters=None, ignore=None):
-        if self.packageWriter is None:
-            self.packageWriter = autosar.writer.package_writer.PackageWriter(self.version, self.patch)
-            if self.useDefaultWriters:
-                self._registerDefaultElementWriters(self.packageWriter)
-        workspaceWriter=autosar.writer.WorkspaceWriter(self.version, self.patch, self.schema, self.packageWriter)
+    def saveXML(self, filename, filters=None, ignore=None, workers=1, mpContext=None):
+        """
+        Writes the workspace to an ARXML file.
+        filters and ignore are lists of references (or a single reference) of what to write and what to skip.
+        The file is written while it is generated, only the lines of the element being written are held in memory.
+        With workers > 1 (None means number of CPUs) top-level packages are written in a pool of worker processes,
+        see _writerPool. mpContext is the multiprocessing context of the pool (default context when None).
+        The file is identical to the one written in the current process, but the memory trade-off is different:
+        each worker returns the lines of a complete top-level package as one list, and packages finished ahead
+        of the one being written are kept until the file reaches them (in the worst case all of them).
+        Use workers=1 when the output has to be written with the least memory.
+        """
+        workspaceWriter = self._workspaceWriter()
+        (filters, ignore) = _writerFilters(filters, ignore)
         with open(filename, 'w', encoding="utf-8") as fp:
-            if isinstance(filters,str): filters=[filters]
-            if isinstance(ignore,str): filters=[ignore]
-            if filters is not None:
-                filters = [prepareFilter(x) for x in filters]
-            workspaceWriter.saveXML(self, fp, filters, ignore)
+            with self._writerPool(filters, ignore, workers, mpContext) as mapPackages:
+                workspaceWriter.saveXML(self, fp, filters, ignore, mapPackages)
+
+        if (self.unhandledWriter):
+            print( "[PackageWriter] unhandled: %s" % (", ".join(  self.unhandledWriter  )) )
+
+    def toXML(self, filters=None, ignore=None, workers=1, mpContext=None):
+        """
+        Returns the workspace as an ARXML string, see saveXML
+        """
+        workspaceWriter = self._workspaceWriter()
+        (filters, ignore) = _writerFilters(filters, ignore)
+        with self._writerPool(filters, ignore, workers, mpContext) as mapPackages:
+            return workspaceWriter.toXML(self, filters, ignore, mapPackages)
+
+    def saveXMLSplit(self, file_map, ignore=None):
+        """
+        Writes several ARXML files in a single traversal of the workspace.
+        file_map is a dictionary where key is the file name and value is the list of filters of that file (or a single filter).
+        Each file is identical to the one written by saveXML(filename, filters, ignore),
+        elements written to more than one file are only converted to XML once.
+        """
+        workspaceWriter = self._workspaceWriter()
+        with contextlib.ExitStack() as stack:
+            files = []
+            for (filename, filters) in file_map.items():
+                (filters, ignore) = _writerFilters(filters, ignore)
+                files.append((stack.enter_context(open(filename, 'w', encoding="utf-8")), filters))
+            workspaceWriter.saveXMLSplit(self, files, ignore)
 
         if (self.unhandledWriter):
             print( "[PackageWriter] unhandled: %s" % (", ".join(  self.unhandledWriter  )) )
 
-    def toXML(self, filters=None, ignore=None):
+    def _workspaceWriter(self):
+        """
+        Returns the WorkspaceWriter used by saveXML, toXML and saveXMLSplit, packageWriter is created on first use.
+        """
         if self.packageWriter is None:
             self.packageWriter = autosar.writer.package_writer.PackageWriter(self.version, self.patch)
             if self.useDefaultWriters:
                 self._registerDefaultElementWriters(self.packageWriter)
-        workspaceWriter=autosar.writer.WorkspaceWriter(self.version, self.patch, self.schema, self.packageWriter)
-        if isinstance(filters,str): filters=[filters]
-        if isinstance(ignore,str): filters=[ignore]
-        if filters is not None:
-            filters = [prepareFilter(x) for x in filters]
-        return workspaceWriter.toXML(self, filters, ignore)
+        return autosar.writer.WorkspaceWriter(self.version, self.patch, self.schema, self.packageWriter)
+
+    @contextlib.contextmanager
+    def _writerPool(self, filters, ignore, workers, mpContext=None):
+        """
+        Context manager returning the mapPackages function of WorkspaceWriter.iterXML when top-level packages are written
+        in a pool of worker processes, otherwise None (workers <= 1 or at most one package to write).
+        Each worker needs the complete workspace, as element writers look up referenced elements. The workspace is pickled
+        (lazily loaded elements are parsed first and element writers registered in packageWriter must be picklable),
+        unless the caller passes a 'fork' context (multiprocessing.get_context('fork')) in which case the workers inherit it.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        root = compileFilters(filters)
+        numPackages = sum(1 for package in self.packages if root.matches(package.name))
+        if workers <= 1 or numPackages <= 1:
+            yield None
+            return
+        if (mpContext is not None) and (mpContext.get_start_method() == 'fork'):
+            initargs = (self, None)
+        else:
+            initargs = (None, _pickleWriterWorkspace(self))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(workers, numPackages), mp_context=mpContext,
+                                                    initializer=_writeXMLWorkerInit, initargs=initargs) as executor:
+            def mapPackages(packages):
+                results = executor.map(_writeXMLWorker, [package.name for package in packages], itertools.repeat(filters), itertools.repeat(ignore))
+                for lines, unhandledWriter in results:
+                    for (ref, names) in unhandledWriter:
+                        self.find(ref).unhandledWriter.update(names)
+                    yield lines
+            yield mapPackages
 
     def append(self,elem):
         if isinstance(elem,autosar.package.Package):
             self.packages.append(elem)
             elem.parent=self
             self.map['packages'][elem.name] = elem
+            self._indexPackage(elem, '/'+elem.name)
         else:
             raise ValueError(type(elem))
 
@@ -423,11 +1224,11 @@ class Workspace:
         if self.xmlroot is None:
             raise ValueError("xmlroot is None, did you call loadXML() or openXML()?")
         if self.version >= 3.0 and self.version < 4.0:
-            if self.xmlroot.find('TOP-LEVEL-PACKAGES'):
+            if self.xmlroot.find('TOP-LEVEL-PACKAGES') is not None:
                 for xmlPackage in self.xmlroot.findall('./TOP-LEVEL-PACKAGES/AR-PACKAGE'):
                     packageList.append(xmlPackage.find("./SHORT-NAME").text)
         elif self.version>=4.0:
-            if self.xmlroot.find('AR-PACKAGES'):
+            if self.xmlroot.find('AR-PACKAGES') is not None:
                 for xmlPackage in self.xmlroot.findall('.AR-PACKAGES/AR-PACKAGE'):
                     packageList.append(xmlPackage.find("./SHORT-NAME").text)
         else:
@@ -445,6 +1246,7 @@ class Workspace:
                 else:
                     del self.packages[i]
                     del self.map['packages'][ref[0]]
+                    self._unindexPackage(pkg, '/'+pkg.name)
                     break
 
     def createAdminData(self, data):
@@ -482,19 +1284,8 @@ class Workspace:
         self.packageWriter.registerElementWriter(elementWriter)
 
     def _registerDefaultElementParsers(self, parser):
-        parser.registerElementParser(DataTypeParser(self.version))
-        parser.registerElementParser(DataTypeSemanticsParser(self.version))
-        parser.registerElementParser(DataTypeUnitsParser(self.version))
-        parser.registerElementParser(PortInterfacePackageParser(self.version))
-        parser.registerElementParser(SoftwareAddressMethodParser(self.version))
-        parser.registerElementParser(ModeDeclarationParser(self.version))
-        parser.registerElementParser(ConstantParser(self.version))
-        parser.registerElementParser(ComponentTypeParser(self.version))
-        parser.registerElementParser(BehaviorParser(self.version))
-        parser.registerElementParser(SystemParser(self.version))
-        parser.registerElementParser(SignalParser(self.version))
-        parser.registerElementParser(SwcImplementationParser(self.version))
-        parser.registerElementParser(EcuConfigurationParser(self.version))
+        for parserType in _defaultElementParsers:
+            parser.registerElementParser(parserType(self.version))
 
     def _registerDefaultElementWriters(self, writer):
         writer.registerElementWriter(XMLDataTypeWriter(self.version, self.patch))
@@ -509,3 +1300,284 @@ class Workspace:
         writer.registerElementWriter(CodeBehaviorWriter(self.version, self.patch))
         writer.registerElementWriter(SignalWriter(self.version, self.patch))
         writer.registerElementWriter(XMLModeWriter(self.version, self.patch))
+
+def _reloadPosition(package, packageRef, previousName, origin):
+    """
+    Returns the index in package.elements at which Workspace.reloadXML inserts a new element of a file: after previousName,
+    the element preceding it in the file, or before the first element of the file in package (see fileMap)
+    """
+    if previousName is not None:
+        return autosar.base.indexByName(package.elements, previousName)+1
+    for i, elem in enumerate(package.elements):
+        if packageRef+'/'+elem.name in origin['elements']:
+            return i
+    return len(package.elements)
+
+def _sortFileElements(package, packageRef, names, origin):
+    """
+    Sorts the elements of package that originate from a file (see fileMap) in the order of names, their order in the file.
+    Elements of other files keep their positions.
+    """
+    order = {name: i for (i, name) in enumerate(names)}
+    positions = [i for (i, elem) in enumerate(package.elements) if (elem.name in order) and (packageRef+'/'+elem.name in origin['elements'])]
+    elements = sorted((package.elements[i] for i in positions), key=lambda elem: order[elem.name])
+    for (i, elem) in zip(positions, elements):
+        package.elements[i] = elem
+
+def _readXMLVersion(filename):
+    """
+    Returns the AUTOSAR version of filename (as used by PackageParser) read from its root tag, the rest of the file is not parsed.
+    Returns None when the version cannot be determined.
+    """
+    try:
+        with open(filename, 'rb') as fp:
+            for _, xmlRoot in iterParseXMLSource(fp, ('start',)):
+                (major, minor, _, _, _) = parseAutosarVersionAndSchema(xmlRoot)
+                return None if major is None else float('%s.%s'%(major, minor))
+    except ElementTree.ParseError:
+        pass
+    return None
+
+def _loadXMLDetached(filename, packageParser, streaming=False):
+    """
+    Loads filename into a new workspace.
+    Returns version information, the top-level packages (detached from the temporary workspace) and unhandled tags
+    as a tuple.
+    """
+    ws = Workspace(3.0, 2, None)
+    ws.packageParser = packageParser
+    ws.loadXML(filename, streaming=streaming)
+    for package in ws.packages:
+        package.parent = None
+    return ((ws.major, ws.minor, ws.patch, ws.release, ws.schema), ws.packages, ws.unhandledParser)
+
+def _recordPackageContent(package, ref, counts, isNew, origin):
+    """
+    Adds references of elements and sub-packages of package that are not part of counts (see Workspace._packageSnapshot) to origin
+    """
+    if isNew:
+        origin['packages'].add(ref)
+        (numElements, numPackages) = (0, 0)
+    else:
+        (numElements, numPackages) = counts[id(package)]
+    for elem in package._elements[numElements:]:
+        origin['elements'].add(ref+'/'+elem.name)
+    for i, subPackage in enumerate(package.subPackages):
+        _recordPackageContent(subPackage, ref+'/'+subPackage.name, counts, isNew or i >= numPackages, origin)
+
+def _collectReferences(obj, referrer, result, visited):
+    """
+    Appends a (target reference, referrer) tuple to result for each absolute reference found in the attributes named *Ref or *Refs
+    of obj and of the objects it contains. referrer is the innermost autosar.element.Element containing the reference.
+    Parents (and other packages) are not followed.
+    """
+    if id(obj) in visited:
+        return
+    visited.add(id(obj))
+    if isinstance(obj, autosar.element.Element):
+        referrer = obj
+    for (name, value) in autosar.base.instanceAttributes(obj).items():
+        if name in _skippedReferenceAttributes:
+            continue
+        if name.endswith('Ref') or name.endswith('Refs'):
+            if isinstance(value, str):
+                if value.startswith('/'):
+                    result.append((value, referrer))
+                continue
+            elif isinstance(value, list) and all(isinstance(x, str) for x in value):
+                result.extend((x, referrer) for x in value if x.startswith('/'))
+                continue
+        _collectReferencesFromValue(value, referrer, result, visited)
+
+def _collectReferencesFromValue(value, referrer, result, visited):
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            _collectReferencesFromValue(item, referrer, result, visited)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _collectReferencesFromValue(item, referrer, result, visited)
+    elif (hasattr(value, '__dict__') or hasattr(value, '__slots__')) and type(value).__module__.startswith('autosar.') and not isinstance(value, (autosar.package.Package, Workspace)):
+        _collectReferences(value, referrer, result, visited)
+
+_skippedReferenceAttributes = frozenset(['parent', '_parent', '_refCache'])
+
+def _collectPackageContent(package, ref, packageRefs, elements):
+    """
+    Collects references of package and its sub-packages into packageRefs and (package ref, element) tuples into elements
+    """
+    packageRefs.append(ref)
+    for elem in package.elements:
+        elements[ref+'/'+elem.name] = (ref, elem)
+    for subPackage in package.subPackages:
+        _collectPackageContent(subPackage, ref+'/'+subPackage.name, packageRefs, elements)
+
+class _ElementPickler(pickle.Pickler):
+    """
+    Pickler that replaces references to packages and workspaces by a placeholder.
+    Used for comparing the content of elements without following their parent.
+    """
+    def persistent_id(self, obj):
+        if isinstance(obj, autosar.package.Package):
+            return 'package'
+        elif isinstance(obj, Workspace):
+            return 'workspace'
+        return None
+
+class _ElementCopyPickler(pickle.Pickler):
+    """
+    Pickler used by Workspace.extract. Packages and workspaces are replaced by their reference,
+    package elements not listed in elementIds (ids of the elements being copied) are replaced by None.
+    """
+    def __init__(self, fp, elementIds):
+        super().__init__(fp, protocol=pickle.HIGHEST_PROTOCOL)
+        self.elementIds = elementIds
+
+    def persistent_id(self, obj):
+        if isinstance(obj, autosar.package.Package):
+            return ('package', obj.ref)
+        elif isinstance(obj, Workspace):
+            return ('workspace', None)
+        elif isinstance(obj, autosar.element.Element) and isinstance(obj.parent, autosar.package.Package) and (id(obj) not in self.elementIds):
+            return ('element', None)
+        return None
+
+class _ElementCopyUnpickler(pickle.Unpickler):
+    """
+    Unpickler used by Workspace.extract, resolves the persistent ids of _ElementCopyPickler in the workspace ws
+    """
+    def __init__(self, fp, ws):
+        super().__init__(fp)
+        self.ws = ws
+
+    def persistent_load(self, pid):
+        (kind, ref) = pid
+        if kind == 'package':
+            return None if ref is None else self.ws._createPackagePath(ref)
+        elif kind == 'workspace':
+            return self.ws
+        return None
+
+def _extractPackages(packages, ref, ws, packageRefs, elementRefs, elements):
+    """
+    Creates the packages listed in packageRefs in ws (or in the package ws) and appends a (new package, element) tuple to elements
+    for each element listed in elementRefs, in package order
+    """
+    for package in packages:
+        packageRef = ref+'/'+package.name
+        if packageRef not in packageRefs:
+            continue
+        newPackage = autosar.package.Package(package.name, role=package.role)
+        if isinstance(ws, Workspace):
+            ws.append(newPackage)
+        else:
+            ws.appendPackage(newPackage)
+        for elem in package._elements:
+            if packageRef+'/'+elem.name in elementRefs:
+                if isinstance(elem, autosar.package.ElementStub):
+                    elem = package._loadStub(elem)
+                elements.append((newPackage, elem))
+        _extractPackages(package.subPackages, packageRef, newPackage, packageRefs, elementRefs, elements)
+
+def _elementFingerprint(elem):
+    """
+    Returns a bytes object that is equal for elements with equal content
+    """
+    fp = io.BytesIO()
+    _ElementPickler(fp, protocol=pickle.HIGHEST_PROTOCOL).dump(elem)
+    return fp.getvalue()
+
+def _loadXMLWorker(filename, packageParser):
+    """
+    Runs in a worker process of Workspace.loadXMLFiles. Returns the result of _loadXMLDetached as a pickled tuple.
+    """
+    return pickle.dumps(_loadXMLDetached(filename, packageParser), protocol=pickle.HIGHEST_PROTOCOL)
+
+class _WriterWorkspacePickler(pickle.Pickler):
+    """
+    Pickler used by Workspace.saveXML to copy the packages of a workspace to worker processes.
+    The workspace is replaced by a persistent id, resolved by _WriterWorkspaceUnpickler.
+    """
+    def persistent_id(self, obj):
+        return 'workspace' if isinstance(obj, Workspace) else None
+
+class _WriterWorkspaceUnpickler(pickle.Unpickler):
+    def __init__(self, fp, ws):
+        super().__init__(fp)
+        self.ws = ws
+
+    def persistent_load(self, pid):
+        return self.ws
+
+def _pickleWriterWorkspace(ws):
+    """
+    Returns ws as bytes for _writeXMLWorkerInit. Lazily loaded elements are parsed first.
+    """
+    ws._loadStubs()
+    fp = io.BytesIO()
+    pickle.dump((ws.version, ws.patch, ws.schema, ws.release, ws.attributes, ws.useDefaultWriters), fp, protocol=pickle.HIGHEST_PROTOCOL)
+    _WriterWorkspacePickler(fp, protocol=pickle.HIGHEST_PROTOCOL).dump((ws.profile, ws.roles, ws.packageWriter, ws.packages))
+    return fp.getvalue()
+
+_writerWorkspace = None #workspace of a worker process of Workspace.saveXML, see _writeXMLWorkerInit
+
+def _writeXMLWorkerInit(ws, data):
+    """
+    Initializes a worker process of Workspace.saveXML. ws is the workspace inherited by a forked worker process,
+    otherwise data is returned by _pickleWriterWorkspace.
+    """
+    global _writerWorkspace
+    if ws is not None:
+        _writerWorkspace = ws
+        return
+    fp = io.BytesIO(data)
+    ws = Workspace(*pickle.load(fp))
+    gcEnabled = gc.isenabled()
+    gc.disable()
+    try:
+        (ws.profile, ws.roles, ws.packageWriter, packages) = _WriterWorkspaceUnpickler(fp, ws).load()
+    finally:
+        if gcEnabled:
+            gc.enable()
+    for package in packages:
+        ws.append(package)
+    _writerWorkspace = ws
+
+def _writerFilters(filters, ignore):
+    """
+    Returns the (filters, ignore) arguments of Workspace.saveXML as lists, the references in filters are prepared for matching.
+    """
+    if isinstance(filters,str): filters=[filters]
+    if isinstance(ignore,str): ignore=[ignore]
+    if filters is not None:
+        filters = [prepareFilter(x) for x in filters]
+    return filters, ignore
+
+def _writeXMLWorker(name, filters, ignore):
+    """
+    Runs in a worker process of Workspace.saveXML. Returns the XML lines of the top-level package name (indented by 2 levels)
+    as a single list, see Workspace.saveXML about memory use,
+    and a list of (package reference, unhandledWriter) tuples for the package and its sub-packages with unhandled elements.
+    """
+    package = _writerWorkspace.map['packages'][name]
+    lines = _writerWorkspace.packageWriter.toXML(package, filters, ignore, 2)
+    unhandledWriter = []
+    pending = [package]
+    while len(pending) > 0:
+        package = pending.pop()
+        if len(package.unhandledWriter) > 0:
+            unhandledWriter.append((package.ref, package.unhandledWriter))
+        pending.extend(package.subPackages)
+    return lines, unhandledWriter
+
+def _unpickleWorkerResult(data):
+    """
+    Unpickles the result of _loadXMLWorker.
+    Garbage collection is paused meanwhile, unpickling a large object graph otherwise triggers repeated full collections.
+    """
+    gcEnabled = gc.isenabled()
+    gc.disable()
+    try:
+        return pickle.loads(data)
+    finally:
+        if gcEnabled:
+            gc.enable()
@@ -36,14 +36,14 @@ class XMLBehaviorWriter(ElementWriter):
         if len(internalBehavior.exclusiveAreas)>0:
             lines.append(self.indent('<EXCLUSIVE-AREAS>',1))
             for exclusiveArea in internalBehavior.exclusiveAreas:
-                lines.extend(self.indent(self._writeExclusiveAreaXML(ws,exclusiveArea),2))
+                lines.extend(self.indentBlock(self._writeExclusiveAreaXML(ws,exclusiveArea),2))
             lines.append(self.indent('</EXCLUSIVE-AREAS>',1))
         swc=ws.find(internalBehavior.componentRef)
         assert(swc is not None)
         if isinstance(internalBehavior, autosar.behavior.SwcInternalBehavior) and len(internalBehavior.perInstanceMemories)>0:
             lines.append(self.indent('<AR-TYPED-PER-INSTANCE-MEMORYS>',1))
             for elem in internalBehavior.perInstanceMemories:
-                lines.extend(self.indent(self.writeDataElementXML(elem),2))
+                lines.extend(self.indentBlock(self.writeDataElementXML(elem),2))
             lines.append(self.indent('</AR-TYPED-PER-INSTANCE-MEMORYS>',1))
         if isinstance(internalBehavior, autosar.behavior.SwcInternalBehavior) and len(internalBehavior.dataTypeMappingRefs)>0:
             lines.append(self.indent('<DATA-TYPE-MAPPING-REFS>',1))
@@ -66,57 +66,57 @@ class XMLBehaviorWriter(ElementWriter):
         if len(internalBehavior.events):
             lines.append(self.indent('<EVENTS>',1))
             for event in internalBehavior.events:
-                lines.extend(self.indent(self._writeEventXML(ws,event),2))
+                lines.extend(self.indentBlock(self._writeEventXML(ws,event),2))
             lines.append(self.indent('</EVENTS>',1))
         if len(internalBehavior.portAPIOptions) == 0 and (internalBehavior.autoCreatePortAPIOptions):
             internalBehavior.createPortAPIOptionDefaults() #try to automatically create PortAPIOption objects on behavior object
         if isinstance(internalBehavior, autosar.behavior.InternalBehavior) and len(internalBehavior.perInstanceMemories)>0:
             lines.append(self.indent('<PER-INSTANCE-MEMORYS>',1))
             for memory in internalBehavior.perInstanceMemories:
-                lines.extend(self.indent(self._writePerInstanceMemoryXML(ws,memory),2))
+                lines.extend(self.indentBlock(self._writePerInstanceMemoryXML(ws,memory),2))
             lines.append(self.indent('</PER-INSTANCE-MEMORYS>',1))
         if len(internalBehavior.portAPIOptions)>0:
-            lines.extend(self.indent(self._writePortAPIOptionsXML(internalBehavior),1))
+            lines.extend(self.indentBlock(self._writePortAPIOptionsXML(internalBehavior),1))
         if len(internalBehavior.runnables)>0:
             lines.append(self.indent('<RUNNABLES>',1))
             for runnable in internalBehavior.runnables:
-                lines.extend(self.indent(self._writeRunnableXML(runnable),2))
+                lines.extend(self.indentBlock(self._writeRunnableXML(runnable),2))
             lines.append(self.indent('</RUNNABLES>',1))
         if isinstance(internalBehavior, autosar.behavior.InternalBehavior) and len(internalBehavior.swcNvBlockNeeds)>0:
             lines.append(self.indent('<SERVICE-NEEDSS>',1))
             for elem in internalBehavior.swcNvBlockNeeds:
-                lines.extend(self.indent(self._writeSwcNvBlockNeedsXML(ws, elem),2))
+                lines.extend(self.indentBlock(self._writeSwcNvBlockNeedsXML(ws, elem),2))
             lines.append(self.indent('</SERVICE-NEEDSS>',1))
         elif isinstance(internalBehavior, autosar.behavior.SwcInternalBehavior) and len(internalBehavior.serviceDependencies)>0:
             lines.append(self.indent('<SERVICE-DEPENDENCYS>',1))
             for serviceDependency in internalBehavior.serviceDependencies:
-                lines.extend(self.indent(self._writeServiceDependencyXML(ws, serviceDependency),2))
+                lines.extend(self.indentBlock(self._writeServiceDependencyXML(ws, serviceDependency),2))
             lines.append(self.indent('</SERVICE-DEPENDENCYS>',1))
         if isinstance(internalBehavior, autosar.behavior.SwcInternalBehavior) and len(internalBehavior.sharedParameterDataPrototype)>0:
             lines.append(self.indent('<SHARED-PARAMETERS>',1))
             for elem in internalBehavior.sharedParameterDataPrototype:
-                lines.extend(self.indent(self._writeParameterDataPrototype(ws, elem),2))
+                lines.extend(self.indentBlock(self._writeParameterDataPrototype(ws, elem),2))
             lines.append(self.indent('</SHARED-PARAMETERS>',1))
         if isinstance(internalBehavior, autosar.behavior.SwcInternalBehavior) and len(internalBehavior.perInstanceParameterDataPrototype)>0:
             lines.append(self.indent('<PER-INSTANCE-PARAMETERS>',1))
             for elem in internalBehavior.perInstanceParameterDataPrototype:
-                lines.extend(self.indent(self._writeParameterDataPrototype(ws, elem),2))
+                lines.extend(self.indentBlock(self._writeParameterDataPrototype(ws, elem),2))
             lines.append(self.indent('</PER-INSTANCE-PARAMETERS>',1))
         elif isinstance(internalBehavior, autosar.behavior.InternalBehavior) and len(internalBehavior.sharedCalParams)>0:
             lines.append(self.indent('<SHARED-CALPRMS>',1))
             for elem in internalBehavior.sharedCalParams:
-                lines.extend(self.indent(self._writeSharedCalParamXML(ws, elem),2))
+                lines.extend(self.indentBlock(self._writeSharedCalParamXML(ws, elem),2))
             lines.append(self.indent('</SHARED-CALPRMS>',1))
         elif isinstance(internalBehavior, autosar.behavior.SwcInternalBehavior) and len(internalBehavior.constantMemories)>0:
             lines.append(self.indent('<CONSTANT-MEMORYS>',1))
             for elem in internalBehavior.constantMemories:
-                lines.extend(self.indent(self._writeParameterDataPrototype(ws, elem),2))
+                lines.extend(self.indentBlock(self._writeParameterDataPrototype(ws, elem),2))
             lines.append(self.indent('</CONSTANT-MEMORYS>',1))
         lines.append(self.indent('<SUPPORTS-MULTIPLE-INSTANTIATION>%s</SUPPORTS-MULTIPLE-INSTANTIATION>'%('true' if internalBehavior.multipleInstance else 'false'),1))
         if isinstance(internalBehavior, autosar.behavior.SwcInternalBehavior) and len(internalBehavior.variationPointProxies)>0:
             lines.append(self.indent('<VARIATION-POINT-PROXYS>',1))
             for variationPointProxy in internalBehavior.variationPointProxies:
-                lines.extend(self.indent(self._writeVariationPointProxyXML(ws, variationPointProxy),2))
+                lines.extend(self.indentBlock(self._writeVariationPointProxyXML(ws, variationPointProxy),2))
             lines.append(self.indent('</VARIATION-POINT-PROXYS>',1))
         lines.append('</%s>'%internalBehavior.tag(self.version))
         return lines
@@ -128,7 +128,7 @@ class XMLBehaviorWriter(ElementWriter):
                self.indent('<SHORT-NAME>%s</SHORT-NAME>'%runnable.name,1),
               ]
         if runnable.adminData is not None:
-            lines.extend(self.indent(self.writeAdminDataXML(runnable.adminData),1))
+            lines.extend(self.indentBlock(self.writeAdminDataXML(runnable.adminData),1))
         if len(runnable.exclusiveAreaRefs)>0:
             lines.append(self.indent('<CAN-ENTER-EXCLUSIVE-AREA-REFS>',1))
             for exclusiveAreaRef in runnable.exclusiveAreaRefs:
@@ -146,40 +146,40 @@ class XMLBehaviorWriter(ElementWriter):
             if self.version >= 4.0:
                 lines.append(self.indent('<DATA-RECEIVE-POINT-BY-ARGUMENTS>',1))
                 for dataReceivePoint in runnable.dataReceivePoints:
-                    lines.extend(self.indent(self._writeDataReceivePointXML(ws, dataReceivePoint),2))
+                    lines.extend(self.indentBlock(self._writeDataReceivePointXML(ws, dataReceivePoint),2))
                 lines.append(self.indent('</DATA-RECEIVE-POINT-BY-ARGUMENTS>',1))
             else:
                 lines.append(self.indent('<DATA-RECEIVE-POINTS>',1))
                 for dataReceivePoint in runnable.dataReceivePoints:
-                    lines.extend(self.indent(self._writeDataReceivePointXML(ws, dataReceivePoint),2))
+                    lines.extend(self.indentBlock(self._writeDataReceivePointXML(ws, dataReceivePoint),2))
                 lines.append(self.indent('</DATA-RECEIVE-POINTS>',1))
         if len(runnable.dataSendPoints)>0:
             lines.append(self.indent('<DATA-SEND-POINTS>',1))
             for dataSendPoint in runnable.dataSendPoints:
                 lines.append(self.indent('<%s>'%dataSendPoint.tag(self.version),2))
                 lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%dataSendPoint.name,3))
-                lines.extend(self.indent(self._writeDataElementInstanceRefXML(ws, dataSendPoint.portRef, dataSendPoint.dataElemRef),3))
+                lines.extend(self.indentBlock(self._writeDataElementInstanceRefXML(ws, dataSendPoint.portRef, dataSendPoint.dataElemRef),3))
                 lines.append(self.indent('</%s>'%dataSendPoint.tag(self.version),2))
             lines.append(self.indent('</DATA-SEND-POINTS>',1))
         if (self.version >= 4.0) and (len(runnable.modeAccessPoints)>0):
             lines.append(self.indent('<MODE-ACCESS-POINTS>',1))
             for modeAccessPoint in runnable.modeAccessPoints:
-                lines.extend(self.indent(self._writeModeAccessPointXML(ws, modeAccessPoint),2))
+                lines.extend(self.indentBlock(self._writeModeAccessPointXML(ws, modeAccessPoint),2))
             lines.append(self.indent('</MODE-ACCESS-POINTS>',1))
         if (self.version >= 4.0) and (len(runnable.modeSwitchPoints)>0):
             lines.append(self.indent('<MODE-SWITCH-POINTS>',1))
             for modeSwitchPoint in runnable.modeSwitchPoints:
-                lines.extend(self.indent(self._writeModePointXML(ws, modeSwitchPoint),2))
+                lines.extend(self.indentBlock(self._writeModePointXML(ws, modeSwitchPoint),2))
             lines.append(self.indent('</MODE-SWITCH-POINTS>',1))
         if (self.version >= 4.0) and (len(runnable.parameterAccessPoints)>0):
             lines.append(self.indent('<PARAMETER-ACCESSS>',1))
             for parameterAccessPoint in runnable.parameterAccessPoints:
-                lines.extend(self.indent(self._writeParameterAccessPointXML(ws, parameterAccessPoint),2))
+                lines.extend(self.indentBlock(self._writeParameterAccessPointXML(ws, parameterAccessPoint),2))
             lines.append(self.indent('</PARAMETER-ACCESSS>',1))
         if len(runnable.serverCallPoints)>0:
             lines.append(self.indent('<SERVER-CALL-POINTS>',1))
             for callPoint in runnable.serverCallPoints:
-                lines.extend(self.indent(self._writeServerCallPointXML(ws, runnable, callPoint),2))
+                lines.extend(self.indentBlock(self._writeServerCallPointXML(ws, runnable, callPoint),2))
             lines.append(self.indent('</SERVER-CALL-POINTS>',1))
         lines.append(self.indent('<SYMBOL>%s</SYMBOL>'%runnable.symbol,1))
         lines.append('</RUNNABLE-ENTITY>')
@@ -189,7 +189,7 @@ class XMLBehaviorWriter(ElementWriter):
         lines = []
         lines.append('<%s>'%dataReceivePoint.tag(self.version))
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%dataReceivePoint.name,1))
-        lines.extend(self.indent(self._writeDataElementInstanceRefXML(ws, dataReceivePoint.portRef, dataReceivePoint.dataElemRef),1))
+        lines.extend(self.indentBlock(self._writeDataElementInstanceRefXML(ws, dataReceivePoint.portRef, dataReceivePoint.dataElemRef),1))
         lines.append('</%s>'%dataReceivePoint.tag(self.version))
         return lines
 
@@ -252,7 +252,7 @@ class XMLBehaviorWriter(ElementWriter):
         if modeAccessPoint.name is not None:
             lines.append(self.indent('<SHORT-NAME>{0.name}</SHORT-NAME>'.format(modeAccessPoint),1))
         lines.append(self.indent('<MODE-GROUP-IREF>', 1))
-        lines.extend(self.indent(self._writeModeGroupInstanceRefXML(ws, modeAccessPoint.modeGroupInstanceRef),2))
+        lines.extend(self.indentBlock(self._writeModeGroupInstanceRefXML(ws, modeAccessPoint.modeGroupInstanceRef),2))
         lines.append(self.indent('</MODE-GROUP-IREF>', 1))
         lines.append('</{0}>'.format(modeAccessPoint.tag(self.version)))
         return lines
@@ -262,7 +262,7 @@ class XMLBehaviorWriter(ElementWriter):
         lines = ['<{0}>'.format(modeSwitchPoint.tag(self.version))]
         if modeSwitchPoint.name is not None:
             lines.append(self.indent('<SHORT-NAME>{0.name}</SHORT-NAME>'.format(modeSwitchPoint),1))
-        lines.extend(self.indent(self._writeModeGroupInstanceRefXML(ws, modeSwitchPoint.modeGroupInstanceRef),1))
+        lines.extend(self.indentBlock(self._writeModeGroupInstanceRefXML(ws, modeSwitchPoint.modeGroupInstanceRef),1))
         lines.append('</{0}>'.format(modeSwitchPoint.tag(self.version)))
         return lines
 
@@ -309,11 +309,11 @@ class XMLBehaviorWriter(ElementWriter):
             lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%callPoint.name,1))
             if self.version >= 4.0:
                 for operationIRef in callPoint.operationInstanceRefs:
-                    lines.extend(self.indent(self._writeOperationInstanceRefXML(ws, runnable, operationIRef),1))
+                    lines.extend(self.indentBlock(self._writeOperationInstanceRefXML(ws, runnable, operationIRef),1))
             else:
                 lines.append('<OPERATION-IREFS>')
                 for operationIRef in callPoint.operationInstanceRefs:
-                    lines.extend(self.indent(self._writeOperationInstanceRefXML(ws, runnable, operationIRef),2))
+                    lines.extend(self.indentBlock(self._writeOperationInstanceRefXML(ws, runnable, operationIRef),2))
                 lines.append('</OPERATION-IREFS>')
             if callPoint.timeout == 0.0:
                 lines.append(self.indent('<TIMEOUT>0</TIMEOUT>',1))
@@ -360,7 +360,7 @@ class XMLBehaviorWriter(ElementWriter):
         assert(isinstance(internalBehavior, (autosar.behavior.InternalBehavior, autosar.behavior.SwcInternalBehavior)))
         lines=['<PORT-API-OPTIONS>']
         for option in internalBehavior.portAPIOptions:
-            lines.extend(self.indent(self._writePortAPIOption(ws,option),1))
+            lines.extend(self.indentBlock(self._writePortAPIOption(ws,option),1))
         lines.append('</PORT-API-OPTIONS>')
         return lines
 
@@ -378,7 +378,7 @@ class XMLBehaviorWriter(ElementWriter):
             lines.append(self.indent('<PORT-ARG-VALUES>',1))
             constantWriter = XMLConstantWriter(self.version, self.patch)
             for arg in option.portArgValues:
-                lines.extend(self.indent(constantWriter._writePortDefinedArgumentValue(ws,arg),2))
+                lines.extend(self.indentBlock(constantWriter._writePortDefinedArgumentValue(ws,arg),2))
             lines.append(self.indent('</PORT-ARG-VALUES>',1))
         lines.append('</%s>'%option.tag(self.version))
         return lines
@@ -392,14 +392,14 @@ class XMLBehaviorWriter(ElementWriter):
             if event.disabledInModes is not None:
                 lines.append(self.indent('<DISABLED-MODE-IREFS>',1))
                 for item in event.disabledInModes:
-                    lines.extend(self.indent(self._writeModeInstanceRefXML(ws, item),2))
+                    lines.extend(self.indentBlock(self._writeModeInstanceRefXML(ws, item),2))
                 lines.append(self.indent('</DISABLED-MODE-IREFS>',1))
         else:
             if event.modeDependency is not None:
                 lines.append(self.indent('<MODE-DEPENDENCY>',1))
                 lines.append(self.indent('<DEPENDENT-ON-MODE-IREFS>',2))
                 for item in event.modeDependency.modeInstanceRefs:
-                    lines.extend(self.indent(self._writeModeInstanceRefXML(ws, item),3))
+                    lines.extend(self.indentBlock(self._writeModeInstanceRefXML(ws, item),3))
                 lines.append(self.indent('</DEPENDENT-ON-MODE-IREFS>',2))
                 lines.append(self.indent('</MODE-DEPENDENCY>',1))
 
@@ -410,10 +410,10 @@ class XMLBehaviorWriter(ElementWriter):
             lines.append(self.indent('<ACTIVATION>%s</ACTIVATION>'%(event.activationType),1))
             if self.version >= 4.0:
                 lines.append(self.indent('<MODE-IREFS>',1))
-                lines.extend(self.indent(self._writeModeInstanceRefXML(ws,event.modeInstRef),2))
+                lines.extend(self.indentBlock(self._writeModeInstanceRefXML(ws,event.modeInstRef),2))
                 lines.append(self.indent('</MODE-IREFS>',1))
             else:
-                lines.extend(self.indent(self._writeModeInstanceRefXML(ws,event.modeInstRef),1))
+                lines.extend(self.indentBlock(self._writeModeInstanceRefXML(ws,event.modeInstRef),1))
         elif isinstance(event, autosar.behavior.TimingEvent):
             if event.period==0:
                 lines.append(self.indent('<PERIOD>0</PERIOD>',1))
@@ -426,15 +426,15 @@ class XMLBehaviorWriter(ElementWriter):
                     lines.append(self.indent('<PERIOD>%s</PERIOD>'%(period),1))
         elif isinstance(event, autosar.behavior.OperationInvokedEvent):
             assert(event.operationInstanceRef is not None)
-            lines.extend(self.indent(self._writeOperationInstanceRefXML(ws, event, event.operationInstanceRef),1))
+            lines.extend(self.indentBlock(self._writeOperationInstanceRefXML(ws, event, event.operationInstanceRef),1))
         elif isinstance(event, autosar.behavior.DataReceivedEvent):
             assert(event.dataInstanceRef is not None)
-            lines.extend(self.indent(self._writeDataInstanceRefXML(ws, event, event.dataInstanceRef),1))
+            lines.extend(self.indentBlock(self._writeDataInstanceRefXML(ws, event, event.dataInstanceRef),1))
         elif isinstance(event, autosar.behavior.InitEvent):
             pass #No additional values to write for InitEvent
         elif isinstance(event, autosar.behavior.ModeSwitchAckEvent):
             assert(event.eventSourceRef is not None)
-            lines.extend(self.indent(self._writeEventSourceRefXML(ws, event, event.eventSourceRef),1))
+            lines.extend(self.indentBlock(self._writeEventSourceRefXML(ws, event, event.eventSourceRef),1))
         else:
             raise NotImplementedError(str(type(event)))
         lines.append('</%s>'%tag)
@@ -577,8 +577,8 @@ class XMLBehaviorWriter(ElementWriter):
         lines.append('<%s>'%elem.tag(self.version))
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%elem.name,1))
         if elem.adminData is not None:
-            lines.extend(self.indent(self.writeAdminDataXML(elem.adminData),1))
-        lines.extend(self.indent(self._writeDiagnosticCapabilityElementConfigs(elem.cfg),1))
+            lines.extend(self.indentBlock(self.writeAdminDataXML(elem.adminData),1))
+        lines.extend(self.indentBlock(self._writeDiagnosticCapabilityElementConfigs(elem.cfg),1))
         if elem.cfg.considerPtoStatus is not None:
             lines.append(self.indent('<CONSIDER-PTO-STATUS>%s</CONSIDER-PTO-STATUS>'%('true' if elem.cfg.considerPtoStatus else 'false'),1))
         if elem.cfg.deferringFidRefs is not None and len(elem.cfg.deferringFidRefs)>0:
@@ -625,8 +625,8 @@ class XMLBehaviorWriter(ElementWriter):
         lines.append('<%s>'%elem.tag(self.version))
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%elem.name,1))
         if elem.adminData is not None:
-            lines.extend(self.indent(self.writeAdminDataXML(elem.adminData),1))
-        lines.extend(self.indent(self._writeDiagnosticCapabilityElementConfigs(elem.cfg),1))
+            lines.extend(self.indentBlock(self.writeAdminDataXML(elem.adminData),1))
+        lines.extend(self.indentBlock(self._writeDiagnosticCapabilityElementConfigs(elem.cfg),1))
         lines.append('</%s>'%elem.tag(self.version))
         return lines
     
@@ -636,8 +636,8 @@ class XMLBehaviorWriter(ElementWriter):
         lines.append('<%s>'%elem.tag(self.version))
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%elem.name,1))
         if elem.adminData is not None:
-            lines.extend(self.indent(self.writeAdminDataXML(elem.adminData),1))
-        lines.extend(self.indent(self._writeDiagnosticCapabilityElementConfigs(elem.cfg),1))
+            lines.extend(self.indentBlock(self.writeAdminDataXML(elem.adminData),1))
+        lines.extend(self.indentBlock(self._writeDiagnosticCapabilityElementConfigs(elem.cfg),1))
         if elem.cfg.serviceRequestCallbackType is not None:
             lines.append(self.indent('<SERVICE-REQUEST-CALLBACK-TYPE>%s</SERVICE-REQUEST-CALLBACK-TYPE>'%elem.cfg.serviceRequestCallbackType,1))
         lines.append('</%s>'%elem.tag(self.version))
@@ -648,7 +648,7 @@ class XMLBehaviorWriter(ElementWriter):
         lines.append('<%s>'%elem.tag(self.version))
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%elem.name,1))
         if elem.adminData is not None:
-            lines.extend(self.indent(self.writeAdminDataXML(elem.adminData),1))
+            lines.extend(self.indentBlock(self.writeAdminDataXML(elem.adminData),1))
         lines.append(self.indent('<SW-DATA-DEF-PROPS>',1))
         for ref in elem.swDataDefsProps:
             item = ws.find(ref)
@@ -677,19 +677,19 @@ class XMLBehaviorWriter(ElementWriter):
         if elem.name is not None:
             lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%elem.name,1))
         tmp = self.writeDescXML(elem)
-        if tmp is not None: lines.extend(self.indent(tmp,1))
+        if tmp is not None: lines.extend(self.indentBlock(tmp,1))
         if len(elem.roleBasedDataAssignments):
             lines.append(self.indent('<ASSIGNED-DATAS>',1))
             for dataAssignment in elem.roleBasedDataAssignments:
-                lines.extend(self.indent(self._writeRoleBasedDataAssignmentXML(ws, dataAssignment),2))
+                lines.extend(self.indentBlock(self._writeRoleBasedDataAssignmentXML(ws, dataAssignment),2))
             lines.append(self.indent('</ASSIGNED-DATAS>',1))
         if len(elem.roleBasedPortAssignments):
             lines.append(self.indent('<ASSIGNED-PORTS>',1))
             for portAssignment in elem.roleBasedPortAssignments:
-                lines.extend(self.indent(self._writeRoleBasedPortAssignmentXML(ws, portAssignment),2))
+                lines.extend(self.indentBlock(self._writeRoleBasedPortAssignmentXML(ws, portAssignment),2))
             lines.append(self.indent('</ASSIGNED-PORTS>',1))
         if elem.serviceNeeds is not None:
-            lines.extend(self.indent(self._writeServiceNeedsXML(ws, elem.serviceNeeds),1))
+            lines.extend(self.indentBlock(self._writeServiceNeedsXML(ws, elem.serviceNeeds),1))
         lines.append("</%s>"%elem.tag(self.version))
         return lines
 
@@ -698,15 +698,15 @@ class XMLBehaviorWriter(ElementWriter):
         lines = []
         lines.append("<%s>"%elem.tag(self.version))
         tmp = self.writeDescXML(elem)
-        if tmp is not None: lines.extend(self.indent(tmp,1))
+        if tmp is not None: lines.extend(self.indentBlock(tmp,1))
         if elem.nvmBlockNeeds is not None:
-            lines.extend(self.indent(self._writeNvmBlockNeedsXML(ws, elem.nvmBlockNeeds),1))
+            lines.extend(self.indentBlock(self._writeNvmBlockNeedsXML(ws, elem.nvmBlockNeeds),1))
         if elem.diagnosticEventNeeds is not None:
-            lines.extend(self.indent(self._writeDiagnosticEventNeedsXML(ws, elem.diagnosticEventNeeds),1))
+            lines.extend(self.indentBlock(self._writeDiagnosticEventNeedsXML(ws, elem.diagnosticEventNeeds),1))
         if elem.diagnosticEventManagerNeeds is not None:
-            lines.extend(self.indent(self._writeDiagnosticEventManagerNeedsXML(ws, elem.diagnosticEventManagerNeeds),1))
+            lines.extend(self.indentBlock(self._writeDiagnosticEventManagerNeedsXML(ws, elem.diagnosticEventManagerNeeds),1))
         if elem.diagnosticCommunicationManagerNeeds is not None:
-            lines.extend(self.indent(self._writeDiagnosticCommunicationManagerNeedsXML(ws, elem.diagnosticCommunicationManagerNeeds),1))
+            lines.extend(self.indentBlock(self._writeDiagnosticCommunicationManagerNeedsXML(ws, elem.diagnosticCommunicationManagerNeeds),1))
         lines.append("</%s>"%elem.tag(self.version))
         return lines
 
@@ -717,9 +717,9 @@ class XMLBehaviorWriter(ElementWriter):
         if elem.name is not None:
             lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%elem.name,1))
         if elem.adminData is not None:
-            lines.extend(self.indent(self.writeAdminDataXML(elem.adminData),1))
+            lines.extend(self.indentBlock(self.writeAdminDataXML(elem.adminData),1))
         tmp = self.writeDescXML(elem)
-        if tmp is not None: lines.extend(self.indent(tmp,1))
+        if tmp is not None: lines.extend(self.indentBlock(tmp,1))
         if elem.cfg.calcRamBlockCrc is not None:
             lines.append(self.indent('<CALC-RAM-BLOCK-CRC>%s</CALC-RAM-BLOCK-CRC>'%(self.toBooleanStr(elem.cfg.calcRamBlockCrc)),1))
         if elem.cfg.checkStaticBlockId is not None:
@@ -814,15 +814,15 @@ class XMLBehaviorWriter(ElementWriter):
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%elem.name,1))
 
         tmp = self.writeLongNameXML(elem)
-        if tmp is not None: lines.extend(self.indent(tmp,1))
+        if tmp is not None: lines.extend(self.indentBlock(tmp,1))
 
         tmp = self.writeDescXML(elem)
-        if tmp is not None: lines.extend(self.indent(tmp,1))
+        if tmp is not None: lines.extend(self.indentBlock(tmp,1))
 
         if elem.swAddressMethodRef is not None or elem.swCalibrationAccess is not None:
             variants = [autosar.base.SwDataDefPropsConditional(swAddressMethodRef = elem.swAddressMethodRef, swCalibrationAccess = elem.swCalibrationAccess)]
             lines.append(self.indent('<SW-DATA-DEF-PROPS>',1))
-            lines.extend(self.indent(self.writeSwDataDefPropsVariantsXML(ws, variants),2))
+            lines.extend(self.indentBlock(self.writeSwDataDefPropsVariantsXML(ws, variants),2))
             lines.append(self.indent('</SW-DATA-DEF-PROPS>',1))
             lines.append(self.indent('<TYPE-TREF DEST="%s">%s</TYPE-TREF>'%(datatype.tag(self.version), datatype.ref),1))
             if elem.initValueRef is not None:
@@ -836,7 +836,7 @@ class XMLBehaviorWriter(ElementWriter):
                 lines.append(self.indent('</INIT-VALUE>',1))
             if elem.initValue is not None:
                 lines.append(self.indent('<INIT-VALUE>',1))
-                lines.extend(self.indent(self.writeValueSpecificationXML(elem.initValue),2))
+                lines.extend(self.indentBlock(self.writeValueSpecificationXML(elem.initValue),2))
                 lines.append(self.indent('</INIT-VALUE>',1))
         lines.append('</%s>'%elem.tag(self.version))
         return lines
@@ -863,24 +863,24 @@ class XMLBehaviorWriter(ElementWriter):
             for dataMapping in nvBlockDescriptor.nvBlockDataMappings:
                 lines.append(self.indent('<NV-BLOCK-DATA-MAPPING>',2))
                 if dataMapping.nvRamBlockElement is not None:
-                    lines.extend(self.indent(self._writeAutosarVariableRefXML(ws, dataMapping.nvRamBlockElement),3))
+                    lines.extend(self.indentBlock(self._writeAutosarVariableRefXML(ws, dataMapping.nvRamBlockElement),3))
                 if dataMapping.readNvData is not None:
-                    lines.extend(self.indent(self._writeAutosarVariableRefXML(ws, dataMapping.readNvData),3))
+                    lines.extend(self.indentBlock(self._writeAutosarVariableRefXML(ws, dataMapping.readNvData),3))
                 if dataMapping.writtenNvData is not None:
-                    lines.extend(self.indent(self._writeAutosarVariableRefXML(ws, dataMapping.writtenNvData),3))
+                    lines.extend(self.indentBlock(self._writeAutosarVariableRefXML(ws, dataMapping.writtenNvData),3))
                 if dataMapping.writtenReadNvData is not None:
-                    lines.extend(self.indent(self._writeAutosarVariableRefXML(ws, dataMapping.writtenReadNvData),3))
+                    lines.extend(self.indentBlock(self._writeAutosarVariableRefXML(ws, dataMapping.writtenReadNvData),3))
                 lines.append(self.indent('</NV-BLOCK-DATA-MAPPING>',2))
             lines.append(self.indent('</NV-BLOCK-DATA-MAPPINGS>',1))
 
         if isinstance(nvBlockDescriptor.nvBlockNeeds, autosar.behavior.NvmBlockNeeds):
-            lines.extend(self.indent(self._writeNvmBlockNeedsXML(ws, nvBlockDescriptor.nvBlockNeeds),1))
+            lines.extend(self.indentBlock(self._writeNvmBlockNeedsXML(ws, nvBlockDescriptor.nvBlockNeeds),1))
 
         if isinstance(nvBlockDescriptor.ramBlock, autosar.behavior.NvBlockRamBlock):
-            lines.extend(self.indent(self.writeDataElementXML(nvBlockDescriptor.ramBlock),1))
+            lines.extend(self.indentBlock(self.writeDataElementXML(nvBlockDescriptor.ramBlock),1))
 
         if isinstance(nvBlockDescriptor.romBlock, autosar.behavior.AutosarDataPrototype) and nvBlockDescriptor.romBlock.role is autosar.behavior.AutosarDataPrototype.Role.Parameter:
-            lines.extend(self.indent(self._writeParameterDataPrototype(ws, nvBlockDescriptor.romBlock),1))
+            lines.extend(self.indentBlock(self._writeParameterDataPrototype(ws, nvBlockDescriptor.romBlock),1))
 
         lines.append(self.indent('<SUPPORT-DIRTY-FLAG>%s</SUPPORT-DIRTY-FLAG>'%(self.toBooleanStr(nvBlockDescriptor.supportDirtyFlag)),1))
 
@@ -1175,7 +1175,7 @@ class CodeBehaviorWriter(ElementWriter):
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%variationPointProxy.name,1))
         binding_time = f" BINDING-TIME=\"{variationPointProxy.binding_time}\"" if variationPointProxy.binding_time is not None else ""    
         if variationPointProxy.adminData is not None:
-            lines.extend(self.indent(self.writeAdminDataXML(variationPointProxy.adminData),1))
+            lines.extend(self.indentBlock(self.writeAdminDataXML(variationPointProxy.adminData),1))
         if variationPointProxy.category is not None:
             lines.append(self.indent(f'<CATEGORY>{variationPointProxy.category}</CATEGORY>',1))
         if variationPointProxy.condition_access is not None:
@@ -82,34 +82,34 @@ class XMLComponentTypeWriter(ElementWriter):
         if isinstance(swc, autosar.component.ServiceComponent):
             lines.append(self.indent('<CATEGORY>ServiceComponent</CATEGORY>',1))
         if swc.adminData is not None:
-            lines.extend(self.indent(self.writeAdminDataXML(swc.adminData),1))
+            lines.extend(self.indentBlock(self.writeAdminDataXML(swc.adminData),1))
         descLines = self.writeDescXML(swc)
         if descLines is not None:
-            lines.extend(self.indent(descLines,1))
+            lines.extend(self.indentBlock(descLines,1))
         lines.append(self.indent('<PORTS>',1))
         for port in swc.providePorts:
-            lines.extend(self.indent(self._writeProvidePortXML(port),2))
+            lines.extend(self.indentBlock(self._writeProvidePortXML(port),2))
         for port in swc.requirePorts:
-            lines.extend(self.indent(self._writeRequirePortXML(port),2))
+            lines.extend(self.indentBlock(self._writeRequirePortXML(port),2))
         lines.append(self.indent('</PORTS>',1))
         if (self.version >= 4.0) and (isinstance(swc, autosar.component.AtomicSoftwareComponent)) and (swc.behavior is not None):
             lines.append(self.indent('<INTERNAL-BEHAVIORS>',1))
-            lines.extend(self.indent(self.behavior_writer.writeInternalBehaviorXML(swc.behavior),2))
+            lines.extend(self.indentBlock(self.behavior_writer.writeInternalBehaviorXML(swc.behavior),2))
             lines.append(self.indent('</INTERNAL-BEHAVIORS>',1))
         if isinstance(swc, autosar.component.CompositionComponent):
-            lines.extend(self.indent(self._writeComponentsXML(ws, swc.components),1))
+            lines.extend(self.indentBlock(self._writeComponentsXML(ws, swc.components),1))
             if (len(swc.assemblyConnectors)>0) or (len(swc.delegationConnectors)>0):
                 lines.append(self.indent('<CONNECTORS>',1))
                 if len(swc.assemblyConnectors)>0:
-                    lines.extend(self.indent(self._writeAssemblyConnectorsXML(ws, swc.assemblyConnectors),2))
+                    lines.extend(self.indentBlock(self._writeAssemblyConnectorsXML(ws, swc.assemblyConnectors),2))
                 if len(swc.delegationConnectors)>0:
-                    lines.extend(self.indent(self._writeDelegationConnectorsXML(ws, swc.delegationConnectors),2))
+                    lines.extend(self.indentBlock(self._writeDelegationConnectorsXML(ws, swc.delegationConnectors),2))
                 lines.append(self.indent('</CONNECTORS>',1))
         if isinstance(swc, autosar.component.NvBlockComponent):
             if (len(swc.nvBlockDescriptors) > 0):
                 lines.append(self.indent('<NV-BLOCK-DESCRIPTORS>',1))
                 for desc in swc.nvBlockDescriptors:
-                    lines.extend(self.indent(self.behavior_writer.writeNvBlockDescriptorXML(desc),2))
+                    lines.extend(self.indentBlock(self.behavior_writer.writeNvBlockDescriptorXML(desc),2))
                 lines.append(self.indent('</NV-BLOCK-DESCRIPTORS>',1))
         if isinstance(swc, autosar.component.ParameterComponent):
             if (len(swc.dataTypeMappingRefs) > 0):
@@ -169,10 +169,10 @@ class XMLComponentTypeWriter(ElementWriter):
                 lines.append(self.indent('</FILTER>',1))
                 lines.append(self.indent('<HANDLE-NEVER-RECEIVED>false</HANDLE-NEVER-RECEIVED>',1))
                 if comspec.initValueRef is not None:
-                    lines.extend(self.indent(self._writeInitValueRefXML(ws, comspec.initValueRef),1))
+                    lines.extend(self.indentBlock(self._writeInitValueRefXML(ws, comspec.initValueRef),1))
                 if comspec.initValue is not None:
                     lines.append(self.indent('<INIT-VALUE>',1))
-                    lines.extend(self.indent(self.writeValueSpecificationXML(comspec.initValue),2))
+                    lines.extend(self.indentBlock(self.writeValueSpecificationXML(comspec.initValue),2))
                     lines.append(self.indent('</INIT-VALUE>',1))
                 lines.append('</NONQUEUED-RECEIVER-COM-SPEC>')
         return lines
@@ -205,7 +205,7 @@ class XMLComponentTypeWriter(ElementWriter):
         if comspec.initValue is not None or comspec.initValueRef is not None:
             lines.append(self.indent('<INIT-VALUE>',1))
             if comspec.initValue is not None:
-                lines.extend(self.indent(self.writeValueSpecificationXML(comspec.initValue),2))
+                lines.extend(self.indentBlock(self.writeValueSpecificationXML(comspec.initValue),2))
             if comspec.initValueRef is not None:
                 lines.append(self.indent('<CONSTANT-REFERENCE>',2))
                 constant = ws.find(comspec.initValueRef)
@@ -226,10 +226,10 @@ class XMLComponentTypeWriter(ElementWriter):
                 raise ValueError('%s: invalid nvData reference name: %s'%(port.ref, comspec.name))
             lines.append('<NV-REQUIRE-COM-SPEC>')
             if comspec.initValueRef is not None:
-                lines.extend(self.indent(self._writeInitValueRefXML(ws, comspec.initValueRef),1))
+                lines.extend(self.indentBlock(self._writeInitValueRefXML(ws, comspec.initValueRef),1))
             if comspec.initValue is not None:
                 lines.append(self.indent('<INIT-VALUE>',1))
-                lines.extend(self.indent(self.writeValueSpecificationXML(comspec.initValue),2))
+                lines.extend(self.indentBlock(self.writeValueSpecificationXML(comspec.initValue),2))
                 lines.append(self.indent('</INIT-VALUE>',1))
             lines.append(self.indent('<VARIABLE-REF DEST="%s">%s</VARIABLE-REF>'%(nvData.tag(self.version), nvData.ref),1))
             lines.append('</NV-REQUIRE-COM-SPEC>')
@@ -261,10 +261,10 @@ class XMLComponentTypeWriter(ElementWriter):
             lines.append(self.indent('<DATA-ELEMENT-REF DEST="%s">%s</DATA-ELEMENT-REF>'%(elem.tag(self.version),elem.ref),1))
             lines.append(self.indent('<USES-END-TO-END-PROTECTION>false</USES-END-TO-END-PROTECTION>',1))
             if comspec.initValueRef is not None:
-                lines.extend(self.indent(self._writeInitValueRefXML(ws, comspec.initValueRef),1))
+                lines.extend(self.indentBlock(self._writeInitValueRefXML(ws, comspec.initValueRef),1))
             if comspec.initValue is not None:
                 lines.append(self.indent('<INIT-VALUE>',1))
-                lines.extend(self.indent(self.writeValueSpecificationXML(comspec.initValue),2))
+                lines.extend(self.indentBlock(self.writeValueSpecificationXML(comspec.initValue),2))
                 lines.append(self.indent('</INIT-VALUE>',1))
             lines.append('</NONQUEUED-SENDER-COM-SPEC>')
         return lines
@@ -287,7 +287,7 @@ class XMLComponentTypeWriter(ElementWriter):
             lines.append('<PARAMETER-PROVIDE-COM-SPEC>')
             if comspec.initValue is not None:
                 lines.append(self.indent('<INIT-VALUE>',1))
-                lines.extend(self.indent(self.writeValueSpecificationXML(comspec.initValue),2))
+                lines.extend(self.indentBlock(self.writeValueSpecificationXML(comspec.initValue),2))
                 lines.append(self.indent('</INIT-VALUE>',1))
             lines.append(self.indent('<PARAMETER-REF DEST="%s">%s</PARAMETER-REF>'%(param.tag(self.version),param.ref),1))
             lines.append('</PARAMETER-PROVIDE-COM-SPEC>')
@@ -313,7 +313,7 @@ class XMLComponentTypeWriter(ElementWriter):
                 lines.append(self.indent('</RAM-BLOCK-INIT-VALUE>',1))
             if comspec.ramBlockInitValue is not None:
                 lines.append(self.indent('<RAM-BLOCK-INIT-VALUE>',1))
-                lines.extend(self.indent(self.writeValueSpecificationXML(comspec.ramBlockInitValue),2))
+                lines.extend(self.indentBlock(self.writeValueSpecificationXML(comspec.ramBlockInitValue),2))
                 lines.append(self.indent('</RAM-BLOCK-INIT-VALUE>',1))
             if comspec.romBlockInitValueRef is not None:
                 constant = ws.find(comspec.romBlockInitValueRef)
@@ -326,7 +326,7 @@ class XMLComponentTypeWriter(ElementWriter):
                 lines.append(self.indent('</ROM-BLOCK-INIT-VALUE>',1))
             if comspec.romBlockInitValue is not None:
                 lines.append(self.indent('<ROM-BLOCK-INIT-VALUE>',1))
-                lines.extend(self.indent(self.writeValueSpecificationXML(comspec.romBlockInitValue),2))
+                lines.extend(self.indentBlock(self.writeValueSpecificationXML(comspec.romBlockInitValue),2))
                 lines.append(self.indent('</ROM-BLOCK-INIT-VALUE>',1))
             lines.append(self.indent('<VARIABLE-REF DEST="%s">%s</VARIABLE-REF>'%(nvData.tag(self.version), nvData.ref),1))
             lines.append('</NV-PROVIDE-COM-SPEC>')
@@ -363,19 +363,19 @@ class XMLComponentTypeWriter(ElementWriter):
                 if elem is None:
                     raise ValueError("%s: Invalid data element name '%s'"%(port.ref,comspec.name))
                 if elem.isQueued:
-                    lines.extend(self.indent(self._writeQueuedSenderComSpecXML(ws, comspec, elem), 2))
+                    lines.extend(self.indentBlock(self._writeQueuedSenderComSpecXML(ws, comspec, elem), 2))
                 else:
-                    lines.extend(self.indent(self._writeUnqueuedSenderComSpecXML(ws, comspec, elem),2))
+                    lines.extend(self.indentBlock(self._writeUnqueuedSenderComSpecXML(ws, comspec, elem),2))
             elif isinstance(comspec, autosar.port.OperationComSpec):
                 operation=portInterface.find(comspec.name)
                 if operation is None:
                     raise ValueError("%s: Invalid operation name '%s'"%(port.ref, comspec.name))
-                lines.extend(self.indent(self._writeServerComSpecXML(comspec, operation), 2))
+                lines.extend(self.indentBlock(self._writeServerComSpecXML(comspec, operation), 2))
             elif isinstance(comspec, autosar.port.ParameterComSpec):
                 param=portInterface.find(comspec.name)
                 if param is None:
                     raise ValueError("%s: Invalid parameter name '%s'"%(port.ref, comspec.name))
-                lines.extend(self.indent(self._writeParameterProvideComSpecXML(ws, comspec, param),2))
+                lines.extend(self.indentBlock(self._writeParameterProvideComSpecXML(ws, comspec, param),2))
             elif isinstance(comspec, autosar.port.ModeSwitchComSpec):
                 modeGroup = None
                 if comspec.name is not None:
@@ -386,12 +386,12 @@ class XMLComponentTypeWriter(ElementWriter):
                     modeGroup = ws.find(comspec.modeGroupRef)
                     if modeGroup is None:
                         raise autosar.base.InvalidModeGroupRef(comspec.modeGroupRef)
-                lines.extend(self.indent(self._writeModeSwitchSenderComSpecXML(ws, comspec, modeGroup),2))
+                lines.extend(self.indentBlock(self._writeModeSwitchSenderComSpecXML(ws, comspec, modeGroup),2))
             elif isinstance(comspec, autosar.port.NvProvideComSpec):
                 nvProvideComSpec=portInterface.find(comspec.name)
                 if nvProvideComSpec is None:
                     raise ValueError("%s: Invalid parameter name '%s'"%(port.ref, comspec.name))
-                lines.extend(self.indent(self._writeNvDataProvideComSpecXML(port, ws, portInterface, comspec),2))
+                lines.extend(self.indentBlock(self._writeNvDataProvideComSpecXML(port, ws, portInterface, comspec),2))
             else:
                 raise NotImplementedError(str(type(comspec)))
         lines.append(self.indent('</PROVIDED-COM-SPECS>',1))
@@ -412,21 +412,21 @@ class XMLComponentTypeWriter(ElementWriter):
                         modeGroup = ws.find(comspec.modeGroupRef)
                         if modeGroup is None:
                             raise autosar.base.InvalidModeGroupRef(comspec.modeGroupRef)
-                    lines.extend(self.indent(self._writeModeSwitchReceiverComSpecXML(ws, portInterface, comspec, modeGroup),2))
+                    lines.extend(self.indentBlock(self._writeModeSwitchReceiverComSpecXML(ws, portInterface, comspec, modeGroup),2))
                 elif isinstance(portInterface, autosar.portinterface.ParameterInterface):
-                    lines.extend(self.indent(self._writeParameterRequireComSpecXML(port, portInterface, comspec),2))
+                    lines.extend(self.indentBlock(self._writeParameterRequireComSpecXML(port, portInterface, comspec),2))
                 elif isinstance(portInterface, autosar.portinterface.SenderReceiverInterface):
                     dataElem=portInterface.find(comspec.name)
                     if dataElem is None:
                         raise ValueError("%s: Invalid comspec name '%s'"%(port.ref, comspec.name))
-                    lines.extend(self.indent(self._writeDataReceiverComSpecXML(ws, dataElem, comspec),2))
+                    lines.extend(self.indentBlock(self._writeDataReceiverComSpecXML(ws, dataElem, comspec),2))
                 elif isinstance(portInterface, autosar.portinterface.ClientServerInterface):
                     operation=portInterface.find(comspec.name)
                     if operation is None:
                         raise ValueError("%s: Invalid comspec name '%s'"%(port.ref,comspec.name))
-                    lines.extend(self.indent(self._writeOperationComSpec(operation),2))
+                    lines.extend(self.indentBlock(self._writeOperationComSpec(operation),2))
                 elif isinstance(portInterface, autosar.portinterface.NvDataInterface):
-                    lines.extend(self.indent(self._writeNvDataRequireComSpecXML(port, ws, portInterface, comspec),2))
+                    lines.extend(self.indentBlock(self._writeNvDataRequireComSpecXML(port, ws, portInterface, comspec),2))
                 else:
                     raise NotImplementedError(str(type(portInterface)))
             else:
@@ -434,14 +434,14 @@ class XMLComponentTypeWriter(ElementWriter):
                     operation=portInterface.find(comspec.name)
                     if operation is None:
                         raise ValueError("%s: invalid comspec name '%s'"%(port.ref,comspec.name))
-                    lines.extend(self.indent(self._writeOperationComSpec(operation),2))
+                    lines.extend(self.indentBlock(self._writeOperationComSpec(operation),2))
                 elif isinstance(portInterface, autosar.portinterface.ParameterInterface):
                     pass #not supported in AUTOSAR 3
                 else:
                     dataElem=portInterface.find(comspec.name)
                     if dataElem is None:
                         raise ValueError("%s: invalid comspec name '%s'"%(port.ref, comspec.name))
-                    lines.extend(self.indent(self._writeDataReceiverComSpecXML(ws, dataElem, comspec),2))
+                    lines.extend(self.indentBlock(self._writeDataReceiverComSpecXML(ws, dataElem, comspec),2))
         lines.append(self.indent('</REQUIRED-COM-SPECS>',1))
         return lines
 
@@ -456,7 +456,7 @@ class XMLComponentTypeWriter(ElementWriter):
         lines.append(f'<{port.tag()}>')
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%port.name,1))
         if port.adminData is not None:
-            lines.extend(self.indent(self.writeAdminDataXML(port.adminData),1))
+            lines.extend(self.indentBlock(self.writeAdminDataXML(port.adminData),1))
         if isinstance(portInterface, autosar.portinterface.ClientServerInterface) and isinstance(port.parent, autosar.component.CompositionComponent) or len(port.comspec)==0:
             if self.version<4.0:
                 if isinstance(port, autosar.component.ProvidePort) or isinstance(port, autosar.component.ProvideRequirePort):
@@ -543,7 +543,7 @@ class XMLComponentTypeWriter(ElementWriter):
             if elem.resourceConsumption is not None:
                 lines.append(self.indent('<RESOURCE-CONSUMPTION>', 1))
                 lines.append(self.indent('<{tag}>{text}</{tag}>'.format(tag='SHORT-NAME', text=elem.resourceConsumption.name), 2))
-                lines.extend(self.indent(self._writeMemorySectionXML(ws, elem.resourceConsumption.memorySections), 2))
+                lines.extend(self.indentBlock(self._writeMemorySectionXML(ws, elem.resourceConsumption.memorySections), 2))
                 lines.append(self.indent('</RESOURCE-CONSUMPTION>', 1))
 
             if elem.swVersion is not None:
@@ -665,9 +665,9 @@ class XMLComponentTypeWriter(ElementWriter):
             if innerPort is None:
                 raise ValueError('invalid reference: ' +connector.innerPortInstanceRef.portRef)
             if self.version >= 4.0:
-                lines.extend(self.indent(self._writeInnerPortRefV4(innerComponent,innerPort),2))
+                lines.extend(self.indentBlock(self._writeInnerPortRefV4(innerComponent,innerPort),2))
             else:
-                lines.extend(self.indent(self._writeInnerPortRefV3(innerComponent,innerPort),2))
+                lines.extend(self.indentBlock(self._writeInnerPortRefV3(innerComponent,innerPort),2))
             lines.append(self.indent('</%s>'%connector.innerPortInstanceRef.tag(self.version), 1))
             outerPort = ws.find(connector.outerPortRef.portRef)
             if outerPort is None:
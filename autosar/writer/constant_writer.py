@@ -26,18 +26,18 @@ class XMLConstantWriter(ElementWriter):
         lines.append('<CONSTANT-SPECIFICATION>')
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%elem.name,1))
         if elem.adminData is not None:
-            lines.extend(self.indent(self.writeAdminDataXML(elem.adminData),1))
+            lines.extend(self.indentBlock(self.writeAdminDataXML(elem.adminData),1))
         if self.version>=4.0:
-            lines.extend(self.indent(self._writeValueXMLV4(elem.value),1))
+            lines.extend(self.indentBlock(self._writeValueXMLV4(elem.value),1))
         else:
-            lines.extend(self.indent(self._writeValueXMLV3(elem.value),1))
+            lines.extend(self.indentBlock(self._writeValueXMLV3(elem.value),1))
         lines.append('</CONSTANT-SPECIFICATION>')
         return lines
 
     def _writeValueXMLV3(self,elem):
         lines=[]
         lines.append('<VALUE>')
-        lines.extend(self.indent(self._writeLiteralValueXML(elem),1))
+        lines.extend(self.indentBlock(self._writeLiteralValueXML(elem),1))
         lines.append('</VALUE>')
         return lines
 
@@ -77,7 +77,7 @@ class XMLConstantWriter(ElementWriter):
         else:
             lines.append(self.indent('<ELEMENTS>',1))
             for childElem in elem.elements:
-                lines.extend(self.indent(self._writeLiteralValueXML(childElem),2))
+                lines.extend(self.indentBlock(self._writeLiteralValueXML(childElem),2))
             lines.append(self.indent('</ELEMENTS>',1))
         lines.append('</RECORD-SPECIFICATION>')
         return lines
@@ -115,7 +115,7 @@ class XMLConstantWriter(ElementWriter):
         else:
             lines.append(self.indent('<ELEMENTS>',1))
             for childElem in elem.elements:
-                lines.extend(self.indent(self._writeLiteralValueXML(childElem),2))
+                lines.extend(self.indentBlock(self._writeLiteralValueXML(childElem),2))
             lines.append(self.indent('</ELEMENTS>',1))
 
         lines.append('</ARRAY-SPECIFICATION>')
@@ -124,7 +124,7 @@ class XMLConstantWriter(ElementWriter):
     def _writeValueXMLV4(self, value):
         lines=[]
         lines.append('<VALUE-SPEC>')
-        lines.extend(self.indent(self.writeValueSpecificationXML(value),1))
+        lines.extend(self.indentBlock(self.writeValueSpecificationXML(value),1))
         lines.append('</VALUE-SPEC>')
         return lines
 
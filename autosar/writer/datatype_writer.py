@@ -54,7 +54,7 @@ class XMLDataTypeWriter(ElementWriter):
         lines = ["<%s>"%elem.tag(self.version)]
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%elem.name,1))
         tmp = self.writeDescXML(elem)
-        if tmp is not None: lines.extend(self.indent(tmp,1))
+        if tmp is not None: lines.extend(self.indentBlock(tmp,1))
         if elem.compuMethodRef is not None:
             lines.append(self.indent('<SW-DATA-DEF-PROPS>',1))
             lines.append(self.indent('<COMPU-METHOD-REF DEST="COMPU-METHOD">%s</COMPU-METHOD-REF>'%elem.compuMethodRef,2))
@@ -72,7 +72,7 @@ class XMLDataTypeWriter(ElementWriter):
         lines.append("<%s>"%elem.tag(self.version))
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%elem.name,1))
         tmp = self.writeDescXML(elem)
-        if tmp is not None: lines.extend(self.indent(tmp,1))
+        if tmp is not None: lines.extend(self.indentBlock(tmp,1))
         lines.append(self.indent('<ELEMENTS>',1))
         for childElem in elem.elements:
             lines.append(self.indent('<RECORD-ELEMENT>',2))
@@ -97,7 +97,7 @@ class XMLDataTypeWriter(ElementWriter):
         if elem.category is not None:
             lines.append(self.indent('<CATEGORY>{}</CATEGORY>'.format(elem.category),1))
         if elem.adminData is not None:
-            lines.extend(self.indent(self.writeAdminDataXML(elem.adminData),1))
+            lines.extend(self.indentBlock(self.writeAdminDataXML(elem.adminData),1))
         if elem.unitRef is not None:
             unit = ws.find(elem.unitRef)
             if unit is None:
@@ -105,10 +105,10 @@ class XMLDataTypeWriter(ElementWriter):
             lines.append(self.indent('<UNIT-REF DEST="{0}">{1}</UNIT-REF>'.format(unit.tag(self.version),elem.unitRef),1))
         if elem.intToPhys is not None:
             tag = 'COMPU-INTERNAL-TO-PHYS'
-            lines.extend(self.indent(self._writeComputationXML(ws, elem.intToPhys, tag),1))
+            lines.extend(self.indentBlock(self._writeComputationXML(ws, elem.intToPhys, tag),1))
         if elem.physToInt is not None:
             tag = 'COMPU-PHYS-TO-INTERNAL'
-            lines.extend(self.indent(self._writeComputationXML(ws, elem.physToInt, tag),1))
+            lines.extend(self.indentBlock(self._writeComputationXML(ws, elem.physToInt, tag),1))
         lines.append('</{}>'.format(elem.tag(self.version)))
         return lines
 
@@ -118,7 +118,7 @@ class XMLDataTypeWriter(ElementWriter):
         lines.append('<{}>'.format(tag))
         lines.append(self.indent('<COMPU-SCALES>',1))
         for compuScale in computation.elements:
-            lines.extend(self.indent(self._writeCompuScaleXML(ws, compuScale), 2))
+            lines.extend(self.indentBlock(self._writeCompuScaleXML(ws, compuScale), 2))
         lines.append(self.indent('</COMPU-SCALES>',1))
         if computation.defaultValue is not None:
             lines.append(self.indent('<COMPU-DEFAULT-VALUE>', 1))
@@ -148,9 +148,9 @@ class XMLDataTypeWriter(ElementWriter):
                 lines.append(self.indent('<LOWER-LIMIT>%d</LOWER-LIMIT>'%elem.lowerLimit, 1))
                 lines.append(self.indent('<UPPER-LIMIT>%d</UPPER-LIMIT>'%elem.upperLimit, 1))
         if elem.offset is not None or elem.numerator is not None or elem.denominator is not None:
-            lines.extend(self.indent(self._writeCompuRationalXML(elem),1))
+            lines.extend(self.indentBlock(self._writeCompuRationalXML(elem),1))
         if elem.textValue is not None:
-            lines.extend(self.indent(self._writeCompuConstXML(elem),1))
+            lines.extend(self.indentBlock(self._writeCompuConstXML(elem),1))
         lines.append('</{}>'.format(elem.tag(self.version)))
         return lines
 
@@ -197,7 +197,7 @@ class XMLDataTypeWriter(ElementWriter):
         lines.append("<%s>"%elem.tag(self.version))
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%elem.name,1))
         tmp = self.writeDescXML(elem)
-        if tmp is not None: lines.extend(self.indent(tmp,1))
+        if tmp is not None: lines.extend(self.indentBlock(tmp,1))
         lines.append(self.indent('<ELEMENT>',1))
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%elem.name,2))
         dataType=ws.find(elem.typeRef)
@@ -214,7 +214,7 @@ class XMLDataTypeWriter(ElementWriter):
         lines.append("<%s>"%elem.tag(self.version))
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%elem.name,1))
         tmp = self.writeDescXML(elem)
-        if tmp is not None: lines.extend(self.indent(tmp,1))
+        if tmp is not None: lines.extend(self.indentBlock(tmp,1))
         lines.append("</%s>"%elem.tag(self.version))
         return lines
 
@@ -224,7 +224,7 @@ class XMLDataTypeWriter(ElementWriter):
         lines.append("<%s>"%elem.tag(self.version))
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%elem.name,1))
         tmp = self.writeDescXML(elem)
-        if tmp is not None: lines.extend(self.indent(tmp,1))
+        if tmp is not None: lines.extend(self.indentBlock(tmp,1))
         if elem.minValType=="INFINITE":
             lines.append(self.indent('<LOWER-LIMIT INTERVAL-TYPE="INFINITE"></LOWER-LIMIT>',1))
         else:
@@ -250,7 +250,7 @@ class XMLDataTypeWriter(ElementWriter):
         lines.append("<%s>"%elem.tag(self.version))
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%elem.name,1))
         tmp = self.writeDescXML(elem)
-        if tmp is not None: lines.extend(self.indent(tmp,1))
+        if tmp is not None: lines.extend(self.indentBlock(tmp,1))
         lines.append(self.indent('<ENCODING>%s</ENCODING>'%elem.encoding,1))
         lines.append(self.indent('<MAX-NUMBER-OF-CHARS>%d</MAX-NUMBER-OF-CHARS>'%elem.length,1))
         lines.append("</%s>"%elem.tag(self.version))
@@ -265,10 +265,10 @@ class XMLDataTypeWriter(ElementWriter):
         lines.append("<%s>"%elem.tag(self.version))
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%elem.name,1))
         if elem.adminData is not None:
-            lines.extend(self.indent(self.writeAdminDataXML(elem.adminData),1))
+            lines.extend(self.indentBlock(self.writeAdminDataXML(elem.adminData),1))
         lines.append(self.indent('<DATA-CONSTR-RULES>', 1))
         for rule in elem.rules:
-            lines.extend(self.indent(self.writeDataConstraintRuleXML(rule, elem.constraintLevel), 2))
+            lines.extend(self.indentBlock(self.writeDataConstraintRuleXML(rule, elem.constraintLevel), 2))
         lines.append(self.indent('</DATA-CONSTR-RULES>', 1))
         lines.append("</%s>"%elem.tag(self.version))
         return lines
@@ -302,23 +302,23 @@ class XMLDataTypeWriter(ElementWriter):
         lines.append("<%s>"%elem.tag(self.version))
         lines.append(self.indent("<SHORT-NAME>%s</SHORT-NAME>"%elem.name, 1))
         tmp = self.writeDescXML(elem)
-        if tmp is not None: lines.extend(self.indent(tmp,1))
+        if tmp is not None: lines.extend(self.indentBlock(tmp,1))
         lines.append(self.indent("<CATEGORY>%s</CATEGORY>" % elem.category, 1))
         if elem.adminData is not None:
-            lines.extend(self.indent(self.writeAdminDataXML(elem.adminData),1))
+            lines.extend(self.indentBlock(self.writeAdminDataXML(elem.adminData),1))
         lines.append(self.indent("<SW-DATA-DEF-PROPS>", 1))
         if len(elem.variantProps)>=0:
-            lines.extend(self.indent(self.writeSwDataDefPropsVariantsXML(ws, elem.variantProps),2))
+            lines.extend(self.indentBlock(self.writeSwDataDefPropsVariantsXML(ws, elem.variantProps),2))
         lines.append(self.indent("</SW-DATA-DEF-PROPS>", 1))
         if elem.dynamicArraySizeProfile is not None:
             lines.append(self.indent("<DYNAMIC-ARRAY-SIZE-PROFILE>%s</DYNAMIC-ARRAY-SIZE-PROFILE>"%(str(elem.dynamicArraySizeProfile)), 1))
         if len(elem.subElements)>0:
             lines.append(self.indent("<SUB-ELEMENTS>", 1))
             for subElem in elem.subElements:
-                lines.extend(self.indent(self.writeImplementationDataElementXML(ws, subElem),2))
+                lines.extend(self.indentBlock(self.writeImplementationDataElementXML(ws, subElem),2))
             lines.append(self.indent("</SUB-ELEMENTS>", 1))
         if elem.symbolProps is not None:
-            lines.extend(self.indent(self.writeSymbolPropsXML(elem.symbolProps),1))
+            lines.extend(self.indentBlock(self.writeSymbolPropsXML(elem.symbolProps),1))
         if elem.typeEmitter is not None:
             lines.append(self.indent("<TYPE-EMITTER>%s</TYPE-EMITTER>"%(elem.typeEmitter), 1))
         lines.append("</%s>"%elem.tag(self.version))
@@ -332,7 +332,7 @@ class XMLDataTypeWriter(ElementWriter):
             lines.append(self.indent('<TARGET-CATEGORY>%s</TARGET-CATEGORY>'%(elem.targetCategory),1))
         lines.append(self.indent("<SW-DATA-DEF-PROPS>", 1))
         if len(elem.variants)>=0:
-            lines.extend(self.indent(self.writeSwDataDefPropsVariantsXML(ws, elem.variants),2))
+            lines.extend(self.indentBlock(self.writeSwDataDefPropsVariantsXML(ws, elem.variants),2))
         lines.append(self.indent("</SW-DATA-DEF-PROPS>", 1))
         lines.append("</%s>"%elem.tag(self.version))
         return lines
@@ -345,11 +345,11 @@ class XMLDataTypeWriter(ElementWriter):
         lines.append("<{}>".format(elem.tag(self.version)))
         lines.append(self.indent('<SHORT-NAME>{}</SHORT-NAME>'.format(elem.name),1))
         tmp = self.writeDescXML(elem)
-        if tmp is not None: lines.extend(self.indent(tmp,1))
+        if tmp is not None: lines.extend(self.indentBlock(tmp,1))
         if elem.category is not None:
             lines.append(self.indent('<CATEGORY>{}</CATEGORY>'.format(elem.category),1))
         if elem.adminData is not None:
-            lines.extend(self.indent(self.writeAdminDataXML(elem.adminData),1))
+            lines.extend(self.indentBlock(self.writeAdminDataXML(elem.adminData),1))
         if elem.size is not None:
             lines.append(self.indent('<BASE-TYPE-SIZE>{:d}</BASE-TYPE-SIZE>'.format(elem.size),1))
         if elem.typeEncoding is None and ws.profile.swBaseTypeEncodingDefault is not None:
@@ -367,11 +367,11 @@ class XMLDataTypeWriter(ElementWriter):
         lines.append("<%s>"%elem.tag(self.version))
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%elem.name,1))
         tmp = self.writeDescXML(elem)
-        if tmp is not None: lines.extend(self.indent(tmp,1))
+        if tmp is not None: lines.extend(self.indentBlock(tmp,1))
         if elem.category is not None:
             lines.append(self.indent('<CATEGORY>%s</CATEGORY>'%elem.category,1))
         if elem.adminData is not None:
-            lines.extend(self.indent(self.writeAdminDataXML(elem.adminData),1))
+            lines.extend(self.indentBlock(self.writeAdminDataXML(elem.adminData),1))
         if elem.arraySize is not None:
             lines.append(self.indent('<ARRAY-SIZE>%s</ARRAY-SIZE>'%elem.arraySize,1))
         if elem.arraySizeSemantics is not None:
@@ -380,7 +380,7 @@ class XMLDataTypeWriter(ElementWriter):
             lines.append(self.indent('<ARRAY-SIZE-HANDLING>{}</ARRAY-SIZE-HANDLING>'.format(elem.sizeHandling.value),1))
         if len(elem.variantProps)>=0:
             lines.append(self.indent("<SW-DATA-DEF-PROPS>", 1))
-            lines.extend(self.indent(self.writeSwDataDefPropsVariantsXML(ws, elem.variantProps),2))
+            lines.extend(self.indentBlock(self.writeSwDataDefPropsVariantsXML(ws, elem.variantProps),2))
             lines.append(self.indent("</SW-DATA-DEF-PROPS>", 1))
         lines.append("</%s>"%elem.tag(self.version))
         return lines
@@ -402,12 +402,12 @@ class XMLDataTypeWriter(ElementWriter):
         if len(dataTypeMappings) > 0:
             lines.append(self.indent('<DATA-TYPE-MAPS>',1))
             for dataTypeMapping in dataTypeMappings:
-                lines.extend(self.indent(self.writeDataTypeMapXML(ws, dataTypeMapping),2))
+                lines.extend(self.indentBlock(self.writeDataTypeMapXML(ws, dataTypeMapping),2))
             lines.append(self.indent('</DATA-TYPE-MAPS>',1))
         if len(modeRequestMappings) > 0:
             lines.append(self.indent('<MODE-REQUEST-TYPE-MAPS>',1))
             for modeRequestMapping in modeRequestMappings:
-                lines.extend(self.indent(self.writeModeRequestMapXML(ws, modeRequestMapping),2))
+                lines.extend(self.indentBlock(self.writeModeRequestMapXML(ws, modeRequestMapping),2))
             lines.append(self.indent('</MODE-REQUEST-TYPE-MAPS>',1))
         lines.append("</%s>"%elem.tag(self.version))
         return lines
@@ -450,12 +450,12 @@ class XMLDataTypeWriter(ElementWriter):
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%elem.name,1))
         tmp = self.writeDescXML(elem)
         if tmp is not None:
-            lines.extend(self.indent(tmp,1))
+            lines.extend(self.indentBlock(tmp,1))
         if elem.category is not None:
             lines.append(self.indent('<CATEGORY>%s</CATEGORY>'%elem.category,1))
         if len(elem.variantProps)>=0:
             lines.append(self.indent("<SW-DATA-DEF-PROPS>", 1))
-            lines.extend(self.indent(self.writeSwDataDefPropsVariantsXML(ws, elem.variantProps),2))
+            lines.extend(self.indentBlock(self.writeSwDataDefPropsVariantsXML(ws, elem.variantProps),2))
             lines.append(self.indent("</SW-DATA-DEF-PROPS>", 1))
         lines.append("</%s>"%elem.tag(self.version))
         return lines
@@ -470,14 +470,14 @@ class XMLDataTypeWriter(ElementWriter):
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%elem.name,1))
         tmp = self.writeDescXML(elem)
         if tmp is not None:
-            lines.extend(self.indent(tmp,1))
+            lines.extend(self.indentBlock(tmp,1))
         if elem.category is not None:
             lines.append(self.indent('<CATEGORY>%s</CATEGORY>'%elem.category,1))
         if len(elem.variantProps)>=0:
             lines.append(self.indent("<SW-DATA-DEF-PROPS>", 1))
-            lines.extend(self.indent(self.writeSwDataDefPropsVariantsXML(ws, elem.variantProps),2))
+            lines.extend(self.indentBlock(self.writeSwDataDefPropsVariantsXML(ws, elem.variantProps),2))
             lines.append(self.indent("</SW-DATA-DEF-PROPS>", 1))
-        lines.extend(self.indent(self.writeApplicationArrayDataElementXml(ws, elem.element), 1))
+        lines.extend(self.indentBlock(self.writeApplicationArrayDataElementXml(ws, elem.element), 1))
         lines.append("</%s>"%elem.tag(self.version))
         return lines
 
@@ -522,7 +522,7 @@ class XMLDataTypeWriter(ElementWriter):
             lines.append(self.indent('<CATEGORY>{}</CATEGORY>'.format(elem.category),1))
         lines.append(self.indent('<ELEMENTS>', 1))
         for childElem in elem.elements:
-            lines.extend(self.indent(self._ApplicationRecordElementXML(ws, childElem), 2))
+            lines.extend(self.indentBlock(self._ApplicationRecordElementXML(ws, childElem), 2))
         lines.append(self.indent('</ELEMENTS>', 1))
         lines.append("</%s>"%elem.tag(self.version))
         return lines
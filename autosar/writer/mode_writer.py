@@ -34,7 +34,7 @@ class XMLModeWriter(ElementWriter):
         if modeDeclGroup.onTransitionValue is not None:
             lines.append(self.indent('<ON-TRANSITION-VALUE>%s</ON-TRANSITION-VALUE>'%modeDeclGroup.onTransitionValue,1))
         if modeDeclGroup.adminData is not None:
-            lines.extend(self.indent(self.writeAdminDataXML(modeDeclGroup.adminData),1))
+            lines.extend(self.indentBlock(self.writeAdminDataXML(modeDeclGroup.adminData),1))
         if modeDeclGroup.initialModeRef is not None:
             modeElem = ws.find(modeDeclGroup.initialModeRef)
             if (modeElem is None):
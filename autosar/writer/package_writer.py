@@ -1,5 +1,5 @@
 from autosar.writer.writer_base import BaseWriter, ElementWriter
-from autosar.base import applyFilter
+from autosar.base import applyFilter, compileFilters, RefFilter
 import collections.abc
 import autosar.behavior
 import autosar.component
@@ -32,14 +32,46 @@ class PackageWriter(BaseWriter):
                     self.codeSwitcher[elementName] = elementWriter
             self.registeredWriters[writerName] = elementWriter
 
-    def toXML(self, package, filters, ignore):
-        lines=[]
-        lines.extend(self.beginPackage(package.name))
+    def toXML(self, package, filters, ignore, indent=0):
+        lines = []
+        for block in self.iterXML(package, filters, ignore, indent):
+            lines.extend(block)
+        return lines
+
+    def iterXML(self, package, filters, ignore, indent=0):
+        """
+        Generator yielding the XML lines of package and its sub-packages, indented by indent levels, as lists of lines.
+        Element writers are invoked one element at a time and their (nested) lines are indented once by appendLines,
+        only the lines of a single element are held in memory.
+        """
+        for _, lines in self.iterXMLSplit(package, [filters], ignore, indent):
+            yield lines
+
+    def iterXMLSplit(self, package, filtersList, ignore, indent=0):
+        """
+        Same as iterXML for several outputs in a single traversal, output i being filtered by filtersList[i].
+        Yields (targets, lines) tuples where targets is a tuple of the indices of the outputs the lines belong to.
+        Each element is written once, the lines of an output are identical to iterXML(package, filtersList[i], ignore, indent).
+        """
+        #package is written to all outputs, also when it does not match their filters (its content is filtered)
+        states = [compileFilters(filters).descend(package.ref) or RefFilter([]) for filters in filtersList]
+        return self._iterXMLSplit(package, states, ignore, indent)
+
+    def _iterXMLSplit(self, package, states, ignore, indent):
+        """
+        Implements iterXMLSplit, states holds the RefFilter (see autosar.base.compileFilters) of package for each output,
+        None for outputs package is not written to. The filters are matched by name while descending the package tree.
+        """
+        targets = tuple(i for (i, state) in enumerate(states) if state is not None)
+        prefix = self.indentChar*indent
+        lines = [prefix+line for line in self.beginPackage(package.name)]
+        innerPrefix = prefix+self.indentChar
+        elementPrefix = innerPrefix+self.indentChar
         if len(package.elements)>0:
-            lines.append(self.indent("<ELEMENTS>",1))
+            lines.append(innerPrefix+"<ELEMENTS>")
+            yield targets, lines
             for elem in package.elements:
-                elemRef = elem.ref
-                ignoreElem=True if (isinstance(ignore, collections.abc.Iterable) and elemRef in ignore) else False
+                ignoreElem=True if (isinstance(ignore, collections.abc.Iterable) and elem.ref in ignore) else False
                 #if SWC was ignored by user, also ignore its InternalBehavior and SwcImplementation elements in case they are in the same package
                 if not ignoreElem and isinstance(elem, autosar.behavior.InternalBehavior):
                     if (isinstance(ignore, collections.abc.Iterable) and elem.componentRef in ignore):
@@ -49,7 +81,13 @@ class PackageWriter(BaseWriter):
                     if behavior is not None:
                         if (isinstance(ignore, collections.abc.Iterable) and behavior.componentRef in ignore):
                             ignoreElem = True
-                if not ignoreElem and applyFilter(elemRef, filters):
+                if ignoreElem:
+                    continue
+                if len(targets) == 1:
+                    elemTargets = targets if states[targets[0]].matches(elem.name) else ()
+                else:
+                    elemTargets = tuple(i for i in targets if states[i].matches(elem.name))
+                if len(elemTargets) > 0:
                     elementName = elem.__class__.__name__
                     elementWriter = self.xmlSwitcher.get(elementName)
                     if elementWriter is not None:
@@ -58,35 +96,38 @@ class PackageWriter(BaseWriter):
                             print("[PackageWriter] No return value: %s"%elementName)
                             continue
                         else:
-                            lines.extend(self.indent(result,2))
+                            lines = []
+                            self.appendLines(lines, result, elementPrefix)
+                            yield elemTargets, lines
                     else:
                         package.unhandledWriter.add(elementName)
-            lines.append(self.indent("</ELEMENTS>",1))
+            lines = [innerPrefix+"</ELEMENTS>"]
         else:
             if self.version<4.0:
-                lines.append(self.indent("<ELEMENTS/>",1))
+                lines.append(innerPrefix+"<ELEMENTS/>")
         if len(package.subPackages)>0:
-            numPackets = 0
             if self.version >= 3.0 and self.version < 4.0:
-                for subPackage in package.subPackages:
-                    if applyFilter(subPackage.ref, filters):
-                        if numPackets == 0:
-                            lines.append(self.indent("<SUB-PACKAGES>",1))
-                        lines.extend(self.indent(self.toXML(subPackage, filters, ignore),2))
-                        numPackets += 1
-                if numPackets > 0:
-                    lines.append(self.indent("</SUB-PACKAGES>",1))
+                tag = "SUB-PACKAGES"
             elif self.version >= 4.0:
+                tag = "AR-PACKAGES"
+            else:
+                tag = None
+            if tag is not None:
+                yield targets, lines
+                lines = []
+                opened = [] #outputs having written a sub-package
                 for subPackage in package.subPackages:
-                    if applyFilter(subPackage.ref, filters):
-                        if numPackets == 0:
-                            lines.append(self.indent("<AR-PACKAGES>",1))
-                        lines.extend(self.indent(self.toXML(subPackage, filters, ignore),2))
-                        numPackets += 1
-                if numPackets > 0:
-                    lines.append(self.indent("</AR-PACKAGES>",1))
-        lines.extend(self.endPackage())
-        return lines
+                    subStates = [None if state is None else state.child(subPackage.name) for state in states]
+                    newTargets = tuple(i for (i, state) in enumerate(subStates) if (state is not None) and (i not in opened))
+                    if len(newTargets) > 0:
+                        yield newTargets, [innerPrefix+"<%s>"%tag]
+                        opened.extend(newTargets)
+                    if any(state is not None for state in subStates):
+                        yield from self._iterXMLSplit(subPackage, subStates, ignore, indent+2)
+                if len(opened) > 0:
+                    yield tuple(sorted(opened)), [innerPrefix+"</%s>"%tag]
+        lines.extend(prefix+line for line in self.endPackage())
+        yield targets, lines
 
     def toCode(self, package, filters, ignore, localvars, isTemplate):
         lines=[]
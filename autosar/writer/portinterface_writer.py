@@ -50,28 +50,28 @@ class XMLPortInterfaceWriter(ElementWriter):
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%portInterface.name,1))
         descLines = self.writeDescXML(portInterface)
         if descLines is not None:
-            lines.extend(self.indent(descLines,1))
+            lines.extend(self.indentBlock(descLines,1))
         if portInterface.adminData is not None:
-            lines.extend(self.indent(self.writeAdminDataXML(portInterface.adminData),1))
+            lines.extend(self.indentBlock(self.writeAdminDataXML(portInterface.adminData),1))
         lines.append(self.indent('<IS-SERVICE>%s</IS-SERVICE>'%self.toBooleanStr(portInterface.isService),1))
         if (self.version >= 4.0) and (portInterface.serviceKind is not None):
             lines.append(self.indent('<SERVICE-KIND>%s</SERVICE-KIND>'%portInterface.serviceKind,1))
         if len(portInterface.dataElements)>0:
             lines.append(self.indent('<DATA-ELEMENTS>',1))
             for elem in portInterface.dataElements:
-                lines.extend(self.indent(self.writeDataElementXML(elem),2))
+                lines.extend(self.indentBlock(self.writeDataElementXML(elem),2))
             lines.append(self.indent('</DATA-ELEMENTS>',1))
         else:
             lines.append(self.indent('<DATA-ELEMENTS/>',1))
         if len(portInterface.modeGroups) > 0:
             lines.append(self.indent('<MODE-GROUPS>',1))
             for group in portInterface.modeGroups:
-                lines.extend(self.indent(self.writeModeGroupXML(group),2))
+                lines.extend(self.indentBlock(self.writeModeGroupXML(group),2))
             lines.append(self.indent('</MODE-GROUPS>',1))
         if len(portInterface.invalidationPolicies)>0:
             lines.append(self.indent('<INVALIDATION-POLICYS>',1))
             for invalidationPolicy in portInterface.invalidationPolicies:
-                lines.extend(self.indent(self.writeInvalidationPolicyXML(ws, invalidationPolicy),2))
+                lines.extend(self.indentBlock(self.writeInvalidationPolicyXML(ws, invalidationPolicy),2))
             lines.append(self.indent('</INVALIDATION-POLICYS>',1))
         lines.append('</SENDER-RECEIVER-INTERFACE>')
         return lines
@@ -85,7 +85,7 @@ class XMLPortInterfaceWriter(ElementWriter):
         if len(portInterface.elements)>0:
             lines.append(self.indent('<CALPRM-ELEMENTS>',1))
             for elem in portInterface.elements:
-                lines.extend(self.indent(self.writeCalParamElementXML(elem),2))
+                lines.extend(self.indentBlock(self.writeCalParamElementXML(elem),2))
             lines.append(self.indent('</CALPRM-ELEMENTS>',1))
         else:
             lines.append(self.indent('<CALPRM-ELEMENTS/>',1))
@@ -101,7 +101,7 @@ class XMLPortInterfaceWriter(ElementWriter):
         ws = elem.rootWS()
 
         if elem.adminData is not None:
-            lines.extend(self.indent(self.writeAdminDataXML(elem.adminData),1))
+            lines.extend(self.indentBlock(self.writeAdminDataXML(elem.adminData),1))
         if elem.swAddressMethodRef is not None:
             lines.append(self.indent('<SW-DATA-DEF-PROPS>',1))
             swAddrMethod = ws.find(elem.swAddressMethodRef)
@@ -126,11 +126,11 @@ class XMLPortInterfaceWriter(ElementWriter):
         lines.append('<%s>'%portInterface.tag(self.version))
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%portInterface.name,1))
         if portInterface.adminData is not None:
-            lines.extend(self.indent(self.writeAdminDataXML(portInterface.adminData),1))
+            lines.extend(self.indentBlock(self.writeAdminDataXML(portInterface.adminData),1))
         if len(portInterface.parameters)>0:
             lines.append(self.indent('<PARAMETERS>',1))
             for elem in portInterface.parameters:
-                lines.extend(self.indent(self._writeParameterElement(elem, ws),2))
+                lines.extend(self.indentBlock(self._writeParameterElement(elem, ws),2))
             lines.append(self.indent('</PARAMETERS>',1))
         else:
             lines.append(self.indent('<PARAMETERS/>',1))
@@ -149,7 +149,7 @@ class XMLPortInterfaceWriter(ElementWriter):
         else:
             access = parameter.swCalibrationAccess
         variants = [autosar.base.SwDataDefPropsConditional(swAddressMethodRef=parameter.swAddressMethodRef, swCalibrationAccess=access)]
-        lines.extend(self.indent(self.writeSwDataDefPropsVariantsXML(ws, variants),2))
+        lines.extend(self.indentBlock(self.writeSwDataDefPropsVariantsXML(ws, variants),2))
         lines.append(self.indent('</SW-DATA-DEF-PROPS>',1))
         typeElem = ws.find(parameter.typeRef, role="DataType")
         if (typeElem is None):
@@ -166,23 +166,23 @@ class XMLPortInterfaceWriter(ElementWriter):
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%portInterface.name,1))
         descLines = self.writeDescXML(portInterface)
         if descLines is not None:
-            lines.extend(self.indent(descLines,1))
+            lines.extend(self.indentBlock(descLines,1))
         if portInterface.adminData is not None:
-            lines.extend(self.indent(self.writeAdminDataXML(portInterface.adminData),1))
+            lines.extend(self.indentBlock(self.writeAdminDataXML(portInterface.adminData),1))
         lines.append(self.indent('<IS-SERVICE>%s</IS-SERVICE>'%self.toBooleanStr(portInterface.isService),1))
         if (portInterface.serviceKind is not None) and (self.version >= 4.0):
             lines.append(self.indent('<SERVICE-KIND>%s</SERVICE-KIND>'%portInterface.serviceKind,1))
         if len(portInterface.operations)>0:
             lines.append(self.indent('<OPERATIONS>',1))
             for operation in portInterface.operations:
-                lines.extend(self.indent(self.writeOperationXML(operation),2))
+                lines.extend(self.indentBlock(self.writeOperationXML(operation),2))
             lines.append(self.indent('</OPERATIONS>',1))
         else:
             lines.append(self.indent('<OPERATIONS/>',1))
         if len(portInterface.applicationErrors)>0:
             lines.append(self.indent('<POSSIBLE-ERRORS>',1))
             for applicationError in portInterface.applicationErrors:
-                lines.extend(self.indent(self.writeApplicationErrorXML(applicationError),2))
+                lines.extend(self.indentBlock(self.writeApplicationErrorXML(applicationError),2))
             lines.append(self.indent('</POSSIBLE-ERRORS>',1))
         lines.append('</CLIENT-SERVER-INTERFACE>')
 
@@ -197,11 +197,11 @@ class XMLPortInterfaceWriter(ElementWriter):
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%operation.name,1))
         descLines = self.writeDescXML(operation)
         if descLines is not None:
-            lines.extend(self.indent(descLines,1))
+            lines.extend(self.indentBlock(descLines,1))
         if len(operation.arguments)>0:
             lines.append(self.indent('<ARGUMENTS>',1))
             for argument in operation.arguments:
-                lines.extend(self.indent(self.writeArgumentXML(ws, argument),2))
+                lines.extend(self.indentBlock(self.writeArgumentXML(ws, argument),2))
             lines.append(self.indent('</ARGUMENTS>',1))
         if len(operation.errorRefs)>0:
             lines.append(self.indent('<POSSIBLE-ERROR-REFS>',1))
@@ -223,14 +223,14 @@ class XMLPortInterfaceWriter(ElementWriter):
         if self.version >= 4.0:
             descLines = self.writeDescXML(argument)
             if descLines is not None:
-                lines.extend(self.indent(descLines,1))
+                lines.extend(self.indentBlock(descLines,1))
             lines.append(self.indent('<SW-DATA-DEF-PROPS>',1))
             if argument.swCalibrationAccess is None:
                 tmp = 'NOT-ACCESSIBLE'
             else:
                 tmp = argument.swCalibrationAccess
             variants = [autosar.base.SwDataDefPropsConditional(swCalibrationAccess=tmp)]
-            lines.extend(self.indent(self.writeSwDataDefPropsVariantsXML(ws, variants),2))
+            lines.extend(self.indentBlock(self.writeSwDataDefPropsVariantsXML(ws, variants),2))
             lines.append(self.indent('</SW-DATA-DEF-PROPS>',1))
         typeElem = ws.find(argument.typeRef, role="DataType")
         if (typeElem is None):
@@ -286,9 +286,9 @@ class XMLPortInterfaceWriter(ElementWriter):
         lines.append('<%s>'%portInterface.tag(self.version))
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%portInterface.name,1))
         if portInterface.adminData is not None:
-            lines.extend(self.indent(self.writeAdminDataXML(portInterface.adminData),1))
+            lines.extend(self.indentBlock(self.writeAdminDataXML(portInterface.adminData),1))
         lines.append(self.indent('<IS-SERVICE>%s</IS-SERVICE>'%self.toBooleanStr(portInterface.isService),1))
-        lines.extend(self.indent(self.writeModeGroupXML(portInterface.modeGroup),1))
+        lines.extend(self.indentBlock(self.writeModeGroupXML(portInterface.modeGroup),1))
         lines.append('</%s>'%portInterface.tag(self.version))
         return lines
 
@@ -312,14 +312,14 @@ class XMLPortInterfaceWriter(ElementWriter):
         lines.append('<NV-DATA-INTERFACE>')
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%portInterface.name,1))
         if portInterface.adminData is not None:
-            lines.extend(self.indent(self.writeAdminDataXML(portInterface.adminData),1))
+            lines.extend(self.indentBlock(self.writeAdminDataXML(portInterface.adminData),1))
         lines.append(self.indent('<IS-SERVICE>%s</IS-SERVICE>'%self.toBooleanStr(portInterface.isService),1))
         if (self.version >= 4.0) and (portInterface.serviceKind is not None):
             lines.append(self.indent('<SERVICE-KIND>%s</SERVICE-KIND>'%portInterface.serviceKind,1))
         if len(portInterface.nvDatas)>0:
             lines.append(self.indent('<NV-DATAS>',1))
             for elem in portInterface.nvDatas:
-                lines.extend(self.indent(self.writeDataElementXML(elem),2))
+                lines.extend(self.indentBlock(self.writeDataElementXML(elem),2))
             lines.append(self.indent('</NV-DATAS>',1))
         else:
             lines.append(self.indent('<NV-DATAS/>',1))
@@ -27,7 +27,7 @@ class SignalWriter(ElementWriter):
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%elem.name,1))
         if elem.desc is not None:
             tmp = self.writeDescXML(elem)
-            if tmp is not None: lines.extend(self.indent(tmp,1))
+            if tmp is not None: lines.extend(self.indentBlock(tmp,1))
         if elem.dataTypeRef is not None:
             ws = elem.rootWS()
             typeElem = ws.find(elem.dataTypeRef, role="DataType")
@@ -1,8 +1,11 @@
 from autosar.writer.writer_base import BaseWriter
 from autosar.writer.package_writer import PackageWriter
-from autosar.base import applyFilter
+from autosar.base import applyFilter, compileFilters
 import collections
 
+#number of lines joined into a single write call by saveXML
+_chunkSize = 1000
+
 class WorkspaceWriter(BaseWriter):
     def __init__(self, version, patch, schema, packageWriter):
         super().__init__(version, patch)
@@ -37,21 +40,85 @@ class WorkspaceWriter(BaseWriter):
         return lines
 
 
-    def saveXML(self, ws, fp, filters, ignore):
-        fp.write(self.toXML(ws, filters, ignore))
+    def saveXML(self, ws, fp, filters, ignore, mapPackages=None):
+        """
+        Writes the XML document to fp while it is generated, the complete document is never held in memory
+        """
+        for text in self.iterXML(ws, filters, ignore, mapPackages):
+            fp.write(text)
+
+    def saveXMLSplit(self, ws, files, ignore):
+        """
+        Writes several XML documents in a single traversal of ws, files is a list of (fp, filters) tuples.
+        Each document is identical to the one written by saveXML(ws, fp, filters, ignore),
+        elements written to more than one document are only converted to XML once.
+        """
+        filtersList = [filters for (_, filters) in files]
+        chunks = [[] for _ in files]
+        for targets, lines in self._iterLinesSplit(ws, filtersList, ignore):
+            for i in targets:
+                chunk = chunks[i]
+                chunk.extend(lines)
+                if len(chunk) >= _chunkSize:
+                    files[i][0].write('\n'.join(chunk)+'\n')
+                    chunks[i] = []
+        for (fp, _), chunk in zip(files, chunks):
+            if len(chunk) > 0:
+                fp.write('\n'.join(chunk)+'\n')
+
+    def toXML(self, ws, filters, ignore, mapPackages=None):
+        return ''.join(self.iterXML(ws, filters, ignore, mapPackages))
+
+    def iterXML(self, ws, filters, ignore, mapPackages=None):
+        """
+        Generator yielding the XML document in chunks of (about) _chunkSize lines, each line is terminated by a newline.
+        mapPackages is an optional function taking the list of top-level packages to write and returning an iterator
+        over the lines of each package (indented by 2 levels), in the same order. It is used by Workspace.saveXML
+        to write packages in worker processes.
+        """
+        chunk = []
+        for lines in self._iterLines(ws, filters, ignore, mapPackages):
+            chunk.extend(lines)
+            if len(chunk) >= _chunkSize:
+                yield '\n'.join(chunk)+'\n'
+                chunk = []
+        if len(chunk) > 0:
+            yield '\n'.join(chunk)+'\n'
+
+    def _iterLines(self, ws, filters, ignore, mapPackages):
+        """
+        Generator yielding the XML document as lists of lines
+        """
+        yield self.beginFile()
+        root = compileFilters(filters)
+        results = None
+        if mapPackages is not None:
+            results = mapPackages([package for package in ws.packages if root.matches(package.name)])
+        for package in ws.packages:
+            state = root.child(package.name)
+            if state is not None:
+                if results is None:
+                    for _, lines in self.packageWriter._iterXMLSplit(package, [state], ignore, 2):
+                        yield lines
+                else:
+                    yield next(results)
+            ws.unhandledWriter = ws.unhandledWriter.union(package.unhandledWriter)
+        yield self.endFile()
 
-    def toXML(self, ws, filters, ignore):
-        lines=self.beginFile()
-        result='\n'.join(lines)+'\n'
+    def _iterLinesSplit(self, ws, filtersList, ignore):
+        """
+        Generator yielding the XML documents filtered by each item of filtersList as (targets, lines) tuples,
+        see PackageWriter.iterXMLSplit
+        """
+        targets = tuple(range(len(filtersList)))
+        roots = [compileFilters(filters) for filters in filtersList]
+        yield targets, self.beginFile()
         for package in ws.packages:
-            if applyFilter(package.ref, filters):
-                lines=self.packageWriter.toXML(package, filters, ignore)
-                if len(lines)>0:
-                    lines=self.indent(lines,2)
-                    result+='\n'.join(lines)+'\n'
+            states = [root.child(package.name) for root in roots]
+            if any(state is not None for state in states):
+                yield from self.packageWriter._iterXMLSplit(package, states, ignore, 2)
             ws.unhandledWriter = ws.unhandledWriter.union(package.unhandledWriter)
-        lines=self.endFile()
-        return result+'\n'.join(lines)+'\n'
+        yield targets, self.endFile()
 
     def toCode(self, ws, filters=None, ignore=None, head=None, tail=None, isModule=False, isTemplate=False, indent=3):
         localvars = collections.OrderedDict()
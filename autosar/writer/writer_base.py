@@ -7,6 +7,18 @@ import collections
 from autosar.element import AutosarDataPrototype
 from decimal import Decimal
 
+class IndentedLines:
+    """
+    A list of XML lines nested indent levels deeper than the list of lines it is part of.
+    BaseWriter.indentBlock wraps lists of lines in an IndentedLines object instead of copying each line,
+    BaseWriter.appendLines applies the accumulated indentation once per line when the output is written.
+    """
+    __slots__ = ('lines', 'indent')
+
+    def __init__(self, lines, indent):
+        self.lines = lines
+        self.indent = indent
+
 class BaseWriter:
     def __init__(self, version=3.0, patch=None):
         self.version=version
@@ -24,6 +36,9 @@ class BaseWriter:
             self.indentChar = '  '
 
     def indent(self,lines,indent):
+        """
+        Indents a string or a list of lines by indent levels, a list is returned as a new list of indented strings.
+        """
         if isinstance(lines,list):
             return ['%s%s'%(self.indentChar*indent,x) for x in lines]
         elif isinstance(lines,str):
@@ -31,6 +46,27 @@ class BaseWriter:
         else:
             raise NotImplementedError(type(lines))
 
+    def indentBlock(self,lines,indent):
+        """
+        Same as indent but lines are not copied, the result is a list holding a single IndentedLines item (see appendLines).
+        lines can be a string or any iterable of lines, e.g. a list or a generator.
+        Used by the element writers, the lines are only indented when the output is written.
+        """
+        if isinstance(lines,str):
+            return self.indent(lines, indent)
+        return [IndentedLines(lines, indent)]
+
+
+    def appendLines(self, result, lines, prefix=''):
+        """
+        Appends the lines (any iterable) returned by an element writer to the list result, each prefixed with prefix.
+        Nested IndentedLines are flattened, each line is prefixed with its complete indentation exactly once.
+        """
+        for line in lines:
+            if isinstance(line, IndentedLines):
+                self.appendLines(result, line.lines, prefix+self.indentChar*line.indent)
+            else:
+                result.append(prefix+line)
 
     def beginPackage(self, name,indent=None):
         lines = []
@@ -167,7 +203,7 @@ class BaseWriter:
         lines.append(self.indent("<SW-DATA-DEF-PROPS-VARIANTS>", 0))
         for variant in variants:
             if isinstance(variant, autosar.base.SwDataDefPropsConditional):
-                lines.extend(self.indent(self.writeSwDataDefPropsConditionalXML(ws, variant), 1))
+                lines.extend(self.indentBlock(self.writeSwDataDefPropsConditionalXML(ws, variant), 1))
             else:
                 raise NotImplementedError(str(type(variant)))
         lines.append(self.indent("</SW-DATA-DEF-PROPS-VARIANTS>", 0))
@@ -205,7 +241,7 @@ class BaseWriter:
                 raise ValueError('invalid reference: '+elem.implementationTypeRef)
             lines.append(self.indent('<IMPLEMENTATION-DATA-TYPE-REF DEST="%s">%s</IMPLEMENTATION-DATA-TYPE-REF>'%(implementationType.tag(self.version), implementationType.ref),1))
         if elem.swPointerTargetProps is not None:
-            lines.extend(self.indent(self.writeSwPointerTargetPropsXML(ws, elem.swPointerTargetProps),1))
+            lines.extend(self.indentBlock(self.writeSwPointerTargetPropsXML(ws, elem.swPointerTargetProps),1))
         if elem.unitRef is not None:
             unit=ws.find(elem.unitRef)
             if unit is None:
@@ -246,15 +282,15 @@ class BaseWriter:
         lines=[]
         lines.append('<%s>'%value.tag(self.version))
         if isinstance(value, autosar.constant.TextValue):
-            lines.extend(self.indent(self._writeSimpleValueSpecificationXML(value), 1))
+            lines.extend(self.indentBlock(self._writeSimpleValueSpecificationXML(value), 1))
         elif isinstance(value, autosar.constant.NumericalValue):
-            lines.extend(self.indent(self._writeSimpleValueSpecificationXML(value), 1))
+            lines.extend(self.indentBlock(self._writeSimpleValueSpecificationXML(value), 1))
         elif isinstance(value, autosar.constant.RecordValueAR4):
-            lines.extend(self.indent(self._writeRecordValueSpecificationXML(value), 1))
+            lines.extend(self.indentBlock(self._writeRecordValueSpecificationXML(value), 1))
         elif isinstance(value, autosar.constant.ArrayValueAR4):
-            lines.extend(self.indent(self._writeArrayValueSpecificationXML(value), 1))
+            lines.extend(self.indentBlock(self._writeArrayValueSpecificationXML(value), 1))
         elif isinstance(value, autosar.constant.ApplicationValue):
-            lines.extend(self.indent(self._writeApplicationValueSpecificationXML(value), 1))
+            lines.extend(self.indentBlock(self._writeApplicationValueSpecificationXML(value), 1))
         else:
             raise NotImplementedError(str(type(value)))
         lines.append('</%s>'%value.tag(self.version))
@@ -273,7 +309,7 @@ class BaseWriter:
             lines.append('<SHORT-LABEL>%s</SHORT-LABEL>'%(value.label))
         lines.append('<FIELDS>')
         for elem in value.elements:
-            lines.extend(self.indent(self.writeValueSpecificationXML(elem),1))
+            lines.extend(self.indentBlock(self.writeValueSpecificationXML(elem),1))
         lines.append('</FIELDS>')
         return lines
 
@@ -283,7 +319,7 @@ class BaseWriter:
             lines.append('<SHORT-LABEL>%s</SHORT-LABEL>'%(value.label))
         lines.append('<ELEMENTS>')
         for elem in value.elements:
-            lines.extend(self.indent(self.writeValueSpecificationXML(elem),1))
+            lines.extend(self.indentBlock(self.writeValueSpecificationXML(elem),1))
         lines.append('</ELEMENTS>')
         return lines
 
@@ -352,7 +388,7 @@ class BaseWriter:
         lines.append(self.indent('<SHORT-NAME>%s</SHORT-NAME>'%elem.name,1))
         descLines = self.writeDescXML(elem)
         if descLines is not None:
-            lines.extend(self.indent(descLines,1))
+            lines.extend(self.indentBlock(descLines,1))
         if self.version >= 4.0:
             variantList = []
             variant = autosar.base.SwDataDefPropsConditional(swAddressMethodRef = elem.swAddressMethodRef, swCalibrationAccess = elem.swCalibrationAccess, swImplPolicy = elem.swImplPolicy)
@@ -361,7 +397,7 @@ class BaseWriter:
             if len(variantList) > 0:
                 lines.append(self.indent('<SW-DATA-DEF-PROPS>',1))
                 variant.dataConstraintRef = elem.dataConstraintRef
-                lines.extend(self.indent(self.writeSwDataDefPropsVariantsXML(ws, variantList),2))
+                lines.extend(self.indentBlock(self.writeSwDataDefPropsVariantsXML(ws, variantList),2))
                 lines.append(self.indent('</SW-DATA-DEF-PROPS>',1))
 
         typeElem = ws.find(elem.typeRef, role="DataType")
@@ -440,6 +476,10 @@ class ElementWriter(BaseWriter, metaclass=abc.ABCMeta):
         Invokes the XML writer, requesting it to convert the elem object into XML
 
         The method shall return a list of strings that contains valid XML text.
+        Any other iterable of lines (e.g. a generator) is also OK, at top level as well as nested through indentBlock.
+        Items may also be IndentedLines, as returned by indentBlock.
+        The output is streamed one element at a time, all lines of a single element are collected before they are written.
+        A large element (e.g. a component with a big internal behavior) is therefore still held in memory as a whole.
 
         elem: the element object to write.
         """
@@ -0,0 +1,72 @@
+"""
+Measures the per-element parse cost of BehaviorParser and BaseParser.defaultHandler.
+
+Usage: python benchmarks/behavior_parser_benchmark.py [file.arxml ...]
+
+Without arguments the AUTOSAR 4 behavior and component files in tests/arxml/expected_gen are used as corpus.
+Each SWC-INTERNAL-BEHAVIOR found in the corpus is parsed repeatedly with its component as parent.
+defaultHandler is measured on a uniform mix of the tags it handles.
+"""
+import os, sys
+import glob
+import timeit
+import xml.etree.ElementTree as ElementTree
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import autosar
+from autosar.parser.behavior_parser import BehaviorParser
+from autosar.parser.parser_base import BaseParser
+
+def _behaviors(path):
+    """
+    Returns a list of (xmlElement, component) tuples for each SWC-INTERNAL-BEHAVIOR found in path
+    """
+    ws = autosar.workspace()
+    try:
+        ws.loadXML(path)
+    except Exception:
+        return []
+    parents = {child: parent for parent in ws.xmlroot.iter() for child in parent}
+    result = []
+    for xmlBehavior in ws.xmlroot.iter('SWC-INTERNAL-BEHAVIOR'):
+        names = []
+        xmlNode = parents[parents[xmlBehavior]] #component
+        while xmlNode is not None:
+            xmlName = xmlNode.find('SHORT-NAME')
+            if xmlName is not None:
+                names.append(xmlName.text)
+            xmlNode = parents.get(xmlNode)
+        component = ws.find('/'+'/'.join(reversed(names)))
+        if component is not None:
+            result.append((xmlBehavior, component))
+    return result
+
+def main(paths, repeat=5, number=200):
+    if len(paths) == 0:
+        corpus_dir = os.path.join(os.path.dirname(__file__), '..', 'tests', 'arxml', 'expected_gen')
+        paths = sorted(glob.glob(os.path.join(corpus_dir, 'behavior', 'ar4_*.arxml')) +
+                       glob.glob(os.path.join(corpus_dir, 'component', 'ar4_*.arxml')))
+    behaviors = []
+    for path in paths:
+        behaviors.extend(_behaviors(path))
+    parser = BehaviorParser(4.0)
+    def parseAll():
+        for xmlBehavior, component in behaviors:
+            parser.parseSWCInternalBehavior(xmlBehavior, component)
+    elapsed = min(timeit.repeat(parseAll, number=number, repeat=repeat))
+    numNodes = sum(len(list(x.iter())) for x, _ in behaviors)
+    print('files: %d, internal behaviors: %d, XML nodes: %d'%(len(paths), len(behaviors), numNodes))
+    print('SWC-INTERNAL-BEHAVIOR %8.2f us per element'%(1e6*elapsed/(number*len(behaviors))))
+
+    tags = ['SHORT-NAME', 'CATEGORY', 'DISPLAY-FORMAT', 'ANNOTATION', 'ANNOTATIONS', 'INTRODUCTION', 'SHORT-NAME-PATTERN']
+    xmlNodes = [ElementTree.Element(tag) for tag in tags]
+    baseParser = BaseParser(4.0)
+    def handleAll():
+        baseParser.push()
+        for xmlNode in xmlNodes:
+            baseParser.defaultHandler(xmlNode)
+        baseParser.pop()
+    elapsed = min(timeit.repeat(handleAll, number=100*number, repeat=repeat))
+    print('defaultHandler        %8.3f us per node'%(1e6*elapsed/(100*number*len(xmlNodes))))
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,74 @@
+"""
+Measures the time to build and query a large software component with the create* methods.
+
+Usage: python benchmarks/component_build_benchmark.py [numPorts [numRunnables]]
+
+Creates an AUTOSAR 4 application component with numPorts sender-receiver ports (half require, half provide) and
+numRunnables runnables. Each runnable accesses a port and gets a timing event and a data received event,
+every runnable is triggered twice by the same period which makes the event names collide.
+Finally the references held by the component (ports, runnables, interfaces) are looked up with Workspace.find and,
+after Workspace.resolveReferences, with Workspace.resolve.
+"""
+import os, sys
+import time
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import autosar
+
+def _createWorkspace(numInterfaces):
+    ws = autosar.workspace(version="4.2.2")
+    package = ws.createPackage('DataTypes', role='DataType')
+    package.createSubPackage('DataConstrs', role='DataConstraint')
+    baseTypes = package.createSubPackage('BaseTypes')
+    baseTypes.createSwBaseType('uint16', 16, nativeDeclaration='uint16')
+    package.createImplementationDataType('uint16', lowerLimit=0, upperLimit=65535, baseTypeRef='/DataTypes/BaseTypes/uint16')
+    ws.createPackage('Constants', role='Constant')
+    package = ws.createPackage('PortInterfaces', role='PortInterface')
+    for i in range(numInterfaces):
+        package.createSenderReceiverInterface('Signal%d_I'%i, autosar.DataElement('Signal%d'%i, 'uint16'))
+    ws.createPackage('ComponentTypes', role='ComponentType')
+    return ws
+
+def main(numPorts=1500, numRunnables=400):
+    ws = _createWorkspace(numPorts)
+    swc = ws.find('/ComponentTypes').createApplicationSoftwareComponent('Gateway')
+    start = time.perf_counter()
+    for i in range(numPorts):
+        if i%2 == 0:
+            swc.createRequirePort('R_Signal%d'%i, 'Signal%d_I'%i)
+        else:
+            swc.createProvidePort('P_Signal%d'%i, 'Signal%d_I'%i)
+    portTime = time.perf_counter() - start
+    start = time.perf_counter()
+    for i in range(numRunnables):
+        portName = 'R_Signal%d'%(2*(i%(numPorts//2)))
+        swc.behavior.createRunnable('Run%d'%i, portAccess=[portName])
+        swc.behavior.createTimerEvent('Run%d'%i, 10)
+        swc.behavior.createTimerEvent('Run%d'%i, 10)
+        swc.behavior.createDataReceivedEvent('Run%d'%i, portName)
+    runnableTime = time.perf_counter() - start
+    start = time.perf_counter()
+    for i in range(numPorts):
+        assert swc.find('R_Signal%d'%i if i%2 == 0 else 'P_Signal%d'%i) is not None
+    for i in range(numRunnables):
+        assert swc.behavior.find('Run%d'%i) is not None
+    findTime = time.perf_counter() - start
+    print('ports: %d, runnables: %d, events: %d'%(numPorts, numRunnables, len(swc.behavior.events)))
+    print('create ports              %8.3f s'%portTime)
+    print('create runnables, events  %8.3f s'%runnableTime)
+    print('find ports, runnables     %8.3f s'%findTime)
+    if hasattr(ws, 'resolveReferences'):
+        start = time.perf_counter()
+        dangling = ws.resolveReferences()
+        resolveTime = time.perf_counter() - start
+        refs = list(ws.referrerMap)
+        for name in ['find', 'resolve']:
+            lookup = getattr(ws, name)
+            start = time.perf_counter()
+            for ref in refs:
+                lookup(ref)
+            elapsed = time.perf_counter() - start
+            print('ws.%-22s %8.3f us per reference (%d references)'%(name, 1e6*elapsed/len(refs), len(refs)))
+        print('resolveReferences         %8.3f s (%d dangling)'%(resolveTime, len(dangling)))
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
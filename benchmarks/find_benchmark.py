@@ -0,0 +1,56 @@
+"""
+Measures the cost of Workspace.find depending on the depth of the reference and on the number of elements in a package,
+the cost of Workspace.findall for exact names and glob patterns and the cost of collecting all elements of a class.
+
+Usage: python benchmarks/find_benchmark.py
+"""
+import os, sys
+import timeit
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import autosar
+
+def _createWorkspace(maxDepth, packageSizes):
+    ws = autosar.workspace()
+    package = ws.createPackage('Depth1')
+    refs = {}
+    for depth in range(1, maxDepth+1):
+        if depth > 1:
+            package = package.createSubPackage('Depth%d'%depth)
+        package.createCompuMethodConst('Elem', ['OFF', 'ON'])
+        refs['depth %d'%depth] = package.ref+'/Elem'
+    for size in packageSizes:
+        package = ws.createPackage('Size%d'%size)
+        for i in range(size):
+            package.createCompuMethodConst('Elem%d'%i, ['OFF', 'ON'])
+        refs['size %d'%size] = package.ref+'/Elem%d'%(size-1)
+    return ws, refs
+
+def _sweep(packages, elementType, result):
+    for package in packages:
+        result.extend(elem for elem in package.elements if isinstance(elem, elementType))
+        _sweep(package.subPackages, elementType, result)
+    return result
+
+def main(repeat=5, number=20000):
+    ws, refs = _createWorkspace(8, [10, 100, 1000, 10000])
+    for name, ref in refs.items():
+        assert ws.find(ref) is not None
+        elapsed = min(timeit.repeat(lambda: ws.find(ref), number=number, repeat=repeat))
+        print('%-12s %8.3f us per find'%(name, 1e6*elapsed/number))
+    patterns = ['/Size10000/Elem9999', '/Size10000/Elem999*', '/Size1000/*', '/Depth1/*/*/Elem']
+    if hasattr(ws, 'iterfind'):
+        patterns.append('/Depth1/**/Elem')
+    for pattern in patterns:
+        count = len(ws.findall(pattern))
+        elapsed = min(timeit.repeat(lambda: ws.findall(pattern), number=number//100, repeat=repeat))
+        print('%-20s %8.3f us per findall (%d results)'%(pattern, 1e6*elapsed/(number//100), count))
+    sweeps = [('package sweep', lambda: _sweep(ws.packages, autosar.datatype.CompuMethod, []))]
+    if hasattr(ws, 'elementsOfType'):
+        sweeps.append(('elementsOfType', lambda: ws.elementsOfType(autosar.datatype.CompuMethod)))
+    for name, sweep in sweeps:
+        count = len(sweep())
+        elapsed = min(timeit.repeat(sweep, number=number//1000, repeat=repeat))
+        print('%-20s %8.3f us per call (%d results)'%(name, 1e6*elapsed/(number//1000), count))
+
+if __name__ == '__main__':
+    main()
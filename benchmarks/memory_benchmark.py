@@ -0,0 +1,97 @@
+"""
+Measures the memory used by loaded workspaces.
+
+Usage: python benchmarks/memory_benchmark.py [file.arxml ...]
+
+Without arguments the ARXML files in tests/arxml/expected_gen are used as corpus, each file is loaded 20 times.
+Reports the memory retained per model object (instances of classes defined in the autosar package),
+the increase of the peak resident set size of the process while loading (where available) and the size of a single instance
+(including its __dict__, if any) for the classes created in large numbers.
+"""
+import os, sys
+import gc
+import glob
+import tracemalloc
+try:
+    import resource
+except ImportError:
+    resource = None #not available on Windows
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import autosar
+import autosar.ecuc
+
+_classes = [autosar.element.AutosarDataPrototype, autosar.datatype.RecordTypeElement, autosar.datatype.CompuScaleElement,
+            autosar.datatype.ImplementationDataTypeElement, autosar.behavior.DataElementInstanceRef, autosar.constant.NumericalValue,
+            autosar.constant.TextValue, autosar.base.SpecialData, autosar.ecuc.ParamValue, autosar.ecuc.ReferenceValue]
+
+def _load(path):
+    ws = autosar.workspace()
+    ws.loadXML(path)
+    ws.xmlroot = None
+    return ws
+
+def _loadable_files(paths, number):
+    """
+    Loads each file in paths number times, returns the files that could be loaded and the loaded workspaces
+    """
+    (result, workspaces) = ([], [])
+    for path in paths:
+        try:
+            workspaces.extend(_load(path) for _ in range(number))
+        except Exception:
+            continue
+        result.append(path)
+    return result, workspaces
+
+def _maxRSS():
+    """
+    Returns the peak resident set size of the process in bytes or None if it is not available
+    """
+    if resource is None:
+        return None
+    maxRSS = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxRSS if sys.platform == 'darwin' else maxRSS*1024
+
+def _instanceSize(obj):
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+def main(paths):
+    if len(paths) == 0:
+        corpus_dir = os.path.join(os.path.dirname(__file__), '..', 'tests', 'arxml', 'expected_gen')
+        paths = sorted(glob.glob(os.path.join(corpus_dir, '*', '*.arxml')))
+        number = 20
+    else:
+        number = 1
+    #the first pass is measured without tracemalloc, which has a large memory overhead of its own
+    startRSS = _maxRSS()
+    paths, workspaces = _loadable_files(paths, number)
+    maxRSS = _maxRSS()
+    del workspaces
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    workspaces = [_load(path) for path in paths for _ in range(number)]
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    instances = {}
+    for obj in gc.get_objects():
+        if isinstance(type(obj).__module__, str) and type(obj).__module__.startswith('autosar.'):
+            instances.setdefault(type(obj), []).append(obj)
+    numObjects = sum(len(x) for x in instances.values())
+    print('files: %d, workspaces: %d, model objects: %d'%(len(paths), len(workspaces), numObjects))
+    print('total %10.1f kB %8.1f bytes per model object'%(used/1024, used/numObjects))
+    if maxRSS is not None:
+        print('peak RSS increase %8.1f MB'%((maxRSS-startRSS)/(1024*1024)))
+    for cls in _classes:
+        objects = instances.get(cls, [])
+        if len(objects) > 0:
+            print('%-30s %8d instances %6.1f bytes per instance'%(cls.__name__, len(objects), sum(_instanceSize(x) for x in objects)/len(objects)))
+        else:
+            print('%-30s %8d instances'%(cls.__name__, 0))
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
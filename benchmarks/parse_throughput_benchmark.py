@@ -0,0 +1,49 @@
+"""
+Measures the parse throughput of Workspace.loadXML.
+
+Usage: python benchmarks/parse_throughput_benchmark.py [file.arxml ...]
+
+Without arguments the ARXML files in tests/arxml/expected_gen are used as corpus.
+Parsing the XML text is timed separately so that the time spent in the element parsers can be compared between versions.
+"""
+import os, sys
+import glob
+import timeit
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import autosar
+import autosar.base
+
+def _load(path):
+    ws = autosar.workspace()
+    ws.loadXML(path)
+    return ws
+
+def _loadable_files(paths):
+    result = []
+    for path in paths:
+        try:
+            _load(path)
+        except Exception:
+            continue
+        result.append(path)
+    return result
+
+def main(paths, repeat=5):
+    if len(paths) == 0:
+        corpus_dir = os.path.join(os.path.dirname(__file__), '..', 'tests', 'arxml', 'expected_gen')
+        paths = sorted(glob.glob(os.path.join(corpus_dir, '*', '*.arxml')))
+        number = 20
+    else:
+        number = 1
+    paths = _loadable_files(paths)
+    numBytes = sum(os.path.getsize(path) for path in paths)
+    numNodes = sum(sum(1 for _ in autosar.base.parseXMLFileStripNamespace(path)[0].iter()) for path in paths)
+    xmlTime = min(timeit.repeat(lambda: [autosar.base.parseXMLFileStripNamespace(path)[0] for path in paths], number=number, repeat=repeat))/number
+    loadTime = min(timeit.repeat(lambda: [_load(path) for path in paths], number=number, repeat=repeat))/number
+    print('files: %d, size: %.1f kB, XML nodes: %d, iterations: %d'%(len(paths), numBytes/1024, numNodes, number))
+    print('loadXML       %8.3f ms %8.2f MB/s'%(1000*loadTime, numBytes/loadTime/1e6))
+    print('XML only      %8.3f ms'%(1000*xmlTime))
+    print('element parse %8.3f ms %8.3f us per XML node'%(1000*(loadTime-xmlTime), 1e6*(loadTime-xmlTime)/numNodes))
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
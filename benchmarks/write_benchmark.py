@@ -0,0 +1,155 @@
+"""
+Measures the time and the peak memory of Workspace.saveXML.
+
+Usage: python benchmarks/write_benchmark.py [file.arxml ...]
+
+Without arguments a generated AUTOSAR 4 workspace with 4000 implementation data types, compu methods, data constraints,
+constants and sender-receiver interfaces is written, otherwise the given files are loaded and written.
+The file is also written with top-level packages serialized in worker processes (one per CPU, at least 2),
+and split into one file per top-level package plus a file holding the complete workspace, written by calling saveXML
+once per file and by a single call of saveXMLSplit. Finally 100 elements and a package are selected by filters.
+The peak memory is the largest amount of memory allocated (tracemalloc) while writing, in addition to the loaded workspace.
+Without arguments the AUTOSAR 4 files in tests/arxml/expected_gen are also loaded and serialized with Workspace.toXML,
+followed by constants with record values nested up to 32 levels deep. With indentation applied once per line
+the time per output line does not depend on the nesting depth.
+"""
+import os, sys
+import gc
+import glob
+import multiprocessing
+import tempfile
+import time
+import timeit
+import tracemalloc
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import autosar
+
+def _createWorkspace(numPackages, packageSize):
+    ws = autosar.workspace(version="4.2.2")
+    package = ws.createPackage('DataTypes', role='DataType')
+    package.createSubPackage('CompuMethods', role='CompuMethod')
+    package.createSubPackage('DataConstrs', role='DataConstraint')
+    baseTypes = package.createSubPackage('BaseTypes')
+    baseTypes.createSwBaseType('uint8', 8, nativeDeclaration='uint8')
+    for i in range(numPackages):
+        dataTypes = ws.createPackage('DataTypes%d'%i, role='DataType')
+        dataTypes.createSubPackage('CompuMethods', role='CompuMethod')
+        dataTypes.createSubPackage('DataConstrs', role='DataConstraint')
+        constants = ws.createPackage('Constants%d'%i, role='Constant')
+        interfaces = ws.createPackage('PortInterfaces%d'%i, role='PortInterface')
+        for j in range(packageSize):
+            dataType = dataTypes.createImplementationDataType('OnOff%d_T'%j, '/DataTypes/BaseTypes/uint8', valueTable=['OFF', 'ON', 'ERROR', 'NOT_AVAILABLE'])
+            constants.createConstant('C_OnOff%d_IV'%j, dataType.ref, 3)
+            interfaces.createSenderReceiverInterface('OnOff%d_I'%j, autosar.DataElement('OnOff', dataType.ref))
+    return ws
+
+def _createNestedWorkspace(depth, numConstants=20, width=4):
+    """
+    Creates constants whose record values are nested depth levels deep, each level holds width numerical values
+    """
+    ws = autosar.workspace(version="4.2.2")
+    package = ws.createPackage('Constants', role='Constant')
+    for i in range(numConstants):
+        value = autosar.constant.RecordValueAR4('Level%d'%depth, elements=[autosar.constant.NumericalValue('Leaf%d'%j, j) for j in range(width)])
+        for level in reversed(range(depth)):
+            elements = [autosar.constant.NumericalValue('Leaf%d'%j, j) for j in range(width)]
+            value = autosar.constant.RecordValueAR4('Level%d'%level, elements=elements+[value])
+        package.append(autosar.constant.Constant('C_Nested%d'%i, value))
+    return ws
+
+def _load(paths):
+    ws = autosar.workspace()
+    for path in paths:
+        ws.loadXML(path)
+    ws.xmlroot = None
+    return ws
+
+def _corpus():
+    """
+    Returns the workspaces of the AUTOSAR 4 files in tests/arxml/expected_gen that can be loaded and written on their own
+    """
+    corpus_dir = os.path.join(os.path.dirname(__file__), '..', 'tests', 'arxml', 'expected_gen')
+    workspaces = []
+    for path in sorted(glob.glob(os.path.join(corpus_dir, '*', 'ar4_*.arxml'))):
+        try:
+            ws = _load([path])
+            ws.toXML()
+        except Exception:
+            continue
+        workspaces.append(ws)
+    return workspaces
+
+def _benchmarkCorpus(repeat=5, number=20):
+    workspaces = _corpus()
+    def writeAll():
+        return sum(len(ws.toXML()) for ws in workspaces)
+    size = writeAll()
+    elapsed = min(timeit.repeat(writeAll, number=number, repeat=repeat))
+    print('AR4 corpus: %d files, %.1f kB'%(len(workspaces), size/1024))
+    print('toXML   %8.2f ms %8.2f MB/s'%(1000*elapsed/number, number*size/elapsed/1e6))
+
+def _benchmarkNesting(repeat=5, number=5):
+    for depth in (1, 8, 32):
+        ws = _createNestedWorkspace(depth)
+        numLines = ws.toXML().count('\n')
+        elapsed = min(timeit.repeat(ws.toXML, number=number, repeat=repeat))
+        print('nesting depth %2d: %6d lines, toXML %8.2f ms %6.2f us per line'%(depth, numLines, 1000*elapsed/number, 1e6*elapsed/(number*numLines)))
+
+def main(paths, repeat=3):
+    ws = _createWorkspace(4, 1000) if len(paths) == 0 else _load(paths)
+    with tempfile.TemporaryDirectory() as tmpDir:
+        path = os.path.join(tmpDir, 'output.arxml')
+        elapsed = []
+        for _ in range(repeat):
+            gc.collect()
+            start = time.perf_counter()
+            ws.saveXML(path)
+            elapsed.append(time.perf_counter()-start)
+        size = os.path.getsize(path)
+        workers = max(2, os.cpu_count() or 1)
+        contexts = [None] if 'fork' not in multiprocessing.get_all_start_methods() else [None, multiprocessing.get_context('fork')]
+        parallelElapsed = {}
+        for context in contexts:
+            parallelElapsed[context] = []
+            for _ in range(repeat):
+                gc.collect()
+                start = time.perf_counter()
+                ws.saveXML(path, workers=workers, mpContext=context)
+                parallelElapsed[context].append(time.perf_counter()-start)
+        fileMap = {os.path.join(tmpDir, package.name+'.arxml'): [package.ref] for package in ws.packages}
+        fileMap[os.path.join(tmpDir, 'complete.arxml')] = None
+        (serialElapsed, splitElapsed) = ([], [])
+        for _ in range(repeat):
+            gc.collect()
+            start = time.perf_counter()
+            for (filename, filters) in fileMap.items():
+                ws.saveXML(filename, filters)
+            serialElapsed.append(time.perf_counter()-start)
+            gc.collect()
+            start = time.perf_counter()
+            ws.saveXMLSplit(fileMap)
+            splitElapsed.append(time.perf_counter()-start)
+        filters = ['/%s/%s'%(package.name, package.elements[i].name) for package in ws.packages if len(package.elements) > 0
+                   for i in range(0, len(package.elements), max(1, len(package.elements)//8))][:100]+[ws.packages[-1].ref]
+        filteredSize = len(ws.toXML(filters))
+        filteredElapsed = min(timeit.repeat(lambda: ws.toXML(filters), number=1, repeat=repeat))
+        gc.collect()
+        tracemalloc.start()
+        start = tracemalloc.get_traced_memory()[0]
+        ws.saveXML(path)
+        peak = tracemalloc.get_traced_memory()[1] - start
+        tracemalloc.stop()
+    print('output: %.1f kB'%(size/1024))
+    print('saveXML %8.1f ms %8.2f MB/s'%(1000*min(elapsed), size/min(elapsed)/1e6))
+    for context in contexts:
+        best = min(parallelElapsed[context])
+        print('saveXML %8.1f ms %8.2f MB/s (%d worker processes, %s)'%(1000*best, size/best/1e6, workers, 'pickled workspace' if context is None else 'fork'))
+    print('peak memory %8.1f kB (%.2f x output size)'%(peak/1024, peak/size))
+    print('toXML with %d filters %8.1f ms (%.1f kB)'%(len(filters), 1000*filteredElapsed, filteredSize/1024))
+    print('%d files: saveXML per file %8.1f ms, saveXMLSplit %8.1f ms'%(len(fileMap), 1000*min(serialElapsed), 1000*min(splitElapsed)))
+    if len(paths) == 0:
+        _benchmarkCorpus()
+        _benchmarkNesting()
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
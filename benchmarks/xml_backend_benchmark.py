@@ -0,0 +1,46 @@
+"""
+Compares load time of the available XML backends (lxml and xml.etree.ElementTree).
+
+Usage: python benchmarks/xml_backend_benchmark.py [file.arxml ...]
+
+Without arguments the ARXML files in tests/arxml/expected_gen are used as corpus.
+"""
+import os, sys
+import glob
+import timeit
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import autosar
+import autosar.base
+
+def _load(path):
+    ws = autosar.workspace()
+    ws.loadXML(path)
+    return ws
+
+def _loadable_files(paths):
+    result = []
+    for path in paths:
+        try:
+            _load(path)
+        except Exception:
+            continue
+        result.append(path)
+    return result
+
+def main(paths, repeat=5):
+    if len(paths) == 0:
+        corpus_dir = os.path.join(os.path.dirname(__file__), '..', 'tests', 'arxml', 'expected_gen')
+        paths = sorted(glob.glob(os.path.join(corpus_dir, '*', '*.arxml')))
+        number = 20
+    else:
+        number = 1
+    paths = _loadable_files(paths)
+    backends = ['etree'] if autosar.base.lxmlTree is None else ['etree', 'lxml']
+    print('files: %d, iterations: %d'%(len(paths), number))
+    for backend in backends:
+        autosar.base.setXMLBackend(backend)
+        elapsed = min(timeit.repeat(lambda: [_load(path) for path in paths], number=number, repeat=repeat))
+        print('%-6s %8.3f ms per iteration'%(backend, 1000*elapsed/number))
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -26,6 +26,9 @@ setup(name='autosar',
 	  install_requires=[
           'cfile>=0.1.4',
       ],
+	  extras_require={
+          'lxml': ['lxml'],
+      },
       packages=['autosar','autosar.parser','autosar.writer','autosar.rte', 'autosar.bsw', 'autosar.util'],
 	  zip_safe=False,
 	  test_suite='tests.my_test_suite')
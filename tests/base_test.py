@@ -1,4 +1,4 @@
-import os, sys
+import os, sys, io
 mod_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, mod_path)
 import autosar
@@ -143,5 +143,89 @@ class TestBase(unittest.TestCase):
       self.assertEqual(ws.version, 4.2)
       self.assertEqual(ws.patch, 2)
    
+   def test_default_namespace_reader(self):
+      xmlData=b"""<?xml version="1.0" encoding="utf-8"?>
+<!-- comment -->
+<AUTOSAR xmlns="http://autosar.org/schema/r4.0" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://autosar.org/schema/r4.0 AUTOSAR_4-2-2.xsd">
+  <AR-PACKAGES>
+    <AR-PACKAGE>
+      <SHORT-NAME>Package1</SHORT-NAME>
+    </AR-PACKAGE>
+  </AR-PACKAGES>
+</AUTOSAR>
+"""
+      class SmallChunkReader:
+         def __init__(self, data):
+            self.fp = io.BytesIO(data)
+         def read(self, size=-1):
+            return self.fp.read(7)
+      for fp in [io.BytesIO(xmlData), SmallChunkReader(xmlData)]:
+         reader = autosar.base.DefaultNamespaceReader(fp)
+         xmlRoot = ElementTree.parse(reader).getroot()
+         self.assertEqual(reader.namespace, 'http://autosar.org/schema/r4.0')
+         self.assertEqual(xmlRoot.tag, 'AUTOSAR')
+         self.assertEqual(xmlRoot.find('./AR-PACKAGES/AR-PACKAGE/SHORT-NAME').text, 'Package1')
+         (major, minor, patch, release, schema) = autosar.base.parseAutosarVersionAndSchema(xmlRoot)
+         self.assertEqual((major, minor, patch), (4, 2, 2))
+         self.assertEqual(schema, 'AUTOSAR_4-2-2.xsd')
+
+   def test_default_namespace_reader_without_namespace(self):
+      xmlData=b"""<AUTOSAR><AR-PACKAGES/></AUTOSAR>"""
+      reader = autosar.base.DefaultNamespaceReader(io.BytesIO(xmlData))
+      xmlRoot = ElementTree.parse(reader).getroot()
+      self.assertIsNone(reader.namespace)
+      self.assertEqual(xmlRoot.tag, 'AUTOSAR')
+
+   def test_compile_filters(self):
+      filterList = [None, [], ['/Package1'], ['/Package1/'], ['/Package1/Sub1/Elem1', '/Package2/*/Elem2'], ['/*/Sub1']]
+      refs = ['/Package1', '/Package1/Elem1', '/Package1/Sub1', '/Package1/Sub1/Elem1', '/Package1/Sub1/Elem2', '/Package1/Sub2/Elem2',
+              '/Package2', '/Package2/Sub1', '/Package2/Sub1/Elem2', '/Package2/Sub1/Elem2/Port1', '/Package2/Sub2/Elem1', '/Package3']
+      for filters in filterList:
+         if filters is not None:
+            filters = [autosar.base.prepareFilter(x) for x in filters]
+         refFilter = autosar.base.compileFilters(filters)
+         for ref in refs:
+            expected = autosar.base.applyFilter(ref, filters)
+            self.assertEqual(refFilter.descend(ref) is not None, expected, (filters, ref))
+            (parent, _, name) = ref.rpartition('/')
+            state = refFilter.descend(parent) if len(parent) > 0 else refFilter
+            self.assertEqual((state is not None) and state.matches(name), expected, (filters, ref))
+
+   def test_xml_backend(self):
+      backends = ['etree'] if autosar.base.lxmlTree is None else ['etree', 'lxml']
+      default = autosar.base.getXMLBackend()
+      self.assertEqual(default, backends[-1])
+      xmlData = b'<AUTOSAR><AR-PACKAGES><AR-PACKAGE><SHORT-NAME>Package1</SHORT-NAME><ELEMENTS><A/><B/></ELEMENTS></AR-PACKAGE></AR-PACKAGES></AUTOSAR>'
+      try:
+         for backend in backends:
+            autosar.base.setXMLBackend(backend)
+            self.assertEqual(autosar.base.getXMLBackend(), backend)
+            xmlRoot = autosar.base.parseXMLSource(io.BytesIO(xmlData))
+            xmlPackage = autosar.base.XMLPath('./AR-PACKAGES/AR-PACKAGE').find(xmlRoot)
+            self.assertEqual(autosar.base.XMLPath('SHORT-NAME').find(xmlPackage).text, 'Package1')
+            self.assertEqual([x.tag for x in autosar.base.XMLPath('./ELEMENTS/*').findall(xmlPackage)], ['A', 'B'])
+            self.assertIsNone(autosar.base.XMLPath('./SUB-PACKAGES').find(xmlPackage))
+            self.assertEqual(autosar.base.XMLPath('./SUB-PACKAGES/AR-PACKAGE').findall(xmlPackage), [])
+            events = [(event, x.tag) for (event, x) in autosar.base.iterParseXMLSource(io.BytesIO(xmlData), ('start',))]
+            self.assertEqual(events[:2], [('start', 'AUTOSAR'), ('start', 'AR-PACKAGES')])
+            #malformed XML raises the same exception on both backends
+            with self.assertRaises(ElementTree.ParseError):
+               autosar.base.parseXMLSource(io.BytesIO(xmlData[:-10]))
+            with self.assertRaises(ElementTree.ParseError):
+               list(autosar.base.iterParseXMLSource(io.BytesIO(xmlData[:-10]), ('start', 'end')))
+         with self.assertRaises(ValueError):
+            autosar.base.setXMLBackend('sax')
+         with self.assertRaises(ValueError):
+            autosar.base.setXMLBackend('etree', hugeTree=True)
+         if autosar.base.lxmlTree is None:
+            with self.assertRaises(RuntimeError):
+               autosar.base.setXMLBackend('lxml')
+         else:
+            autosar.base.setXMLBackend('lxml', hugeTree=True)
+            self.assertEqual(autosar.base.parseXMLSource(io.BytesIO(xmlData)).tag, 'AUTOSAR')
+      finally:
+         autosar.base.setXMLBackend(default)
+      self.assertEqual(autosar.base.getXMLBackend(), default)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
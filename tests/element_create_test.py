@@ -2,6 +2,7 @@ import os, sys
 mod_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, mod_path)
 import autosar
+import pickle
 import unittest
 
 class TestRealTypeCreate(unittest.TestCase):
@@ -94,5 +95,115 @@ class TestParameterInterfaceCreate(unittest.TestCase):
         portinterface = package.createParameterInterface('ButtonDebounceTime_I')
         self.assertIsInstance(portinterface, autosar.portinterface.ParameterInterface)
 
+class TestElementRef(unittest.TestCase):
+
+    def test_ref_after_rename(self):
+        ws = autosar.workspace(version="4.2.2")
+        package = ws.createPackage('DataTypes')
+        subPackage = package.createSubPackage('CompuMethods')
+        compuMethod = subPackage.createCompuMethodConst('OnOff_T', ['OFF', 'ON'])
+        self.assertEqual(compuMethod.ref, '/DataTypes/CompuMethods/OnOff_T')
+        subPackage.name = 'CompuMethods2'
+        self.assertEqual(compuMethod.ref, '/DataTypes/CompuMethods2/OnOff_T')
+        compuMethod.name = 'OnOff2_T'
+        self.assertEqual(compuMethod.ref, '/DataTypes/CompuMethods2/OnOff2_T')
+        otherPackage = ws.createPackage('Other')
+        subPackage.parent = otherPackage
+        self.assertEqual(compuMethod.ref, '/Other/CompuMethods2/OnOff2_T')
+        subPackage.parent = None
+        self.assertIsNone(subPackage.ref)
+
+class TestElementSlots(unittest.TestCase):
+
+    def test_slots_pickle(self):
+        ws = autosar.workspace(version="4.2.2")
+        package = ws.createPackage('DataTypes', role='DataType')
+        package.createSubPackage('CompuMethods', role='CompuMethod')
+        package.createSubPackage('DataConstrs', role='DataConstraint')
+        package.createSubPackage('BaseTypes').createSwBaseType('uint8', 8, nativeDeclaration='uint8')
+        dataType = package.createImplementationDataType('OnOff_T', '/DataTypes/BaseTypes/uint8', valueTable=['OFF', 'ON'])
+        scale = ws.find(dataType.compuMethodRef).intToPhys.elements[0]
+        self.assertFalse(hasattr(scale, '__dict__'))
+        interfaces = ws.createPackage('PortInterfaces', role='PortInterface')
+        portInterface = interfaces.createSenderReceiverInterface('OnOff_I', autosar.DataElement('OnOff', '/DataTypes/OnOff_T'))
+        dataElement = portInterface.dataElements[0]
+        self.assertFalse(hasattr(dataElement, '__dict__'))
+        self.assertFalse(hasattr(dataElement, 'desc'))
+        dataElement.desc = 'On/off state'
+        ws2 = pickle.loads(pickle.dumps(ws))
+        dataElement2 = ws2.find('/PortInterfaces/OnOff_I/OnOff')
+        self.assertIsNot(dataElement2, dataElement)
+        self.assertEqual(dataElement2.ref, '/PortInterfaces/OnOff_I/OnOff')
+        self.assertEqual(dataElement2.typeRef, '/DataTypes/OnOff_T')
+        self.assertEqual(dataElement2.desc, 'On/off state')
+        self.assertFalse(hasattr(dataElement2, 'longName'))
+        self.assertEqual(ws2.find(dataType.compuMethodRef).intToPhys.elements[1].textValue, 'ON')
+        with self.assertRaises(AttributeError):
+            scale.unknownAttribute = None
+
+class TestComponentFind(unittest.TestCase):
+
+    def _createWorkspace(self):
+        ws = autosar.workspace(version="4.2.2")
+        package = ws.createPackage('DataTypes', role='DataType')
+        package.createSubPackage('DataConstrs', role='DataConstraint')
+        baseTypes = package.createSubPackage('BaseTypes')
+        baseTypes.createSwBaseType('uint16', 16, nativeDeclaration='uint16')
+        package.createImplementationDataType('uint16', lowerLimit=0, upperLimit=65535, baseTypeRef='/DataTypes/BaseTypes/uint16')
+        ws.createPackage('Constants', role='Constant')
+        package = ws.createPackage('PortInterfaces', role='PortInterface')
+        package.createSenderReceiverInterface('Signal_I', autosar.DataElement('Signal', 'uint16'))
+        ws.createPackage('ComponentTypes', role='ComponentType')
+        return ws
+
+    def test_find_after_create(self):
+        ws = self._createWorkspace()
+        swc = ws.find('/ComponentTypes').createApplicationSoftwareComponent('MySwc')
+        port = swc.createRequirePort('Signal', 'Signal_I')
+        self.assertIs(swc.find('Signal'), port)
+        behavior = swc.behavior
+        runnable = behavior.createRunnable('Run', portAccess=['Signal'])
+        self.assertIs(behavior.find('Run'), runnable)
+        event1 = behavior.createTimerEvent('Run', 10)
+        self.assertIs(behavior.find('TMT_Run'), event1)
+        event2 = behavior.createTimerEvent('Run', 10)
+        self.assertEqual(event1.name, 'TMT_Run_0')
+        self.assertEqual(event2.name, 'TMT_Run_1')
+        self.assertIsNone(behavior.find('TMT_Run'))
+        self.assertIs(behavior.find('TMT_Run_0'), event1)
+        self.assertIs(behavior.find('TMT_Run_1'), event2)
+        self.assertIs(swc.find('MySwc_InternalBehavior/TMT_Run_1'), event2)
+        behavior.events.remove(event1)
+        self.assertIsNone(behavior.find('TMT_Run_0'))
+        self.assertEqual(behavior.createTimerEvent('Run', 20).name, 'TMT_Run_2')
+        port.name = 'Signal2'
+        self.assertIsNone(swc.find('Signal'))
+        self.assertIs(swc.find('Signal2'), port)
+        runnable.name = 'Run2'
+        self.assertIsNone(behavior.find('Run'))
+        self.assertIs(behavior.find('Run2'), runnable)
+
+    def test_find_after_replace(self):
+        ws = self._createWorkspace()
+        package = ws.find('/ComponentTypes')
+        swc = package.createApplicationSoftwareComponent('MySwc')
+        (port1, port2) = (swc.createRequirePort('Signal1', 'Signal_I'), swc.createRequirePort('Signal2', 'Signal_I'))
+        other = package.createApplicationSoftwareComponent('OtherSwc')
+        (port3, port4) = (other.createRequirePort('Signal3', 'Signal_I'), other.createRequirePort('Signal4', 'Signal_I'))
+        self.assertIs(swc.find('Signal1'), port1)
+        #replaced in place, the length of the list does not change
+        swc.requirePorts[0] = port3
+        self.assertIsNone(swc.find('Signal1'))
+        self.assertIs(swc.find('Signal3'), port3)
+        self.assertIs(swc.find('Signal2'), port2)
+        #removed and appended between two lookups
+        swc.requirePorts.remove(port2)
+        swc.requirePorts.append(port4)
+        self.assertIsNone(swc.find('Signal2'))
+        self.assertIs(swc.find('Signal4'), port4)
+        swc.requirePorts[1] = port2
+        self.assertIs(swc.find('Signal2'), port2)
+        self.assertIsNone(swc.find('Signal4'))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,592 @@
+import os, sys
+mod_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, mod_path)
+import autosar
+import autosar.util.cache
+from autosar.workspace import _pickleWriterWorkspace, _writeXMLWorker, _writeXMLWorkerInit
+import unittest
+import tempfile
+import multiprocessing
+import shutil
+
+expected_gen_dir = os.path.join(os.path.dirname(__file__), 'arxml', 'expected_gen')
+
+def _expected_path(*parts):
+   return os.path.join(expected_gen_dir, *parts)
+
+def _load(paths, **kwargs):
+   """
+   Creates a new workspace and loads paths into it, a single file with loadXML or a list of files with loadXMLFiles
+   """
+   ws = autosar.workspace()
+   if isinstance(paths, str):
+      ws.loadXML(paths, **kwargs)
+   else:
+      ws.loadXMLFiles(paths, **kwargs)
+   return ws
+
+class WorkspaceTestCase(unittest.TestCase):
+
+   def setUp(self):
+      self.tmp_dir = tempfile.mkdtemp()
+
+   def tearDown(self):
+      shutil.rmtree(self.tmp_dir)
+
+   def assertLoadEqual(self, paths, **kwargs):
+      """
+      Loads paths with the given load options and checks that the workspace is the same as when each file is loaded with a plain loadXML.
+      Returns the workspace loaded with the options.
+      """
+      expected = autosar.workspace()
+      for path in ([paths] if isinstance(paths, str) else paths):
+         expected.loadXML(path)
+      ws = _load(paths, **kwargs)
+      self.assertEqual(ws.version, expected.version)
+      self.assertEqual(ws.schema, expected.schema)
+      self.assertEqual([x.name for x in ws.packages], [x.name for x in expected.packages])
+      self.assertEqual(ws.toXML(), expected.toXML())
+      return ws
+
+class TestWorkspaceLoad(WorkspaceTestCase):
+
+   def test_streaming_load_ar4(self):
+      path = _expected_path('datatype', 'ar4_adt_with_data_constraint_and_compu_method.arxml')
+      ws = self.assertLoadEqual(path, streaming=True)
+      self.assertIsNone(ws.xmlroot)
+      self.assertIsInstance(ws.find('/DataTypes/CompuMethods'), autosar.package.Package)
+
+   def test_parsed_text_is_shared(self):
+      path = _expected_path('portinterface', 'ar4_sender_receiver_interface_multiple_elements_explicit.arxml')
+      ws = _load(path)
+      (seconds, minutes) = (ws.find('/DataTypes/Seconds_T'), ws.find('/DataTypes/Minutes_T'))
+      self.assertEqual(seconds.category, 'TYPE_REFERENCE')
+      self.assertIs(seconds.category, minutes.category)
+      self.assertEqual(seconds.implementationTypeRef, '/DataTypes/uint8')
+      self.assertIs(seconds.implementationTypeRef, minutes.implementationTypeRef)
+
+   def test_streaming_load_ar3(self):
+      self.assertLoadEqual(_expected_path('datatype', 'ar3_record_type_array.arxml'), streaming=True)
+
+   def test_streaming_load_with_roles(self):
+      path = _expected_path('portinterface', 'ar4_sender_receiver_interface_single_element.arxml')
+      ws = self.assertLoadEqual(path, roles={'/PortInterfaces': 'PortInterface'}, streaming=True)
+      self.assertEqual(ws.roles['PortInterface'], '/PortInterfaces')
+      self.assertIsNotNone(ws.find('HeaterPwrStat_I', role='PortInterface'))
+
+   def test_lazy_load(self):
+      path = _expected_path('datatype', 'ar4_adt_with_data_constraint_and_compu_method.arxml')
+      ws2 = _load(path, lazy=True)
+      package = ws2.find('/DataTypes')
+      self.assertIsInstance(package.map['elements']['Pitch_ADT'], autosar.package.ElementStub)
+      compuMethods = ws2.find('/DataTypes/CompuMethods')
+      self.assertIsInstance(compuMethods.map['elements']['Pitch_T'], autosar.package.ElementStub)
+      elem = ws2.find('/DataTypes/Pitch_ADT')
+      self.assertIsInstance(elem, autosar.datatype.ApplicationPrimitiveDataType)
+      self.assertIs(package.map['elements']['Pitch_ADT'], elem)
+      self.assertIs(ws2.find('/DataTypes/Pitch_ADT'), elem)
+      self.assertIsInstance(compuMethods.map['elements']['Pitch_T'], autosar.package.ElementStub)
+      self.assertEqual(ws2.toXML(), _load(path).toXML())
+      self.assertIsInstance(compuMethods.map['elements']['Pitch_T'], autosar.datatype.CompuMethod)
+
+   def test_lazy_load_with_streaming(self):
+      path = _expected_path('datatype', 'ar4_adt_with_data_constraint_and_compu_method.arxml')
+      ws = autosar.workspace()
+      with self.assertRaises(ValueError):
+         ws.loadXML(path, streaming=True, lazy=True)
+
+   def test_load_with_filters(self):
+      path = _expected_path('datatype', 'ar4_adt_with_data_constraint_and_compu_method.arxml')
+      ws = _load(path, filters='/DataTypes/CompuMethods/*')
+      package = ws.find('/DataTypes')
+      self.assertEqual(len(package.elements), 0)
+      self.assertEqual([x.name for x in package.subPackages], ['CompuMethods'])
+      self.assertIsInstance(ws.find('/DataTypes/CompuMethods/Pitch_T'), autosar.datatype.CompuMethod)
+
+   def test_load_element_types_with_references(self):
+      path = _expected_path('datatype', 'ar4_adt_with_data_constraint_and_compu_method.arxml')
+      ws1 = _load(path)
+      ws2 = _load(path, elementTypes=['APPLICATION-PRIMITIVE-DATA-TYPE'])
+      self.assertIsNotNone(ws2.find('/DataTypes/Units/deg'))
+      self.assertIsNotNone(ws2.find('/DataTypes/CompuMethods/Pitch_T'))
+      self.assertIsNone(ws2.find('/DataTypes/BaseTypes')) #empty package is not created
+      ws1.find('/DataTypes').subPackages.pop()
+      del ws1.find('/DataTypes').map['packages']['BaseTypes']
+      self.assertEqual(ws1.toXML(), ws2.toXML())
+      path = _expected_path('behavior', 'ar4_behavior_empty_from_swc.arxml')
+      ws3 = _load(path, elementTypes=['APPLICATION-SW-COMPONENT-TYPE'])
+      self.assertIsNotNone(ws3.find('/ComponentTypes/MyApplication'))
+      self.assertIsNone(ws3.find('/ComponentTypes/MyApplication_Implementation'))
+      ws4 = _load(path, elementTypes=['SWC-IMPLEMENTATION'])
+      self.assertIsNotNone(ws4.find('/ComponentTypes/MyApplication'))
+      self.assertIsNotNone(ws4.find('/ComponentTypes/MyApplication_Implementation'))
+
+   def test_load_multiple_files_in_worker_processes(self):
+      paths = [_expected_path('datatype', 'ar4_adt_with_data_constraint_and_compu_method.arxml'),
+               _expected_path('datatype', 'ar4_implementation_record_type1.arxml'),
+               _expected_path('portinterface', 'ar4_sender_receiver_interface_single_element.arxml'),
+               _expected_path('mode', 'ar4_simple_mode_decl_group.arxml')]
+      ws = self.assertLoadEqual(paths, roles={'/PortInterfaces': 'PortInterface'}, workers=2)
+      self.assertEqual(ws.roles['PortInterface'], '/PortInterfaces')
+      elem = ws.find('/PortInterfaces/HeaterPwrStat_I')
+      self.assertIs(elem.rootWS(), ws)
+      self.assertIsNone(ws.xmlroot)
+      #no xmlroot either when the files are loaded in the current process
+      self.assertIsNone(self.assertLoadEqual(paths, workers=1).xmlroot)
+      self.assertIsNone(self.assertLoadEqual(paths[:1], workers=2).xmlroot)
+
+   def test_load_uuid(self):
+      src_path = _expected_path('portinterface', 'ar4_sender_receiver_interface_single_element.arxml')
+      with open(src_path) as fp:
+         text = fp.read()
+      text = text.replace('<SENDER-RECEIVER-INTERFACE>', '<SENDER-RECEIVER-INTERFACE UUID="0A1B2C3D-0000-4000-8000-000000000001">')
+      text = text.replace('<VARIABLE-DATA-PROTOTYPE>', '<VARIABLE-DATA-PROTOTYPE UUID="0A1B2C3D-0000-4000-8000-000000000002">')
+      path = os.path.join(self.tmp_dir, 'portinterface.arxml')
+      with open(path, 'w') as fp:
+         fp.write(text)
+      for lazy in [False, True]:
+         ws = _load(path, lazy=lazy)
+         portInterface = ws.find('/PortInterfaces/HeaterPwrStat_I')
+         self.assertEqual(portInterface.uuid, '0a1b2c3d-0000-4000-8000-000000000001')
+         self.assertEqual(portInterface.dataElements[0].uuid, '0a1b2c3d-0000-4000-8000-000000000002')
+         self.assertIsNone(ws.find('/DataTypes/uint8').uuid)
+      #element parsers also set the UUID when called directly
+      (xmlRoot, _) = autosar.base.parseXMLFileStripNamespace(path)
+      xmlElement = next(xmlRoot.iter('SENDER-RECEIVER-INTERFACE'))
+      parser = autosar.parser.portinterface_parser.PortInterfacePackageParser(4.0)
+      portInterface = parser.parseElement(xmlElement)
+      self.assertEqual(portInterface.uuid, '0a1b2c3d-0000-4000-8000-000000000001')
+      self.assertFalse(hasattr(parser.parseElement, '__wrapped__')) #only the method creating the element is decorated
+
+   def test_default_handler_override(self):
+      class LowerCaseParser(autosar.parser.datatype_parser.DataTypeParser):
+         def _handleShortName(self, xmlElem):
+            self.common[-1].name = self.parseTextNode(xmlElem).lower()
+      (xmlRoot, _) = autosar.base.parseXMLFileStripNamespace(_expected_path('datatype', 'ar4_u8_adt.arxml'))
+      xmlElement = next(xmlRoot.iter('APPLICATION-PRIMITIVE-DATA-TYPE'))
+      self.assertEqual(LowerCaseParser(4.0).parseElement(xmlElement).name, 'uint8_adt')
+
+class TestBehaviorRoundTrip(WorkspaceTestCase):
+
+   def _round_trip(self, ws):
+      path = os.path.join(self.tmp_dir, 'behavior.arxml')
+      ws.saveXML(path)
+      return self.assertLoadEqual(path)
+
+   def _create_workspace(self, version):
+      ws = autosar.workspace(version=version)
+      swc = ws.createPackage('ComponentTypes', role='ComponentType').createApplicationSoftwareComponent('MyApplication')
+      swc.behavior.createRunnable('Run')
+      swc.behavior.createRunnable('Init')
+      swc.behavior.createTimingEvent('Run', period=20)
+      return ws
+
+   def test_behavior_round_trip_ar3(self):
+      ws = self._round_trip(self._create_workspace("3.0.2"))
+      behavior = ws.find('/ComponentTypes/MyApplication_InternalBehavior')
+      self.assertIsInstance(behavior, autosar.behavior.InternalBehavior)
+      self.assertEqual([runnable.name for runnable in behavior.runnables], ['Run', 'Init'])
+      self.assertEqual([(type(event), event.name) for event in behavior.events], [(autosar.behavior.TimingEvent, 'TMT_Run')])
+      self.assertEqual(behavior.events[0].period, 20)
+
+   def test_behavior_round_trip_ar4(self):
+      ws = self._create_workspace("4.2.2")
+      ws.find('/ComponentTypes/MyApplication').behavior.createInitEvent('Init')
+      ws = self._round_trip(ws)
+      behavior = ws.find('/ComponentTypes/MyApplication').behavior
+      self.assertIsInstance(behavior, autosar.behavior.SwcInternalBehavior)
+      self.assertEqual([runnable.name for runnable in behavior.runnables], ['Run', 'Init'])
+      self.assertEqual([type(event) for event in behavior.events], [autosar.behavior.TimingEvent, autosar.behavior.InitEvent])
+      self.assertEqual(behavior.events[1].startOnEventRef, '/ComponentTypes/MyApplication/MyApplication_InternalBehavior/Init')
+      #file from the test corpus
+      path = _expected_path('behavior', 'ar4_runnable_with_init_event.arxml')
+      with open(path, encoding='utf-8') as fp:
+         self.assertEqual(_load(path).toXML(), fp.read())
+
+class TestWorkspaceFind(unittest.TestCase):
+
+   def test_find_after_changes(self):
+      ws = autosar.workspace()
+      package = ws.createPackage('DataTypes')
+      compuMethods = package.createSubPackage('CompuMethods')
+      compuMethod = compuMethods.createCompuMethodConst('OnOff_T', ['OFF', 'ON'])
+      self.assertIs(ws.find('/DataTypes'), package)
+      self.assertIs(ws.find('DataTypes/CompuMethods'), compuMethods)
+      self.assertIs(ws.find('/DataTypes/CompuMethods/OnOff_T'), compuMethod)
+      self.assertIs(ws.find('/DataTypes/CompuMethods/OnOff_T/'), compuMethod)
+      self.assertIsNone(ws.find('/DataTypes/CompuMethods/OnOff_T/Unknown'))
+      self.assertIsNone(ws.find('/DataTypes/Unknown/OnOff_T'))
+      compuMethods.delete('OnOff_T')
+      self.assertIsNone(ws.find('/DataTypes/CompuMethods/OnOff_T'))
+      units = autosar.package.Package('Units')
+      units.append(autosar.datatype.Unit('deg', 'deg'))
+      package.appendPackage(units)
+      self.assertIs(ws.find('/DataTypes/Units'), units)
+      self.assertIs(ws.find('/DataTypes/Units/deg'), units.find('deg'))
+      ws.delete('/DataTypes')
+      self.assertIsNone(ws.find('/DataTypes'))
+      self.assertIsNone(ws.find('/DataTypes/Units/deg'))
+
+   def test_find_nested_element(self):
+      path = _expected_path('portinterface', 'ar4_sender_receiver_interface_single_element.arxml')
+      for lazy in [False, True]:
+         ws = _load(path, lazy=lazy)
+         portInterface = ws.find('/PortInterfaces/HeaterPwrStat_I')
+         self.assertIs(ws.find('/PortInterfaces/HeaterPwrStat_I/HeaterPwrStat'), portInterface.dataElements[0])
+         self.assertIs(ws.find('/PortInterfaces/HeaterPwrStat_I'), portInterface)
+
+   def test_findall_patterns(self):
+      path = _expected_path('portinterface', 'ar4_sender_receiver_interface_multiple_elements_explicit.arxml')
+      for lazy in [False, True]:
+         ws = _load(path, lazy=lazy)
+         self.assertEqual([x.ref for x in ws.findall('/DataTypes/uint*')], ['/DataTypes/uint8', '/DataTypes/uint16', '/DataTypes/uint32'])
+         self.assertEqual([x.ref for x in ws.findall('/DataTypes/*/uint8')], ['/DataTypes/BaseTypes/uint8'])
+         self.assertEqual([x.ref for x in ws.findall('/DataTypes/**/uint8')], ['/DataTypes/uint8', '/DataTypes/BaseTypes/uint8'])
+         self.assertEqual([x.ref for x in ws.findall('/**/*_I')], ['/PortInterfaces/SystemTime_I'])
+         self.assertEqual([x.ref for x in ws.findall('**', autosar.portinterface.SenderReceiverInterface)], ['/PortInterfaces/SystemTime_I'])
+         self.assertEqual(ws.findall('/PortInterfaces/Unknown*'), [])
+         result = ws.iterfind('/DataTypes/**', autosar.datatype.CompuMethod)
+         self.assertIsInstance(next(result), autosar.datatype.CompuMethod)
+         self.assertEqual(ws.findall('/DataTypes/**/**/uint8'), ws.findall('/DataTypes/**/uint8'))
+
+class TestWorkspaceElementsOfType(unittest.TestCase):
+
+   def test_elements_of_type(self):
+      path = _expected_path('portinterface', 'ar4_sender_receiver_interface_multiple_elements_explicit.arxml')
+      for lazy in [False, True]:
+         ws = _load(path, lazy=lazy)
+         self.assertEqual([x.ref for x in ws.elementsOfType(autosar.portinterface.SenderReceiverInterface)], ['/PortInterfaces/SystemTime_I'])
+         self.assertEqual(len(ws.elementsOfType(autosar.portinterface.PortInterface)), 1)
+         compuMethods = ws.elementsOfType(autosar.datatype.CompuMethod)
+         self.assertEqual([x.ref for x in compuMethods], ['/DataTypes/CompuMethods/boolean', '/DataTypes/CompuMethods/OffOn_T'])
+         ws.find('/DataTypes/CompuMethods').delete('boolean')
+         self.assertEqual(ws.elementsOfType(autosar.datatype.CompuMethod), compuMethods[1:])
+         compuMethod = ws.find('/DataTypes/CompuMethods').createCompuMethodConst('OnOff_T', ['OFF', 'ON'])
+         self.assertEqual(ws.elementsOfType(autosar.datatype.CompuMethod), [compuMethods[1], compuMethod])
+         ws.delete('/PortInterfaces')
+         self.assertEqual(ws.elementsOfType(autosar.portinterface.PortInterface), [])
+
+   def test_role(self):
+      ws = autosar.workspace()
+      package = ws.createPackage('DataTypes', role='DataType')
+      compuMethods = package.createSubPackage('CompuMethods', role='CompuMethod')
+      compuMethod = compuMethods.createCompuMethodConst('OnOff_T', ['OFF', 'ON'])
+      self.assertIs(ws.findRolePackage('CompuMethod'), compuMethods)
+      self.assertEqual(ws.elementsOfType(autosar.datatype.CompuMethod, role='CompuMethod'), [compuMethod])
+      self.assertEqual(ws.elementsOfType(autosar.datatype.CompuMethod, role='DataType'), [])
+      compuMethods.role = None
+      self.assertIsNone(ws.findRolePackage('CompuMethod'))
+      ws.setRole('/DataTypes/CompuMethods', 'CompuMethod')
+      self.assertIs(ws.findRolePackage('CompuMethod'), compuMethods)
+
+class TestWorkspaceReferrers(unittest.TestCase):
+
+   def test_referrers(self):
+      path = _expected_path('component', 'ar4_application_swc.arxml')
+      for lazy in [False, True]:
+         ws = _load(path, lazy=lazy)
+         port = ws.find('/ComponentTypes/MyApplication/VehicleSpeed')
+         self.assertEqual(ws.referrers('/PortInterfaces/VehicleSpeed_I'), [port])
+         self.assertEqual(ws.referrers('/Constants/VehicleSpeed_IV'), [port])
+         self.assertEqual(ws.referrers('/PortInterfaces/Unknown_I'), [])
+         ws.delete('/ComponentTypes/MyApplication')
+         self.assertEqual(ws.referrers('/PortInterfaces/VehicleSpeed_I'), [])
+
+   def test_resolve_references(self):
+      path = _expected_path('component', 'ar4_application_swc.arxml')
+      ws = _load(path)
+      dangling = ws.resolveReferences()
+      port = ws.find('/ComponentTypes/MyApplication/VehicleSpeed')
+      self.assertIn(('/PortInterfaces/VehicleSpeed_I', port), dangling)
+      self.assertEqual(sorted(set(ref for (ref, _) in dangling)), [ref for ref in sorted(ws.referrerMap) if ws.find(ref) is None])
+      self.assertIs(ws.resolve('/ComponentTypes/MyApplication/VehicleSpeed'), port)
+      self.assertIn('/ComponentTypes/MyApplication/VehicleSpeed', ws.linkMap)
+      port.name = 'VehicleSpeed2'
+      self.assertIsNone(ws.resolve('/ComponentTypes/MyApplication/VehicleSpeed'))
+      self.assertIs(ws.resolve('/ComponentTypes/MyApplication/VehicleSpeed2'), port)
+      ws.find('/ComponentTypes').delete('MyApplication')
+      self.assertIsNone(ws.resolve('/ComponentTypes/MyApplication/VehicleSpeed2'))
+      self.assertEqual(ws.linkMap, {})
+
+   def test_referrers_after_append(self):
+      ws = autosar.workspace(version="4.2.2")
+      package = ws.createPackage('DataTypes', role='DataType')
+      package.createSubPackage('CompuMethods', role='CompuMethod')
+      package.createSubPackage('DataConstrs', role='DataConstraint')
+      baseTypes = package.createSubPackage('BaseTypes')
+      baseTypes.createSwBaseType('uint8', 8, nativeDeclaration='uint8')
+      self.assertEqual(ws.referrers('/DataTypes/BaseTypes/uint8'), [])
+      dataType = package.createImplementationDataType('OnOff_T', '/DataTypes/BaseTypes/uint8', valueTable=['OFF', 'ON'])
+      self.assertEqual(ws.referrers('/DataTypes/BaseTypes/uint8'), [dataType])
+      self.assertEqual(ws.referrers(dataType.variantProps[0].compuMethodRef), [dataType])
+      package.delete('OnOff_T')
+      self.assertEqual(ws.referrers('/DataTypes/BaseTypes/uint8'), [])
+
+   def test_closure_and_extract(self):
+      path = _expected_path('portinterface', 'ar4_sender_receiver_interface_multiple_elements_explicit.arxml')
+      ws = _load(path, lazy=True)
+      closure = ws.closure('/PortInterfaces/SystemTime_I')
+      self.assertEqual(closure, ['/DataTypes/BaseTypes/uint8',
+                                 '/DataTypes/DataConstrs/Hours_T_DataConstr',
+                                 '/DataTypes/DataConstrs/Minutes_T_DataConstr',
+                                 '/DataTypes/DataConstrs/Seconds_T_DataConstr',
+                                 '/DataTypes/DataConstrs/uint8_DataConstr',
+                                 '/DataTypes/Hours_T',
+                                 '/DataTypes/Minutes_T',
+                                 '/DataTypes/Seconds_T',
+                                 '/DataTypes/uint8',
+                                 '/PortInterfaces/SystemTime_I'])
+      self.assertEqual(ws.closure('/PortInterfaces/SystemTime_I/Seconds'), closure)
+      self.assertEqual(ws.closure('/NonExisting'), [])
+      stubs = [ref for (ref, elem) in ws.refMap['elements'].items() if isinstance(elem, autosar.package.ElementStub)]
+      self.assertGreater(len(stubs), 0)
+      ws.setRole('/DataTypes', 'DataType')
+      result = ws.extract('/PortInterfaces/SystemTime_I')
+      self.assertEqual(sorted(result.refMap['elements']), closure)
+      for ref in closure:
+         copied = result.find(ref)
+         self.assertIsNotNone(copied)
+         self.assertIsNot(copied, ws.find(ref))
+         self.assertIs(copied.rootWS(), result)
+      self.assertEqual(result.roles['DataType'], '/DataTypes')
+      self.assertIsNone(result.find('/Constants'))
+      self.assertIs(result.find('/PortInterfaces/SystemTime_I').dataElements[0].parent, result.find('/PortInterfaces/SystemTime_I'))
+      self.assertIs(ws.find('/PortInterfaces/SystemTime_I').rootWS(), ws)
+
+class TestWorkspaceCache(WorkspaceTestCase):
+
+   def test_load_from_cache(self):
+      path = _expected_path('datatype', 'ar4_adt_with_data_constraint_and_compu_method.arxml')
+      cache = autosar.util.cache.WorkspaceCache(self.tmp_dir)
+      self.assertLoadEqual(path, cache=cache)
+      self.assertGreater(cache.size(), 0)
+      key = cache.key(path, autosar.workspace()._parserSignature(path))
+      self.assertIsNotNone(cache.get(key))
+      #same entry when the package parser was already created by loading another file
+      ws4 = _load(_expected_path('datatype', 'ar4_u8_adt.arxml'))
+      self.assertEqual(ws4._parserSignature(path), autosar.workspace()._parserSignature(path))
+      ws4.loadXML(path, cache=cache)
+      self.assertEqual(len(cache._entries()), 1)
+      ws3 = self.assertLoadEqual(path, roles={'/DataTypes': 'DataType'}, cache=cache)
+      self.assertIsNone(ws3.xmlroot)
+      self.assertIs(ws3.find('Pitch_ADT', role='DataType').rootWS(), ws3)
+      cache.invalidate(path)
+      self.assertIsNone(cache.get(key))
+      self.assertEqual(cache.size(), 0)
+
+   def test_load_multiple_files_from_cache(self):
+      paths = [_expected_path('datatype', 'ar4_adt_with_data_constraint_and_compu_method.arxml'),
+               _expected_path('portinterface', 'ar4_sender_receiver_interface_single_element.arxml')]
+      cache = autosar.util.cache.WorkspaceCache(self.tmp_dir)
+      self.assertLoadEqual(paths, workers=2, cache=cache)
+      self.assertGreater(cache.size(), 0)
+      self.assertLoadEqual(paths, workers=2, cache=cache)
+      cache.invalidate()
+      self.assertEqual(cache.size(), 0)
+
+   def test_evict_least_recently_used(self):
+      cache = autosar.util.cache.WorkspaceCache(self.tmp_dir, maxSize=250)
+      cache.put('a', b'a'*100)
+      cache.put('b', b'b'*100)
+      os.utime(cache._path('a'), ns=(1, 1))
+      os.utime(cache._path('b'), ns=(2, 2))
+      self.assertEqual(cache.get('a'), b'a'*100) #a is now most recently used
+      cache.put('c', b'c'*100)
+      self.assertIsNone(cache.get('b'))
+      self.assertIsNotNone(cache.get('a'))
+      self.assertIsNotNone(cache.get('c'))
+      self.assertEqual(cache.size(), 200)
+
+class TestWorkspaceSave(WorkspaceTestCase):
+
+   def test_save_xml_streaming(self):
+      ws = autosar.workspace(version="4.2.2")
+      package = ws.createPackage('DataTypes', role='DataType')
+      package.createSubPackage('CompuMethods', role='CompuMethod')
+      package.createSubPackage('DataConstrs', role='DataConstraint')
+      package.createSubPackage('BaseTypes').createSwBaseType('uint8', 8, nativeDeclaration='uint8')
+      for i in range(100):
+         package.createImplementationDataType('OnOff%d_T'%i, '/DataTypes/BaseTypes/uint8', valueTable=['OFF', 'ON'])
+      text = ws.toXML()
+      path = os.path.join(self.tmp_dir, 'datatypes.arxml')
+      ws.saveXML(path)
+      with open(path, encoding='utf-8') as fp:
+         self.assertEqual(fp.read(), text)
+      writer = autosar.writer.WorkspaceWriter(ws.version, ws.patch, ws.schema, ws.packageWriter)
+      chunks = list(writer.iterXML(ws, None, None))
+      self.assertGreater(len(chunks), 1)
+      self.assertEqual(''.join(chunks), text)
+      self.assertEqual(['    '+line for line in writer.packageWriter.toXML(package, None, None)], text.split('\n')[3:-3])
+      ws2 = self.assertLoadEqual(path)
+      path2 = os.path.join(self.tmp_dir, 'datatypes2.arxml')
+      ws2.saveXML(path2)
+      with open(path2, encoding='utf-8') as fp:
+         self.assertEqual(fp.read(), ws2.toXML())
+
+   def test_save_xml_nested_indentation(self):
+      ws = autosar.workspace(version="4.2.2")
+      package = ws.createPackage('Constants', role='Constant')
+      value = autosar.constant.NumericalValue('Leaf', 1)
+      for level in reversed(range(10)):
+         value = autosar.constant.RecordValueAR4('Level%d'%level, elements=[value])
+      package.append(autosar.constant.Constant('C_Nested', value))
+      lines = ws.toXML().split('\n')
+      #constant at 8 spaces, below it SHORT-NAME/VALUE-SPEC, 10 levels of RECORD-VALUE-SPECIFICATION/FIELDS and NUMERICAL-VALUE-SPECIFICATION
+      self.assertIn(' '*(8+2*(2+2*10+1))+'<VALUE>1</VALUE>', lines)
+
+   def test_save_xml_custom_writer_indent(self):
+      class CustomWriter(autosar.writer.writer_base.ElementWriter):
+         def getSupportedXML(self):
+            return ['Element']
+         def getSupportedCode(self):
+            return []
+         def writeElementXML(self, elem):
+            inner = ['<SHORT-NAME>%s</SHORT-NAME>'%elem.name]
+            lines = self.indent(inner, 1)
+            self.assertEqual(lines, ['  <SHORT-NAME>Custom</SHORT-NAME>'])
+            self.assertIsNot(lines, inner)
+            return ['<APPLICATION-SW-COMPONENT-TYPE>']+lines+['</APPLICATION-SW-COMPONENT-TYPE>']
+         def writeElementCode(self, elem, localvars):
+            raise NotImplementedError('writeElementCode')
+      ws = autosar.workspace(version="4.2.2")
+      writer = CustomWriter(ws.version, ws.patch)
+      writer.assertEqual, writer.assertIsNot = self.assertEqual, self.assertIsNot
+      ws.registerElementWriter(writer)
+      ws.createPackage('Custom').append(autosar.element.Element('Custom'))
+      self.assertIn('          <SHORT-NAME>Custom</SHORT-NAME>', ws.toXML().split('\n'))
+
+   def test_save_xml_generator_writer(self):
+      class GeneratorWriter(autosar.writer.writer_base.ElementWriter):
+         def getSupportedXML(self):
+            return ['Element']
+         def getSupportedCode(self):
+            return []
+         def _writeInnerXML(self, elem):
+            yield '<SHORT-NAME>%s</SHORT-NAME>'%elem.name
+            yield '<CATEGORY>GEN</CATEGORY>'
+         def writeElementXML(self, elem):
+            yield '<APPLICATION-SW-COMPONENT-TYPE>'
+            yield from self.indentBlock(self._writeInnerXML(elem), 1)
+            yield '</APPLICATION-SW-COMPONENT-TYPE>'
+         def writeElementCode(self, elem, localvars):
+            raise NotImplementedError('writeElementCode')
+      ws = autosar.workspace(version="4.2.2")
+      ws.registerElementWriter(GeneratorWriter(ws.version, ws.patch))
+      ws.createPackage('Custom').append(autosar.element.Element('Custom'))
+      lines = ws.toXML().split('\n')
+      self.assertIn('          <SHORT-NAME>Custom</SHORT-NAME>', lines)
+      self.assertIn('          <CATEGORY>GEN</CATEGORY>', lines)
+
+   def test_save_xml_workers(self):
+      ws = autosar.workspace()
+      for name in ['datatype/ar4_u8_adt.arxml', 'datatype/ar4_adt_with_data_constraint_and_compu_method.arxml',
+                   'portinterface/ar4_sender_receiver_interface_single_element.arxml']:
+         ws.loadXML(_expected_path(*name.split('/')), lazy=True)
+      ws.createPackage('Unhandled').append(autosar.element.Element('Unknown'))
+      self.assertGreater(len(ws.packages), 2)
+      text = ws.toXML()
+      self.assertEqual(ws.unhandledWriter, {'Element'})
+      ws.unhandledWriter = set()
+      ws.find('/Unhandled').unhandledWriter = set()
+      path = os.path.join(self.tmp_dir, 'workers.arxml')
+      ws.saveXML(path, workers=2)
+      with open(path, encoding='utf-8') as fp:
+         self.assertEqual(fp.read(), text)
+      self.assertEqual(ws.unhandledWriter, {'Element'})
+      self.assertEqual(ws.toXML(filters=['/DataTypes/*', '/PortInterfaces/*'], workers=2), ws.toXML(filters=['/DataTypes/*', '/PortInterfaces/*']))
+      if 'fork' in multiprocessing.get_all_start_methods():
+         #forked workers inherit the workspace when requested by the caller
+         self.assertEqual(ws.toXML(workers=2, mpContext=multiprocessing.get_context('fork')), text)
+      #workspace copied to worker processes which are not forked
+      _writeXMLWorkerInit(None, _pickleWriterWorkspace(ws))
+      lines, unhandledWriter = _writeXMLWorker('Unhandled', None, None)
+      self.assertEqual(lines, ws.packageWriter.toXML(ws.find('/Unhandled'), None, None, 2))
+      self.assertEqual(unhandledWriter, [('/Unhandled', {'Element'})])
+
+   def test_save_xml_split(self):
+      ws = autosar.workspace()
+      ws.loadXML(_expected_path('datatype', 'ar4_adt_with_data_constraint_and_compu_method.arxml'))
+      ws.loadXML(_expected_path('portinterface', 'ar4_sender_receiver_interface_single_element.arxml'))
+      compuMethod = ws.find('/DataTypes/CompuMethods').elements[0]
+      file_map = {'all.arxml': None,
+                  'datatypes.arxml': '/DataTypes',
+                  'compu_methods.arxml': ['/DataTypes/CompuMethods', '/PortInterfaces'],
+                  'compu_method.arxml': [compuMethod.ref],
+                  'empty.arxml': ['/Unknown']}
+      file_map = {os.path.join(self.tmp_dir, name): filters for (name, filters) in file_map.items()}
+      ws.saveXMLSplit(file_map)
+      for (path, filters) in file_map.items():
+         ws.saveXML(path+'.expected', filters)
+         with open(path, encoding='utf-8') as fp1, open(path+'.expected', encoding='utf-8') as fp2:
+            self.assertEqual(fp1.read(), fp2.read())
+
+   def test_save_xml_ignore(self):
+      ws = _load(_expected_path('datatype', 'ar4_adt_with_data_constraint_and_compu_method.arxml'))
+      text = ws.toXML(ignore=['/DataTypes/Pitch_ADT'])
+      self.assertNotIn('<SHORT-NAME>Pitch_ADT</SHORT-NAME>', text)
+      self.assertIn('<SHORT-NAME>Pitch_T</SHORT-NAME>', text)
+      self.assertEqual(ws.toXML(ignore='/DataTypes/Pitch_ADT'), text)
+      path = os.path.join(self.tmp_dir, 'datatypes.arxml')
+      ws.saveXML(path, ignore='/DataTypes/Pitch_ADT')
+      path2 = os.path.join(self.tmp_dir, 'datatypes2.arxml')
+      ws.saveXMLSplit({path2: None}, ignore='/DataTypes/Pitch_ADT')
+      for name in [path, path2]:
+         with open(name, encoding='utf-8') as fp:
+            self.assertEqual(fp.read(), text)
+
+class TestWorkspaceReload(WorkspaceTestCase):
+
+   def test_reload_changed_file(self):
+      src_path = _expected_path('datatype', 'ar4_adt_with_data_constraint_and_compu_method.arxml')
+      other_path = _expected_path('portinterface', 'ar4_sender_receiver_interface_single_element.arxml')
+      path = os.path.join(self.tmp_dir, 'datatypes.arxml')
+      shutil.copy(src_path, path)
+      ws = _load(path)
+      ws.loadXML(other_path)
+      self.assertIn('/DataTypes/Units/deg', ws.fileMap[os.path.abspath(path)]['elements'])
+      dataType = ws.find('/DataTypes/Pitch_ADT')
+      compuMethod = ws.find('/DataTypes/CompuMethods/Pitch_T')
+      portInterface = ws.find('/PortInterfaces/HeaterPwrStat_I')
+      with open(src_path) as fp:
+         text = fp.read()
+      text = text.replace('<V>-90</V>', '<V>-80</V>')
+      text = text.replace('<SHORT-NAME>Units</SHORT-NAME>', '<SHORT-NAME>Units2</SHORT-NAME>')
+      text = text.replace('<SHORT-NAME>deg</SHORT-NAME>', '<SHORT-NAME>rad</SHORT-NAME>')
+      with open(path, 'w') as fp:
+         fp.write(text)
+      result = ws.reloadXML(path)
+      self.assertEqual(result, {'added': ['/DataTypes/Units2/rad'],
+                                'changed': ['/DataTypes/CompuMethods/Pitch_T'],
+                                'removed': ['/DataTypes/Units/deg']})
+      self.assertIs(ws.find('/DataTypes/Pitch_ADT'), dataType)
+      self.assertIs(ws.find('/PortInterfaces/HeaterPwrStat_I'), portInterface)
+      newCompuMethod = ws.find('/DataTypes/CompuMethods/Pitch_T')
+      self.assertIsNot(newCompuMethod, compuMethod)
+      self.assertIs(newCompuMethod.rootWS(), ws)
+      self.assertEqual(newCompuMethod.intToPhys.elements[0].offset, -80)
+      self.assertIsNone(ws.find('/DataTypes/Units'))
+      self.assertIsNotNone(ws.find('/DataTypes/Units2/rad'))
+      self.assertEqual(ws.reloadXML(path), {'added': [], 'changed': [], 'removed': []})
+
+   def test_reload_keeps_file_order(self):
+      src_path = _expected_path('portinterface', 'ar4_sender_receiver_interface_multiple_elements_explicit.arxml')
+      other_path = _expected_path('datatype', 'ar4_u8_adt.arxml')
+      path = os.path.join(self.tmp_dir, 'portinterfaces.arxml')
+      shutil.copy(src_path, path)
+      ws = _load([path, other_path], workers=1)
+      self.assertEqual([elem.name for elem in ws.find('/DataTypes').elements][-4:], ['Seconds_T', 'Minutes_T', 'Hours_T', 'UINT8_ADT'])
+      with open(src_path) as fp:
+         text = fp.read()
+      #renamed element is added at its position in the file, before the elements of other_path
+      text = text.replace('Minutes_T', 'Minutes2_T')
+      #elements swapped in the file
+      text = text.replace('<SHORT-NAME>Seconds_T<', '<SHORT-NAME>@<').replace('<SHORT-NAME>Hours_T<', '<SHORT-NAME>Seconds_T<').replace('<SHORT-NAME>@<', '<SHORT-NAME>Hours_T<')
+      with open(path, 'w') as fp:
+         fp.write(text)
+      result = ws.reloadXML(path)
+      self.assertIn('/DataTypes/Minutes2_T', result['added'])
+      self.assertEqual(ws.toXML(), _load([path, other_path], workers=1).toXML())
+      self.assertEqual([elem.name for elem in ws.find('/DataTypes').elements][-4:], ['Hours_T', 'Minutes2_T', 'Seconds_T', 'UINT8_ADT'])
+
+if __name__ == '__main__':
+   unittest.main()